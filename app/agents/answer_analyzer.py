@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from app.agents.base_agent import BaseInterviewAgent
+from app.agents.base_agent import BaseInterviewAgent, enum_value
 from app.agents.prompts import ANSWER_ANALYZER_PROMPT
 from app.models.interview_schemas import (
     AnswerEvaluation,
@@ -47,9 +47,9 @@ class AnswerAnalyzerAgent(BaseInterviewAgent):
             question=question,
             answer=answer,
             role=config.target_role,
-            experience_level=config.experience_level.value if hasattr(config.experience_level, 'value') else config.experience_level,
+            experience_level=enum_value(config.experience_level),
             difficulty=difficulty,
-            current_state=current_state.value if hasattr(current_state, 'value') else current_state,
+            current_state=enum_value(current_state),
         )
         
         parsed = self.parse_json_response(response)
@@ -78,9 +78,9 @@ class AnswerAnalyzerAgent(BaseInterviewAgent):
             question=question,
             answer=answer,
             role=config.target_role,
-            experience_level=config.experience_level.value if hasattr(config.experience_level, 'value') else config.experience_level,
+            experience_level=enum_value(config.experience_level),
             difficulty=difficulty,
-            current_state=current_state.value if hasattr(current_state, 'value') else current_state,
+            current_state=enum_value(current_state),
         )
         
         parsed = self.parse_json_response(response)
@@ -1,24 +1,63 @@
 """Base agent class for interview agents."""
 from __future__ import annotations
 
-import json
 import logging
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from enum import Enum
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional, Type, Union
 
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.utils.json import parse_partial_json
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel
 
 from app.config import settings
 from app.providers import get_langchain_llm, ProviderType
 
 logger = logging.getLogger(__name__)
 
+# Re-parse a streamed buffer every N chunks rather than on every token
+STREAM_PARSE_INTERVAL = 16
+
+
+def enum_value(value: Any) -> Any:
+    """Return the raw value of an Enum member, or the value unchanged."""
+    return value.value if isinstance(value, Enum) else value
+
+
+@lru_cache(maxsize=None)
+def _template_fields(template: str) -> frozenset[str]:
+    """Placeholder names in a prompt template, scanned once per template."""
+    return frozenset(re.findall(r'\{(\w+)\}', template))
+
+
+def parse_partial_fields(buffer: str, model: Type[BaseModel]) -> Optional[Dict[str, Any]]:
+    """Parse the top-level `model` fields available so far in a partially streamed JSON response."""
+    text = buffer.lstrip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+    try:
+        parsed = parse_partial_json(text)
+    except ValueError:
+        return None
+    if not isinstance(parsed, dict):
+        return None
+    return {key: value for key, value in parsed.items() if key in model.model_fields}
+
 
 class BaseInterviewAgent(ABC):
     """Base class for all interview agents."""
     
+    # Subclasses only stay dict-free if they declare their own __slots__
+    __slots__ = ("llm", "_structured_llm")
+    
+    # Set by agents that request schema-constrained output via invoke_structured()
+    output_schema: Optional[Type[BaseModel]] = None
+    
     def __init__(
         self,
         model: Optional[str] = None,
@@ -43,6 +82,7 @@ class BaseInterviewAgent(ABC):
                 model=model,
                 temperature=temperature,
             )
+        self._structured_llm: Optional[Runnable] = None
     
     @abstractmethod
     def get_prompt_template(self) -> str:
@@ -53,9 +93,8 @@ class BaseInterviewAgent(ABC):
         """Format the prompt template with provided values."""
         template = self.get_prompt_template()
         # Handle missing keys gracefully
-        for key in re.findall(r'\{(\w+)\}', template):
-            if key not in kwargs:
-                kwargs[key] = "N/A"
+        for key in _template_fields(template) - kwargs.keys():
+            kwargs[key] = "N/A"
         return template.format(**kwargs)
     
     async def invoke(self, **kwargs: Any) -> str:
@@ -70,6 +109,34 @@ class BaseInterviewAgent(ABC):
             logger.error(f"Error invoking {self.__class__.__name__}: {e}")
             raise
     
+    async def stream(self, **kwargs: Any) -> AsyncIterator[str]:
+        """Invoke the agent and yield the response text as it is generated."""
+        prompt = self.format_prompt(**kwargs)
+        messages = [HumanMessage(content=prompt)]
+        
+        try:
+            async for chunk in self.llm.astream(messages):
+                yield chunk.content
+        except Exception as e:
+            logger.error(f"Error invoking {self.__class__.__name__}: {e}")
+            raise
+    
+    async def stream_structured(self, **kwargs: Any) -> AsyncIterator[Dict[str, Any]]:
+        """Stream schema-constrained output, yielding it as a dict each time it grows.
+        
+        How often partial objects arrive depends on the provider's structured
+        output mode; some only emit the finished object.
+        """
+        prompt = self.format_prompt(**kwargs)
+        messages = [HumanMessage(content=prompt)]
+        
+        try:
+            async for chunk in self.get_structured_llm().astream(messages):
+                yield chunk.model_dump() if isinstance(chunk, BaseModel) else chunk
+        except Exception as e:
+            logger.error(f"Error invoking {self.__class__.__name__}: {e}")
+            raise
+    
     def invoke_sync(self, **kwargs: Any) -> str:
         """Synchronous invoke for the agent."""
         prompt = self.format_prompt(**kwargs)
@@ -82,6 +149,42 @@ class BaseInterviewAgent(ABC):
             logger.error(f"Error invoking {self.__class__.__name__}: {e}")
             raise
     
+    def get_structured_llm(self) -> Runnable:
+        """Return the LLM bound to `output_schema`, built on first use.
+        
+        The schema travels as request parameters (JSON schema / tool call)
+        instead of being pasted into the prompt text.
+        """
+        if self.output_schema is None:
+            raise ValueError(f"{self.__class__.__name__} does not define an output_schema")
+        if self._structured_llm is None:
+            self._structured_llm = self.llm.with_structured_output(self.output_schema)
+        return self._structured_llm
+    
+    async def invoke_structured(self, **kwargs: Any) -> Dict[str, Any]:
+        """Invoke the agent with schema-constrained output and return it as a dict."""
+        prompt = self.format_prompt(**kwargs)
+        messages = [HumanMessage(content=prompt)]
+        
+        try:
+            result = await self.get_structured_llm().ainvoke(messages)
+            return result.model_dump()
+        except Exception as e:
+            logger.error(f"Error invoking {self.__class__.__name__}: {e}")
+            raise
+    
+    def invoke_structured_sync(self, **kwargs: Any) -> Dict[str, Any]:
+        """Synchronous version of invoke_structured."""
+        prompt = self.format_prompt(**kwargs)
+        messages = [HumanMessage(content=prompt)]
+        
+        try:
+            result = self.get_structured_llm().invoke(messages)
+            return result.model_dump()
+        except Exception as e:
+            logger.error(f"Error invoking {self.__class__.__name__}: {e}")
+            raise
+    
     def parse_json_response(self, response: str) -> Dict[str, Any]:
         """Parse JSON from the LLM response."""
         try:
@@ -89,11 +192,11 @@ class BaseInterviewAgent(ABC):
             # Sometimes LLM wraps JSON in markdown code blocks
             json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response)
             if json_match:
-                return json.loads(json_match.group(1))
+                return orjson.loads(json_match.group(1))
             
             # Try direct JSON parsing
-            return json.loads(response)
-        except json.JSONDecodeError as e:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {response[:200]}... Error: {e}")
             # Return a default structure based on the agent type
             return self.get_default_response()
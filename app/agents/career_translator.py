@@ -4,9 +4,9 @@ from __future__ import annotations
 import json
 import logging
 import re
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Union
 
-from app.agents.base_agent import BaseInterviewAgent
+from app.agents.base_agent import STREAM_PARSE_INTERVAL, BaseInterviewAgent, parse_partial_fields
 from app.agents.career_prompts import CAREER_TRANSLATOR_PROMPT
 from app.models.career_schemas import (
     AdvancedChallenge,
@@ -296,6 +296,9 @@ class CareerTranslatorAgent(BaseInterviewAgent):
             
         Returns:
             CareerTranslation with structured industry insights
+            
+        Raises:
+            ValueError: If the LLM response is not valid JSON
         """
         lecture_text = lecture_input.lecture_text or "No additional content provided. Generate based on topic."
         target_track = lecture_input.target_track or "General Software Engineering"
@@ -309,8 +312,42 @@ class CareerTranslatorAgent(BaseInterviewAgent):
         parsed = self._parse_translation_response(response, lecture_input.lecture_topic)
         return self._build_career_translation(parsed)
     
+    async def translate_stream(
+        self, lecture_input: LectureInput
+    ) -> AsyncIterator[Union[Dict[str, Any], CareerTranslation]]:
+        """
+        Stream a translation while the LLM is still generating it.
+        
+        Yields dicts of the top-level fields parsed so far, then the
+        complete CareerTranslation as the last item. Raises ValueError if
+        the finished response is not valid JSON.
+        """
+        lecture_text = lecture_input.lecture_text or "No additional content provided. Generate based on topic."
+        target_track = lecture_input.target_track or "General Software Engineering"
+        
+        buffer = ""
+        last_fields = None
+        chunk_count = 0
+        async for text in self.stream(
+            lecture_topic=lecture_input.lecture_topic,
+            lecture_text=lecture_text,
+            target_track=target_track,
+        ):
+            buffer += text
+            chunk_count += 1
+            if chunk_count % STREAM_PARSE_INTERVAL:
+                continue
+            
+            fields = parse_partial_fields(buffer, CareerTranslation)
+            if fields and fields != last_fields:
+                last_fields = fields
+                yield fields
+        
+        parsed = self._parse_translation_response(buffer, lecture_input.lecture_topic)
+        yield self._build_career_translation(parsed)
+    
     def translate_sync(self, lecture_input: LectureInput) -> CareerTranslation:
-        """Synchronous version of translate."""
+        """Synchronous version of translate; raises ValueError on unparseable output."""
         lecture_text = lecture_input.lecture_text or "No additional content provided. Generate based on topic."
         target_track = lecture_input.target_track or "General Software Engineering"
         
@@ -323,8 +360,19 @@ class CareerTranslatorAgent(BaseInterviewAgent):
         parsed = self._parse_translation_response(response, lecture_input.lecture_topic)
         return self._build_career_translation(parsed)
     
+    def default_translation(self, topic: str) -> CareerTranslation:
+        """Build the placeholder translation used when generation fails."""
+        default = self.get_default_response()
+        default["lecture_topic"] = topic
+        return self._build_career_translation(default)
+    
     def _parse_translation_response(self, response: str, topic: str) -> Dict[str, Any]:
-        """Parse the LLM response into a dictionary."""
+        """
+        Parse the LLM response into a dictionary.
+        
+        Raises ValueError instead of substituting the placeholder, so callers
+        can serve default_translation() without caching it.
+        """
         try:
             # Try to extract JSON from the response
             # Sometimes LLM wraps JSON in markdown code blocks
@@ -344,9 +392,7 @@ class CareerTranslatorAgent(BaseInterviewAgent):
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse career translation response: {e}")
             logger.debug(f"Raw response: {response[:500]}...")
-            default = self.get_default_response()
-            default["lecture_topic"] = topic
-            return default
+            raise ValueError(f"Unparseable career translation response for {topic!r}: {e}") from e
     
     def _build_career_translation(self, parsed: Dict[str, Any]) -> CareerTranslation:
         """Build CareerTranslation model from parsed dictionary."""
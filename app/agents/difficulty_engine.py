@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from app.agents.base_agent import BaseInterviewAgent
+from app.agents.base_agent import BaseInterviewAgent, enum_value
 from app.agents.prompts import DIFFICULTY_ENGINE_PROMPT
 from app.models.interview_schemas import (
     AnswerEvaluation,
@@ -103,7 +103,7 @@ class DifficultyEngineAgent(BaseInterviewAgent):
             consistent_high=patterns["consistent_high"],
             declining=patterns["declining"],
             comm_issues=patterns["comm_issues"],
-            current_state=current_state.value if hasattr(current_state, 'value') else current_state,
+            current_state=enum_value(current_state),
         )
         
         parsed = self.parse_json_response(response)
@@ -146,7 +146,7 @@ class DifficultyEngineAgent(BaseInterviewAgent):
             consistent_high=patterns["consistent_high"],
             declining=patterns["declining"],
             comm_issues=patterns["comm_issues"],
-            current_state=current_state.value if hasattr(current_state, 'value') else current_state,
+            current_state=enum_value(current_state),
         )
         
         parsed = self.parse_json_response(response)
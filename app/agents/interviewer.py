@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from app.agents.base_agent import BaseInterviewAgent
+from app.agents.base_agent import BaseInterviewAgent, enum_value
 from app.agents.prompts import INTERVIEWER_PROMPT
 from app.models.interview_schemas import InterviewConfig, InterviewState, InterviewMemory
 
@@ -40,11 +40,11 @@ class InterviewerAgent(BaseInterviewAgent):
         
         response = await self.invoke(
             role=config.target_role,
-            experience_level=config.experience_level.value if hasattr(config.experience_level, 'value') else config.experience_level,
-            company_type=config.company_type.value if hasattr(config.company_type, 'value') else config.company_type,
-            interview_type=config.interview_type.value if hasattr(config.interview_type, 'value') else config.interview_type,
+            experience_level=enum_value(config.experience_level),
+            company_type=enum_value(config.company_type),
+            interview_type=enum_value(config.interview_type),
             difficulty=difficulty,
-            current_state=current_state.value if hasattr(current_state, 'value') else current_state,
+            current_state=enum_value(current_state),
             questions_asked=questions_asked,
             tech_stack=tech_stack,
             focus_area=config.focus_area,
@@ -83,11 +83,11 @@ class InterviewerAgent(BaseInterviewAgent):
         
         response = self.invoke_sync(
             role=config.target_role,
-            experience_level=config.experience_level.value if hasattr(config.experience_level, 'value') else config.experience_level,
-            company_type=config.company_type.value if hasattr(config.company_type, 'value') else config.company_type,
-            interview_type=config.interview_type.value if hasattr(config.interview_type, 'value') else config.interview_type,
+            experience_level=enum_value(config.experience_level),
+            company_type=enum_value(config.company_type),
+            interview_type=enum_value(config.interview_type),
             difficulty=difficulty,
-            current_state=current_state.value if hasattr(current_state, 'value') else current_state,
+            current_state=enum_value(current_state),
             questions_asked=questions_asked,
             tech_stack=tech_stack,
             focus_area=config.focus_area,
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Union
 
 from app.agents.base_agent import BaseInterviewAgent
 from app.agents.recap_prompts import RECAP_AGENT_PROMPT
@@ -37,6 +37,8 @@ class RecapAgent(BaseInterviewAgent):
     - Quick reference materials (formulas, flashcards, cheat sheets)
     """
     
+    output_schema = RecapResponse
+    
     def __init__(self, **kwargs):
         super().__init__(temperature=0.6, **kwargs)
     
@@ -81,31 +83,47 @@ class RecapAgent(BaseInterviewAgent):
             RecapResponse with summary and learning tracks
         """
         try:
-            response = await self.invoke(
+            parsed = await self.invoke_structured(
                 topic=recap_input.topic,
                 lecture_content=recap_input.lecture_content or "Not provided",
                 student_level=recap_input.student_level,
                 focus_area=recap_input.focus_area or "General understanding"
             )
-            
-            parsed = self.parse_json_response(response)
             return self._build_recap_response(parsed, recap_input.topic)
             
         except Exception as e:
             logger.error(f"Error generating recap: {e}")
             raise
     
+    async def generate_recap_stream(
+        self, recap_input: RecapInput
+    ) -> AsyncIterator[Union[Dict[str, Any], RecapResponse]]:
+        """
+        Stream a recap as the structured output is generated.
+        
+        Yields the partial recap dicts emitted by the provider, then the
+        complete RecapResponse as the last item.
+        """
+        parsed: Dict[str, Any] = {}
+        async for partial in self.stream_structured(
+            topic=recap_input.topic,
+            lecture_content=recap_input.lecture_content or "Not provided",
+            student_level=recap_input.student_level,
+            focus_area=recap_input.focus_area or "General understanding"
+        ):
+            parsed = partial
+            yield partial
+        yield self._build_recap_response(parsed, recap_input.topic)
+    
     def generate_recap_sync(self, recap_input: RecapInput) -> RecapResponse:
         """Synchronous version of generate_recap."""
         try:
-            response = self.invoke_sync(
+            parsed = self.invoke_structured_sync(
                 topic=recap_input.topic,
                 lecture_content=recap_input.lecture_content or "Not provided",
                 student_level=recap_input.student_level,
                 focus_area=recap_input.focus_area or "General understanding"
             )
-            
-            parsed = self.parse_json_response(response)
             return self._build_recap_response(parsed, recap_input.topic)
             
         except Exception as e:
@@ -227,3 +245,15 @@ class RecapAgent(BaseInterviewAgent):
             estimated_study_time=data.get("estimated_study_time", "2-3 hours"),
             next_topics=data.get("next_topics", [])
         )
+
+
+# Singleton instance for reuse
+_recap_agent_instance: RecapAgent | None = None
+
+
+def get_recap_agent() -> RecapAgent:
+    """Get or create the RecapAgent singleton."""
+    global _recap_agent_instance
+    if _recap_agent_instance is None:
+        _recap_agent_instance = RecapAgent()
+    return _recap_agent_instance
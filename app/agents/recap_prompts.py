@@ -72,86 +72,7 @@ Recommend 4-6 resources:
 - 3-5 next topics to explore
 
 ## OUTPUT FORMAT:
-Return a valid JSON object with this exact structure:
-{{
-    "summary": {{
-        "title": "Topic Title",
-        "one_liner": "One sentence summary",
-        "overview": "2-3 paragraph comprehensive overview",
-        "key_concepts": [
-            {{
-                "name": "Concept Name",
-                "definition": "Clear definition",
-                "importance": "Why it matters",
-                "example": "Simple example"
-            }}
-        ],
-        "key_takeaways": ["Takeaway 1", "Takeaway 2"],
-        "common_misconceptions": ["Misconception 1"],
-        "prerequisites": ["Prerequisite 1"]
-    }},
-    "study_tips": [
-        {{
-            "tip": "Study tip text",
-            "category": "understanding",
-            "icon": "💡"
-        }}
-    ],
-    "learning_tracks": [
-        {{
-            "track_name": "Quick Review Track",
-            "description": "For those who need a refresher",
-            "duration": "30-60 minutes",
-            "difficulty": "beginner",
-            "steps": ["Step 1", "Step 2"],
-            "icon": "🚀"
-        }}
-    ],
-    "practice_exercises": [
-        {{
-            "title": "Exercise Title",
-            "description": "What to do",
-            "difficulty": "medium",
-            "estimated_time": "15 minutes",
-            "skills_practiced": ["skill1", "skill2"]
-        }}
-    ],
-    "milestones": [
-        {{
-            "milestone": "Can explain X concept",
-            "check_yourself": "Try explaining to someone",
-            "icon": "✅"
-        }}
-    ],
-    "resources": [
-        {{
-            "type": "video",
-            "title": "Resource Title",
-            "description": "What you'll learn",
-            "difficulty": "beginner",
-            "icon": "📹"
-        }}
-    ],
-    "quick_reference": {{
-        "formulas": [
-            {{
-                "name": "Formula name",
-                "formula": "The formula",
-                "when_to_use": "When to apply"
-            }}
-        ],
-        "flashcards": [
-            {{
-                "front": "Question",
-                "back": "Answer"
-            }}
-        ],
-        "cheat_sheet": ["Quick fact 1", "Quick fact 2"]
-    }},
-    "difficulty_level": "intermediate",
-    "estimated_study_time": "2-3 hours",
-    "next_topics": ["Next Topic 1", "Next Topic 2"]
-}}
+Respond with the structured recap schema provided with this request.
 
 ## IMPORTANT GUIDELINES:
 1. Make summaries clear and memorable
@@ -161,5 +82,5 @@ Return a valid JSON object with this exact structure:
 5. Resources should be realistic and commonly available
 6. Flashcards should test key concepts
 7. Adapt content to the student level provided
-8. Return ONLY valid JSON, no additional text
+8. Fill every section of the schema; use empty lists where a section does not apply
 """
@@ -1,11 +1,17 @@
 """Report Generator Agent - Creates comprehensive final assessment."""
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
-from app.agents.base_agent import BaseInterviewAgent
+import orjson
+
+from app.agents.base_agent import (
+    STREAM_PARSE_INTERVAL,
+    BaseInterviewAgent,
+    enum_value,
+    parse_partial_fields,
+)
 from app.agents.prompts import REPORT_GENERATOR_PROMPT
 from app.models.interview_schemas import (
     AnswerEvaluation,
@@ -15,10 +21,22 @@ from app.models.interview_schemas import (
     QuestionAnswer,
 )
 
+# Bound once at import instead of re-parsing f-strings per answer
+_format_entry = "--- Question {} ({}) ---\nQ: {}\nA: {}\n".format
+_format_evaluation = (
+    "Scores: Technical={}, Reasoning={}, Communication={}, Structure={}, Confidence={}\n"
+    "Average: {:.2f}\n"
+    "{}"
+    "Feedback: {}"
+).format
+_format_issues = "Issues: {}\n".format
+
 
 class ReportGeneratorAgent(BaseInterviewAgent):
     """Agent responsible for generating final interview reports."""
     
+    __slots__ = ()
+    
     def __init__(self, **kwargs):
         super().__init__(temperature=0.5, **kwargs)
     
@@ -49,26 +67,26 @@ class ReportGeneratorAgent(BaseInterviewAgent):
         
         formatted = []
         for i, qa in enumerate(answers, 1):
-            entry = f"--- Question {i} ({qa.state}) ---\n"
-            entry += f"Q: {qa.question}\n"
-            entry += f"A: {qa.answer}\n"
-            if qa.evaluation:
-                entry += f"Scores: Technical={qa.evaluation.technical_score}, "
-                entry += f"Reasoning={qa.evaluation.reasoning_depth}, "
-                entry += f"Communication={qa.evaluation.communication_clarity}, "
-                entry += f"Structure={qa.evaluation.structure_score}, "
-                entry += f"Confidence={qa.evaluation.confidence_signals}\n"
-                entry += f"Average: {qa.evaluation.average_score:.2f}\n"
-                if qa.evaluation.issues_detected:
-                    entry += f"Issues: {', '.join(qa.evaluation.issues_detected)}\n"
-                entry += f"Feedback: {qa.evaluation.feedback}"
+            entry = _format_entry(i, qa.state, qa.question, qa.answer)
+            evaluation = qa.evaluation
+            if evaluation:
+                entry += _format_evaluation(
+                    evaluation.technical_score,
+                    evaluation.reasoning_depth,
+                    evaluation.communication_clarity,
+                    evaluation.structure_score,
+                    evaluation.confidence_signals,
+                    evaluation.average_score,
+                    _format_issues(", ".join(evaluation.issues_detected)) if evaluation.issues_detected else "",
+                    evaluation.feedback,
+                )
             formatted.append(entry)
         
         return "\n\n".join(formatted)
     
     def _format_memory_analysis(self, memory: InterviewMemory) -> str:
         """Format memory analysis for the prompt."""
-        return json.dumps({
+        return orjson.dumps({
             "weak_areas": memory.weak_areas,
             "strong_areas": memory.strong_areas,
             "performance_trend": memory.performance_trend,
@@ -81,7 +99,7 @@ class ReportGeneratorAgent(BaseInterviewAgent):
                 "hesitant_count": memory.communication_patterns.hesitant,
             },
             "total_questions": len(memory.asked_questions),
-        }, indent=2)
+        }, option=orjson.OPT_INDENT_2).decode()
     
     async def generate(
         self,
@@ -91,37 +109,40 @@ class ReportGeneratorAgent(BaseInterviewAgent):
         memory: InterviewMemory,
     ) -> FinalReport:
         """Generate comprehensive final report."""
-        # Calculate communication profile summary
-        comm_profile = self._generate_communication_summary(memory)
+        report = None
+        async for report in self.generate_stream(session_id, config, answers, memory):
+            pass
+        return report
+    
+    async def generate_stream(
+        self,
+        session_id: UUID,
+        config: InterviewConfig,
+        answers: List[QuestionAnswer],
+        memory: InterviewMemory,
+    ) -> AsyncIterator[FinalReport]:
+        """Stream the final report while the LLM is still generating it.
         
-        response = await self.invoke(
-            role=config.target_role,
-            experience_level=config.experience_level.value if hasattr(config.experience_level, 'value') else config.experience_level,
-            questions_count=len(answers),
-            average_score=f"{memory.average_score:.2f}",
-            communication_profile=comm_profile,
-            all_evaluations=self._format_all_evaluations(answers),
-            memory_analysis=self._format_memory_analysis(memory),
-        )
+        Yields unvalidated partial reports holding the fields parsed so far,
+        then the complete, validated report as the last item.
+        """
+        kwargs, memory_str = self._build_invoke_kwargs(config, answers, memory)
         
-        parsed = self.parse_json_response(response)
+        buffer = ""
+        last_fields: Optional[Dict[str, Any]] = None
+        chunk_count = 0
+        async for text in self.stream(**kwargs):
+            buffer += text
+            chunk_count += 1
+            if chunk_count % STREAM_PARSE_INTERVAL:
+                continue
+            
+            fields = parse_partial_fields(buffer, FinalReport)
+            if fields and fields != last_fields:
+                last_fields = fields
+                yield FinalReport.model_construct(session_id=session_id, **fields)
         
-        return FinalReport(
-            session_id=session_id,
-            technical_level_estimate=parsed.get("technical_level_estimate", "Mid"),
-            communication_profile=parsed.get("communication_profile", ""),
-            behavioral_maturity=parsed.get("behavioral_maturity", ""),
-            hiring_risks=parsed.get("hiring_risks", []),
-            improvement_plan=parsed.get("improvement_plan", ""),
-            overall_score=self._clamp_score(parsed.get("overall_score", 3.0)),
-            strengths=parsed.get("strengths", []),
-            weaknesses=parsed.get("weaknesses", []),
-            recommendations=parsed.get("recommendations", ""),
-            detailed_breakdown={
-                "answers_count": len(answers),
-                "memory": self._format_memory_analysis(memory),
-            },
-        )
+        yield self._finalize(session_id, self.parse_json_response(buffer), len(answers), memory_str)
     
     def generate_sync(
         self,
@@ -131,21 +152,37 @@ class ReportGeneratorAgent(BaseInterviewAgent):
         memory: InterviewMemory,
     ) -> FinalReport:
         """Synchronous version of generate."""
-        # Calculate communication profile summary
-        comm_profile = self._generate_communication_summary(memory)
-        
-        response = self.invoke_sync(
-            role=config.target_role,
-            experience_level=config.experience_level.value if hasattr(config.experience_level, 'value') else config.experience_level,
-            questions_count=len(answers),
-            average_score=f"{memory.average_score:.2f}",
-            communication_profile=comm_profile,
-            all_evaluations=self._format_all_evaluations(answers),
-            memory_analysis=self._format_memory_analysis(memory),
-        )
-        
-        parsed = self.parse_json_response(response)
-        
+        kwargs, memory_str = self._build_invoke_kwargs(config, answers, memory)
+        response = self.invoke_sync(**kwargs)
+        return self._finalize(session_id, self.parse_json_response(response), len(answers), memory_str)
+    
+    def _build_invoke_kwargs(
+        self,
+        config: InterviewConfig,
+        answers: List[QuestionAnswer],
+        memory: InterviewMemory,
+    ) -> tuple[Dict[str, Any], str]:
+        """Build the prompt values, returning the memory analysis for reuse."""
+        memory_str = self._format_memory_analysis(memory)
+        kwargs = {
+            "role": config.target_role,
+            "experience_level": enum_value(config.experience_level),
+            "questions_count": len(answers),
+            "average_score": f"{memory.average_score:.2f}",
+            "communication_profile": self._generate_communication_summary(memory),
+            "all_evaluations": self._format_all_evaluations(answers),
+            "memory_analysis": memory_str,
+        }
+        return kwargs, memory_str
+    
+    def _finalize(
+        self,
+        session_id: UUID,
+        parsed: Dict[str, Any],
+        answers_count: int,
+        memory_str: str,
+    ) -> FinalReport:
+        """Build the validated FinalReport from the parsed LLM output."""
         return FinalReport(
             session_id=session_id,
             technical_level_estimate=parsed.get("technical_level_estimate", "Mid"),
@@ -158,33 +195,27 @@ class ReportGeneratorAgent(BaseInterviewAgent):
             weaknesses=parsed.get("weaknesses", []),
             recommendations=parsed.get("recommendations", ""),
             detailed_breakdown={
-                "answers_count": len(answers),
-                "memory": self._format_memory_analysis(memory),
+                "answers_count": answers_count,
+                "memory": memory_str,
             },
         )
     
     def _generate_communication_summary(self, memory: InterviewMemory) -> str:
         """Generate a brief communication profile summary."""
         patterns = memory.communication_patterns
+        structured, rambling = patterns.structured, patterns.rambling
+        confident, hesitant = patterns.confident, patterns.hesitant
         
-        traits = []
-        if patterns.structured > patterns.rambling:
-            traits.append("structured")
-        elif patterns.rambling > patterns.structured:
-            traits.append("tends to ramble")
-        
-        if patterns.confident > patterns.hesitant:
-            traits.append("confident")
-        elif patterns.hesitant > patterns.confident:
-            traits.append("somewhat hesitant")
-        
-        if patterns.unclear > 0:
-            traits.append("occasionally unclear")
-        
-        if not traits:
-            traits.append("neutral communication style")
+        traits = [
+            trait for trait in (
+                "structured" if structured > rambling else "tends to ramble" if rambling > structured else None,
+                "confident" if confident > hesitant else "somewhat hesitant" if hesitant > confident else None,
+                "occasionally unclear" if patterns.unclear > 0 else None,
+            )
+            if trait
+        ]
         
-        return ", ".join(traits)
+        return ", ".join(traits) if traits else "neutral communication style"
     
     @staticmethod
     def _clamp_score(score: float) -> float:
@@ -3,17 +3,35 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from app.agents.base_agent import BaseInterviewAgent
+from app.agents.base_agent import BaseInterviewAgent, enum_value
 from app.agents.prompts import SESSION_MANAGER_PROMPT
 from app.models.interview_schemas import InterviewState, StateTransition
 from app.graph.interview_state import STATE_QUESTION_LIMITS, get_next_state
 
+# Below this average score, a state one question short of its limit is
+# considered ambiguous and the LLM decides whether to move on early.
+LLM_ESCALATION_SCORE = 2.5
+
+STATE_INSTRUCTIONS: Dict[InterviewState, str] = {
+    InterviewState.INTRO: "Start with a warm introduction. Ask the candidate to introduce themselves.",
+    InterviewState.WARMUP: "Ask easy, foundational questions to build confidence.",
+    InterviewState.CORE_QUESTIONS: "Ask main technical or behavioral questions based on the role and config.",
+    InterviewState.PRESSURE_ROUND: "Ask challenging scenario-based questions with constraints and trade-offs.",
+    InterviewState.COMMUNICATION_TEST: "Ask explanation-focused questions requiring clear articulation.",
+    InterviewState.CLOSING: "Give the candidate a chance to ask questions. Summarize the interview.",
+    InterviewState.FEEDBACK: "Generate the final report and conclude the interview.",
+}
+
 
 class SessionManagerAgent(BaseInterviewAgent):
     """Agent responsible for managing interview state transitions."""
     
+    __slots__ = ("transition_stats",)
+    
     def __init__(self, **kwargs):
         super().__init__(temperature=0.2, **kwargs)  # Low temperature for consistent logic
+        # How often each transition path was taken, to monitor the LLM skip rate
+        self.transition_stats: Dict[str, int] = {"simple": 0, "llm": 0}
     
     def get_prompt_template(self) -> str:
         return SESSION_MANAGER_PROMPT
@@ -34,10 +52,20 @@ class SessionManagerAgent(BaseInterviewAgent):
         total_questions: int,
         average_score: float,
         performance_trend: str,
+        force_llm: bool = False,
     ) -> StateTransition:
-        """Check if state transition is needed."""
+        """Check if state transition is needed.
+        
+        The question count decides most transitions; the LLM is only
+        consulted for ambiguous cases or when `force_llm` is set.
+        """
+        if not force_llm and not self._is_ambiguous(current_state, questions_in_state, average_score):
+            self.transition_stats["simple"] += 1
+            return self.check_transition_simple(current_state, questions_in_state)
+        
+        self.transition_stats["llm"] += 1
         response = await self.invoke(
-            current_state=current_state.value if hasattr(current_state, 'value') else current_state,
+            current_state=enum_value(current_state),
             questions_in_state=questions_in_state,
             total_questions=total_questions,
             average_score=f"{average_score:.2f}",
@@ -47,7 +75,7 @@ class SessionManagerAgent(BaseInterviewAgent):
         parsed = self.parse_json_response(response)
         
         # Parse next state
-        next_state_str = parsed.get("next_state", current_state.value if hasattr(current_state, 'value') else current_state)
+        next_state_str = parsed.get("next_state", enum_value(current_state))
         try:
             next_state = InterviewState(next_state_str)
         except ValueError:
@@ -67,10 +95,16 @@ class SessionManagerAgent(BaseInterviewAgent):
         total_questions: int,
         average_score: float,
         performance_trend: str,
+        force_llm: bool = False,
     ) -> StateTransition:
         """Synchronous version of check_transition."""
+        if not force_llm and not self._is_ambiguous(current_state, questions_in_state, average_score):
+            self.transition_stats["simple"] += 1
+            return self.check_transition_simple(current_state, questions_in_state)
+        
+        self.transition_stats["llm"] += 1
         response = self.invoke_sync(
-            current_state=current_state.value if hasattr(current_state, 'value') else current_state,
+            current_state=enum_value(current_state),
             questions_in_state=questions_in_state,
             total_questions=total_questions,
             average_score=f"{average_score:.2f}",
@@ -80,7 +114,7 @@ class SessionManagerAgent(BaseInterviewAgent):
         parsed = self.parse_json_response(response)
         
         # Parse next state
-        next_state_str = parsed.get("next_state", current_state.value if hasattr(current_state, 'value') else current_state)
+        next_state_str = parsed.get("next_state", enum_value(current_state))
         try:
             next_state = InterviewState(next_state_str)
         except ValueError:
@@ -93,6 +127,19 @@ class SessionManagerAgent(BaseInterviewAgent):
             state_instructions=parsed.get("state_instructions", ""),
         )
     
+    @staticmethod
+    def _is_ambiguous(
+        current_state: InterviewState | str,
+        questions_in_state: int,
+        average_score: float,
+    ) -> bool:
+        """Whether the question count alone cannot settle the transition."""
+        try:
+            required = STATE_QUESTION_LIMITS.get(InterviewState(current_state), 1)
+        except ValueError:
+            return False
+        return questions_in_state == required - 1 and average_score < LLM_ESCALATION_SCORE
+    
     def check_transition_simple(
         self,
         current_state: InterviewState,
@@ -118,7 +165,7 @@ class SessionManagerAgent(BaseInterviewAgent):
             # Generate state instructions
             state_instructions = self._get_state_instructions(next_state)
             
-            current_state_str = current_state.value if hasattr(current_state, 'value') else current_state
+            current_state_str = enum_value(current_state)
             return StateTransition(
                 should_transition=True,
                 next_state=next_state,
@@ -126,7 +173,7 @@ class SessionManagerAgent(BaseInterviewAgent):
                 state_instructions=state_instructions,
             )
         else:
-            current_state_str = current_state.value if hasattr(current_state, 'value') else current_state
+            current_state_str = enum_value(current_state)
             return StateTransition(
                 should_transition=False,
                 next_state=current_state,
@@ -144,13 +191,4 @@ class SessionManagerAgent(BaseInterviewAgent):
             except ValueError:
                 return "Continue with the interview flow."
         
-        instructions = {
-            InterviewState.INTRO: "Start with a warm introduction. Ask the candidate to introduce themselves.",
-            InterviewState.WARMUP: "Ask easy, foundational questions to build confidence.",
-            InterviewState.CORE_QUESTIONS: "Ask main technical or behavioral questions based on the role and config.",
-            InterviewState.PRESSURE_ROUND: "Ask challenging scenario-based questions with constraints and trade-offs.",
-            InterviewState.COMMUNICATION_TEST: "Ask explanation-focused questions requiring clear articulation.",
-            InterviewState.CLOSING: "Give the candidate a chance to ask questions. Summarize the interview.",
-            InterviewState.FEEDBACK: "Generate the final report and conclude the interview.",
-        }
-        return instructions.get(state, "Continue with the interview flow.")
+        return STATE_INSTRUCTIONS.get(state, "Continue with the interview flow.")
@@ -11,15 +11,22 @@ skill-matched opportunities.
 Now enhanced with real job/freelance search capabilities!
 """
 
-import json
+import asyncio
+import hashlib
 import re
-from typing import Optional, List, Dict, Any
+import warnings
+from typing import AsyncIterator, Callable, Optional, List, Dict, Any, Tuple, TypeVar
 from datetime import datetime
+from functools import lru_cache
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import ValidationError
 
+from app.config import settings
 from app.providers import get_langchain_llm
 from app.agents.work_prompts import (
     WORK_AGENT_SYSTEM_PROMPT,
+    WORK_RECOMMENDATION_INSTRUCTIONS,
     WORK_RECOMMENDATION_PROMPT,
     QUICK_JOB_CHECK_PROMPT,
     FREELANCE_FOCUS_PROMPT
@@ -46,57 +53,337 @@ from app.models.work_schemas import (
     JobSearchURL,
     FreelancePlatformURL
 )
+from app.services.cache import SingleFlight, TTLCache
 from app.services.work_search_client import (
-    WorkSearchClient,
-    JobBoardURLs,
-    FreelancePlatformURLs
+    get_platform_gigs,
+    get_work_search_client,
+    JobBoardURLs
 )
 
 
+# Static system prefix for recommendations; the per-student data goes in the user message
+_RECOMMENDATION_SYSTEM_PROMPT = WORK_AGENT_SYSTEM_PROMPT + "\n\n" + WORK_RECOMMENDATION_INSTRUCTIONS
+
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+
+_SKILL_LEVEL_BY_NAME = {level.value: level for level in SkillLevel}
+
+# Defaults applied to each section of the LLM's JSON before validation
+_READINESS_DEFAULTS = {
+    "readiness_level": "practice_first",
+    "readiness_summary": "",
+    "strengths_for_work": [],
+    "gaps_to_address": [],
+    "recommended_path": ""
+}
+_JOB_DEFAULTS = {
+    "job_title": "",
+    "job_type": "internship",
+    "why_it_fits": "",
+    "skills_they_have": [],
+    "missing_skills": [],
+    "difficulty": "medium",
+    "time_to_ready": "1-2 months",
+    "typical_tasks": [],
+    "icon": "💼"
+}
+_GIG_DEFAULTS = {
+    "gig_type": "",
+    "example_task": "",
+    "why_they_can_do_it": "",
+    "skills_required": [],
+    "platform_types": [],
+    "earning_potential": "$50-200",
+    "difficulty": "easy_entry",
+    "icon": "💻"
+}
+_STRATEGY_DEFAULTS = {
+    "start_freelance_now": False,
+    "freelance_reasoning": "",
+    "fast_income_path": "",
+    "long_term_career_path": "",
+    "recommended_first_step": ""
+}
+_SKILL_GAP_DEFAULTS = {
+    "skill_name": "",
+    "importance": "",
+    "how_to_learn": "",
+    "time_to_learn": ""
+}
+_PROJECT_DEFAULTS = {
+    "project_name": "Portfolio Project",
+    "description": "",
+    "skills_demonstrated": [],
+    "why_employers_care": "",
+    "estimated_time": "2-4 weeks"
+}
+
+# Static parts of the response used when the LLM output can't be parsed;
+# _fallback_response only fills in the profile-specific fields
+_FALLBACK_TEMPLATE = {
+    "work_readiness": {
+        "gaps_to_address": ["Build more projects", "Strengthen core skills"],
+        "recommended_path": "Start with small freelance projects to build portfolio"
+    },
+    "job_recommendations": [{
+        "job_type": "internship",
+        "why_it_fits": "Matches your field of interest and current level",
+        "missing_skills": ["Advanced skills", "Production experience"],
+        "difficulty": JobDifficulty.MEDIUM,
+        "time_to_ready": "1-2 months",
+        "typical_tasks": ["Learning", "Assisting senior developers", "Small tasks"]
+    }],
+    "freelance_opportunities": [{
+        "gig_type": "Small Projects",
+        "example_task": "Help with basic tasks in your skill area",
+        "why_they_can_do_it": "Matches your current skill set",
+        "platform_types": ["Freelance marketplaces", "Student job boards"],
+        "earning_potential": "$20-100/project",
+        "difficulty": JobDifficulty.EASY
+    }],
+    "income_strategy": {
+        "freelance_reasoning": "Small projects can help build portfolio while learning",
+        "fast_income_path": "Start with small, simple tasks in your skill area",
+        "recommended_first_step": "Complete one portfolio project this week"
+    },
+    "skill_gaps": [{
+        "skill_name": "Portfolio Projects",
+        "importance": "Employers need proof of skills",
+        "how_to_learn": "Build projects, document them, share on GitHub",
+        "time_to_learn": "2-4 weeks per project"
+    }],
+    "high_impact_project": {
+        "why_employers_care": "Demonstrates ability to complete real projects",
+        "estimated_time": "2-4 weeks"
+    },
+    "immediate_actions": [
+        "Identify one small project to start today",
+        "Set up GitHub profile if not done",
+        "Research entry-level positions in your field"
+    ]
+}
+
+# Live job listings change over hours, so identical searches share results briefly
+JOB_SEARCH_CACHE_TTL_SECONDS = 600
+_job_search_cache = TTLCache(maxsize=256, ttl_seconds=JOB_SEARCH_CACHE_TTL_SECONDS)
+_job_search_flight = SingleFlight()
+
+# Raw LLM completions keyed on the exact (system, user) prompt pair
+_completion_cache = TTLCache(
+    maxsize=settings.work_agent_cache_size,
+    ttl_seconds=settings.work_agent_cache_ttl_seconds,
+)
+_completion_flight = SingleFlight()
+
+
+# Parsed recommendations keyed on the canonicalized student profile
+_recommendation_cache = TTLCache(
+    maxsize=settings.work_agent_cache_size,
+    ttl_seconds=settings.work_agent_cache_ttl_seconds,
+)
+_recommendation_flight = SingleFlight()
+
+T = TypeVar("T")
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _prompt_key(system_prompt: str, user_prompt: str) -> str:
+    """Hash a prompt pair into a compact cache key."""
+    return _digest(system_prompt + "\x1f" + user_prompt)
+
+
+def _canonical_terms(values: List[str]) -> str:
+    """Order- and case-insensitive form of a list of free-text terms."""
+    return ",".join(sorted({v.strip().casefold() for v in values if v.strip()}))
+
+
+def _profile_key(input_data: WorkRecommendationInput) -> str:
+    """
+    Key for a student profile that ignores list ordering, case and whitespace,
+    so near-identical profiles share one recommendation.
+    """
+    profile = input_data.student_profile
+    learning = input_data.learning_state
+    return _digest("\x1f".join([
+        profile.career_goal.strip().casefold(),
+        profile.current_level.value,
+        profile.field_of_interest.strip().casefold(),
+        _canonical_terms(profile.skills),
+        _canonical_terms(profile.tools_known),
+        _canonical_terms(profile.projects_done),
+        str(profile.available_hours_per_week),
+        _canonical_terms(learning.current_topics_learning),
+        _canonical_terms(learning.strong_areas),
+        _canonical_terms(learning.weak_areas),
+    ]))
+
+
+@lru_cache(maxsize=None)
+def _shared_llm(provider_type: Optional[str]):
+    """One chat model per provider, shared by every agent instance."""
+    return get_langchain_llm(provider_type=provider_type)
+
+
+def _csv_or(default: str, items) -> str:
+    """Comma-join items, or return default when there are none."""
+    return ", ".join(items) if items else default
+
+
+@lru_cache(maxsize=512)
+def _format_recommendation_prompt(
+    career_goal: str,
+    current_level: str,
+    field_of_interest: str,
+    skills: Tuple[str, ...],
+    tools_known: Tuple[str, ...],
+    projects_done: Tuple[str, ...],
+    hours_per_week: float,
+    currently_learning: Tuple[str, ...],
+    strong_areas: Tuple[str, ...],
+    weak_areas: Tuple[str, ...]
+) -> str:
+    """Render WORK_RECOMMENDATION_PROMPT, memoized on the hashable profile fields."""
+    return WORK_RECOMMENDATION_PROMPT.format(
+        career_goal=career_goal,
+        current_level=current_level,
+        field_of_interest=field_of_interest,
+        skills=_csv_or("None specified", skills),
+        tools_known=_csv_or("None specified", tools_known),
+        projects_done=_csv_or("None", projects_done),
+        hours_per_week=hours_per_week,
+        currently_learning=_csv_or("None", currently_learning),
+        strong_areas=_csv_or("None specified", strong_areas),
+        weak_areas=_csv_or("None specified", weak_areas)
+    )
+
+
+@lru_cache(maxsize=2048)
+def _job_board_urls(keywords: Tuple[str, ...], location: str) -> Tuple[Dict[str, str], ...]:
+    """Job board search URLs for a keyword tuple (copy the dicts before handing out)."""
+    return tuple(JobBoardURLs.get_all_search_urls(list(keywords), location))
+
+
 class WorkRecommendationAgent:
     """AI Career Opportunity Agent for job and freelance recommendations."""
     
     def __init__(self, provider_type: str = None):
         """Initialize the work recommendation agent."""
-        self.llm = get_langchain_llm(provider_type=provider_type)
-        self.search_client = WorkSearchClient()
+        self.llm = _shared_llm(provider_type)
+        self.search_client = get_work_search_client()
+    
+    async def _complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        stop_after_json: bool = False,
+        parse: Callable[[str], T] = str.strip
+    ) -> T:
+        """
+        Return `parse` of the LLM completion for a prompt pair, served from cache on repeats.
+        
+        The response is streamed; with stop_after_json the stream is closed as
+        soon as a fenced JSON block is complete, skipping any trailing prose.
+        `parse` raises ValueError for output the caller can't use; such a
+        completion is not cached, so the next request asks the LLM again.
+        Each prompt pair belongs to one call site, so concurrent callers
+        sharing a completion also share the parsed result.
+        """
+        key = _prompt_key(system_prompt, user_prompt)
+        cached = _completion_cache.get(key)
+        if cached is not None:
+            return parse(cached)
+        
+        async def generate() -> str:
+            messages = [
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=user_prompt)
+            ]
+            parts = []
+            async for chunk in self.llm.astream(messages):
+                parts.append(chunk.content)
+                if stop_after_json and "`" in chunk.content and _JSON_BLOCK_RE.search("".join(parts)):
+                    break
+            content = "".join(parts)
+            result = parse(content)
+            _completion_cache.set(key, content)
+            return result
+        
+        # Identical prompts already in flight share one LLM call
+        return await _completion_flight.run(key, generate)
+    
+    async def _search_jobs(
+        self,
+        keywords: List[str],
+        location: str,
+        job_type: str,
+        limit: int
+    ) -> Dict[str, Any]:
+        """Live job search, cached briefly and coalesced across concurrent callers."""
+        # Providers match case-insensitively, so differently-cased repeats share an entry
+        key = (
+            tuple(sorted({k.casefold() for k in keywords})),
+            location.casefold(),
+            job_type.casefold(),
+            limit,
+        )
+        results = _job_search_cache.get(key)
+        if results is not None:
+            return results
+        
+        async def fetch() -> Dict[str, Any]:
+            fetched = await self.search_client.search_jobs(
+                keywords=keywords,
+                location=location,
+                job_type=job_type,
+                limit=limit
+            )
+            _job_search_cache.set(key, fetched)
+            return fetched
+        
+        return await _job_search_flight.run(key, fetch)
     
     async def get_recommendations(
         self, 
         input_data: WorkRecommendationInput,
-        include_live_search: bool = True
+        include_live_search: bool = False
     ) -> WorkRecommendationResponse:
         """
         Get job and freelance recommendations based on student profile.
         
         Args:
             input_data: Complete student profile and learning state
-            include_live_search: Whether to include live job/freelance URLs
+            include_live_search: Whether to attach job board/freelance search URLs
+                (opt-in; skip it when only the AI recommendations are needed)
             
         Returns:
             WorkRecommendationResponse with jobs, freelance, and strategy
         """
-        # Build the prompt
-        prompt = WORK_RECOMMENDATION_PROMPT.format(
-            career_goal=input_data.student_profile.career_goal,
-            current_level=input_data.student_profile.current_level.value,
-            field_of_interest=input_data.student_profile.field_of_interest,
-            skills=", ".join(input_data.student_profile.skills) or "None specified",
-            tools_known=", ".join(input_data.student_profile.tools_known) or "None specified",
-            projects_done=", ".join(input_data.student_profile.projects_done) or "None",
-            hours_per_week=input_data.student_profile.available_hours_per_week,
-            currently_learning=", ".join(input_data.learning_state.current_topics_learning) or "None",
-            strong_areas=", ".join(input_data.learning_state.strong_areas) or "None specified",
-            weak_areas=", ".join(input_data.learning_state.weak_areas) or "None specified"
-        )
-        
-        messages = [
-            SystemMessage(content=WORK_AGENT_SYSTEM_PROMPT),
-            HumanMessage(content=prompt)
-        ]
+        profile_key = _profile_key(input_data)
+        cached = _recommendation_cache.get(profile_key)
+        if cached is None:
+            async def generate() -> WorkRecommendationResponse:
+                prompt = self._build_prompt(input_data)
+                try:
+                    parsed = await self._complete(
+                        _RECOMMENDATION_SYSTEM_PROMPT,
+                        prompt,
+                        stop_after_json=True,
+                        parse=self._parse_response
+                    )
+                except ValueError as e:
+                    # Serve the fallback uncached so the next request asks the LLM again
+                    return self._fallback_response(input_data, str(e))
+                _recommendation_cache.set(profile_key, parsed)
+                return parsed
+            
+            # Equivalent profiles render different prompts, so coalesce on the profile key
+            cached = await _recommendation_flight.run(profile_key, generate)
         
-        response = await self.llm.ainvoke(messages)
-        result = self._parse_response(response.content, input_data)
+        # Callers mutate the result, so never hand out the cached instance
+        result = cached.model_copy(deep=True)
         
         # Add search URLs to recommendations
         if include_live_search:
@@ -108,27 +395,43 @@ class WorkRecommendationAgent:
         self, 
         input_data: WorkRecommendationInput
     ) -> WorkRecommendationResponse:
-        """Synchronous version of get_recommendations."""
-        prompt = WORK_RECOMMENDATION_PROMPT.format(
-            career_goal=input_data.student_profile.career_goal,
-            current_level=input_data.student_profile.current_level.value,
-            field_of_interest=input_data.student_profile.field_of_interest,
-            skills=", ".join(input_data.student_profile.skills) or "None specified",
-            tools_known=", ".join(input_data.student_profile.tools_known) or "None specified",
-            projects_done=", ".join(input_data.student_profile.projects_done) or "None",
-            hours_per_week=input_data.student_profile.available_hours_per_week,
-            currently_learning=", ".join(input_data.learning_state.current_topics_learning) or "None",
-            strong_areas=", ".join(input_data.learning_state.strong_areas) or "None specified",
-            weak_areas=", ".join(input_data.learning_state.weak_areas) or "None specified"
-        )
-        
-        messages = [
-            SystemMessage(content=WORK_AGENT_SYSTEM_PROMPT),
-            HumanMessage(content=prompt)
-        ]
+        """
+        Synchronous version of get_recommendations (without live search URLs).
         
-        response = self.llm.invoke(messages)
-        return self._parse_response(response.content, input_data)
+        Deprecated: each call starts a new event loop with asyncio.run, so it
+        is only usable outside a running loop. Await get_recommendations instead.
+        """
+        warnings.warn(
+            "get_recommendations_sync is deprecated; await get_recommendations instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.get_recommendations(input_data))
+        raise RuntimeError(
+            "get_recommendations_sync cannot be called from a running event loop; "
+            "await get_recommendations instead"
+        )
+    
+    @staticmethod
+    def _build_prompt(input_data: WorkRecommendationInput) -> str:
+        """Render the recommendation prompt for a student profile."""
+        profile = input_data.student_profile
+        learning = input_data.learning_state
+        return _format_recommendation_prompt(
+            profile.career_goal,
+            profile.current_level.value,
+            profile.field_of_interest,
+            tuple(profile.skills),
+            tuple(profile.tools_known),
+            tuple(profile.projects_done),
+            profile.available_hours_per_week,
+            tuple(learning.current_topics_learning),
+            tuple(learning.strong_areas),
+            tuple(learning.weak_areas)
+        )
     
     async def get_quick_jobs(
         self,
@@ -143,13 +446,10 @@ class WorkRecommendationAgent:
             current_level=current_level
         )
         
-        messages = [
-            SystemMessage(content="You are a career advisor. Be practical and realistic."),
-            HumanMessage(content=prompt)
-        ]
-        
-        response = await self.llm.ainvoke(messages)
-        return {"recommendations": response.content.strip()}
+        content = await self._complete(
+            "You are a career advisor. Be practical and realistic.", prompt
+        )
+        return {"recommendations": content}
     
     async def get_freelance_focus(
         self,
@@ -163,136 +463,59 @@ class WorkRecommendationAgent:
         prompt = FREELANCE_FOCUS_PROMPT.format(
             skills=", ".join(skills),
             tools_known=", ".join(tools_known),
-            projects_done=", ".join(projects_done) if projects_done else "None",
+            projects_done=_csv_or("None", projects_done),
             hours_per_week=hours_per_week,
             current_level=current_level
         )
         
-        messages = [
-            SystemMessage(content="You are a freelance career advisor. Be practical."),
-            HumanMessage(content=prompt)
-        ]
-        
-        response = await self.llm.ainvoke(messages)
-        return {"freelance_advice": response.content.strip()}
+        content = await self._complete(
+            "You are a freelance career advisor. Be practical.", prompt
+        )
+        return {"freelance_advice": content}
     
-    def _parse_response(
-        self, 
-        response_content: str, 
-        input_data: WorkRecommendationInput
-    ) -> WorkRecommendationResponse:
-        """Parse LLM response into WorkRecommendationResponse."""
-        try:
-            content = response_content.strip()
-            
-            # Extract JSON from markdown code blocks if present
-            json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', content)
+    def _parse_response(self, response_content: str) -> WorkRecommendationResponse:
+        """
+        Parse LLM response into WorkRecommendationResponse.
+        
+        Raises:
+            ValueError: If the response is not JSON that fits the schema
+        """
+        content = response_content.strip()
+        
+        # Extract JSON from markdown code blocks if present
+        if not content.startswith("{"):
+            json_match = _JSON_BLOCK_RE.search(content)
             if json_match:
                 content = json_match.group(1).strip()
+        
+        # Well-formed output parses and validates in a single pass
+        try:
+            return WorkRecommendationResponse.model_validate_json(content)
+        except ValidationError:
+            pass
+        
+        try:
+            data = orjson.loads(content)
             
-            data = json.loads(content)
-            
-            # Parse work readiness
-            readiness_data = data.get("work_readiness", {})
-            work_readiness = WorkReadinessAnalysis(
-                readiness_level=self._map_readiness(readiness_data.get("readiness_level", "practice_first")),
-                readiness_summary=readiness_data.get("readiness_summary", ""),
-                strengths_for_work=readiness_data.get("strengths_for_work", []),
-                gaps_to_address=readiness_data.get("gaps_to_address", []),
-                recommended_path=readiness_data.get("recommended_path", "")
-            )
-            
-            # Parse job recommendations
-            job_recommendations = []
-            for job in data.get("job_recommendations", []):
-                job_recommendations.append(JobRecommendation(
-                    job_title=job.get("job_title", ""),
-                    job_type=job.get("job_type", "internship"),
-                    why_it_fits=job.get("why_it_fits", ""),
-                    skills_they_have=job.get("skills_they_have", []),
-                    missing_skills=job.get("missing_skills", []),
-                    difficulty=self._map_difficulty(job.get("difficulty", "medium")),
-                    time_to_ready=job.get("time_to_ready", "1-2 months"),
-                    typical_tasks=job.get("typical_tasks", []),
-                    icon=job.get("icon", "💼")
-                ))
-            
-            # Parse freelance opportunities
-            freelance_opportunities = []
-            for gig in data.get("freelance_opportunities", []):
-                freelance_opportunities.append(FreelanceOpportunity(
-                    gig_type=gig.get("gig_type", ""),
-                    example_task=gig.get("example_task", ""),
-                    why_they_can_do_it=gig.get("why_they_can_do_it", ""),
-                    skills_required=gig.get("skills_required", []),
-                    platform_types=gig.get("platform_types", []),
-                    earning_potential=gig.get("earning_potential", "$50-200"),
-                    difficulty=self._map_difficulty(gig.get("difficulty", "easy_entry")),
-                    icon=gig.get("icon", "💻")
-                ))
-            
-            # Parse income strategy
-            strategy_data = data.get("income_strategy", {})
-            income_strategy = IncomeStrategy(
-                start_freelance_now=strategy_data.get("start_freelance_now", False),
-                freelance_reasoning=strategy_data.get("freelance_reasoning", ""),
-                fast_income_path=strategy_data.get("fast_income_path", ""),
-                long_term_career_path=strategy_data.get("long_term_career_path", ""),
-                recommended_first_step=strategy_data.get("recommended_first_step", "")
-            )
-            
-            # Parse skill gaps
-            skill_gaps = []
-            for gap in data.get("skill_gaps", []):
-                skill_gaps.append(SkillGap(
-                    skill_name=gap.get("skill_name", ""),
-                    importance=gap.get("importance", ""),
-                    how_to_learn=gap.get("how_to_learn", ""),
-                    time_to_learn=gap.get("time_to_learn", "")
-                ))
-            
-            # Parse high impact project
-            project_data = data.get("high_impact_project", {})
-            high_impact_project = HighImpactProject(
-                project_name=project_data.get("project_name", "Portfolio Project"),
-                description=project_data.get("description", ""),
-                skills_demonstrated=project_data.get("skills_demonstrated", []),
-                why_employers_care=project_data.get("why_employers_care", ""),
-                estimated_time=project_data.get("estimated_time", "2-4 weeks")
-            )
-            
-            return WorkRecommendationResponse(
-                work_readiness=work_readiness,
-                job_recommendations=job_recommendations,
-                freelance_opportunities=freelance_opportunities,
-                income_strategy=income_strategy,
-                skill_gaps=skill_gaps,
-                high_impact_project=high_impact_project,
-                immediate_actions=data.get("immediate_actions", [])
-            )
-            
-        except (json.JSONDecodeError, Exception) as e:
-            return self._fallback_response(input_data, str(e))
-    
-    def _map_readiness(self, level: str) -> WorkReadiness:
-        """Map string to WorkReadiness enum."""
-        mapping = {
-            "practice_first": WorkReadiness.PRACTICE_FIRST,
-            "freelance_ready": WorkReadiness.FREELANCE_READY,
-            "internship_ready": WorkReadiness.INTERNSHIP_READY,
-            "junior_ready": WorkReadiness.JUNIOR_READY
-        }
-        return mapping.get(level.lower(), WorkReadiness.PRACTICE_FIRST)
-    
-    def _map_difficulty(self, difficulty: str) -> JobDifficulty:
-        """Map string to JobDifficulty enum."""
-        mapping = {
-            "easy_entry": JobDifficulty.EASY,
-            "easy": JobDifficulty.EASY,
-            "medium": JobDifficulty.MEDIUM,
-            "hard": JobDifficulty.HARD
-        }
-        return mapping.get(difficulty.lower(), JobDifficulty.MEDIUM)
+            # Fill defaults for anything the model left out, then validate in one pass
+            return WorkRecommendationResponse.model_validate({
+                "work_readiness": {**_READINESS_DEFAULTS, **data.get("work_readiness", {})},
+                "job_recommendations": [
+                    {**_JOB_DEFAULTS, **job} for job in data.get("job_recommendations", [])
+                ],
+                "freelance_opportunities": [
+                    {**_GIG_DEFAULTS, **gig} for gig in data.get("freelance_opportunities", [])
+                ],
+                "income_strategy": {**_STRATEGY_DEFAULTS, **data.get("income_strategy", {})},
+                "skill_gaps": [
+                    {**_SKILL_GAP_DEFAULTS, **gap} for gap in data.get("skill_gaps", [])
+                ],
+                "high_impact_project": {**_PROJECT_DEFAULTS, **data.get("high_impact_project", {})},
+                "immediate_actions": data.get("immediate_actions", [])
+            })
+        except (AttributeError, TypeError) as e:
+            # JSON of the wrong shape, e.g. a list where a section object belongs
+            raise ValueError(f"Malformed recommendation response: {e}") from e
     
     def _fallback_response(
         self, 
@@ -301,88 +524,61 @@ class WorkRecommendationAgent:
     ) -> WorkRecommendationResponse:
         """Create fallback response when parsing fails."""
         profile = input_data.student_profile
+        field = profile.field_of_interest
+        top_skills = profile.skills[:3]
+        template = _FALLBACK_TEMPLATE
         
-        return WorkRecommendationResponse(
-            work_readiness=WorkReadinessAnalysis(
-                readiness_level=WorkReadiness.FREELANCE_READY if profile.projects_done else WorkReadiness.PRACTICE_FIRST,
-                readiness_summary=f"Based on your {profile.current_level.value} level in {profile.field_of_interest}, "
-                                 f"with skills in {', '.join(profile.skills[:3]) if profile.skills else 'various areas'}.",
-                strengths_for_work=profile.skills[:3] if profile.skills else ["Willingness to learn"],
-                gaps_to_address=["Build more projects", "Strengthen core skills"],
-                recommended_path="Start with small freelance projects to build portfolio"
-            ),
-            job_recommendations=[
-                JobRecommendation(
-                    job_title=f"{profile.field_of_interest} Intern",
-                    job_type="internship",
-                    why_it_fits="Matches your field of interest and current level",
-                    skills_they_have=profile.skills[:3] if profile.skills else [],
-                    missing_skills=["Advanced skills", "Production experience"],
-                    difficulty=JobDifficulty.MEDIUM,
-                    time_to_ready="1-2 months",
-                    typical_tasks=["Learning", "Assisting senior developers", "Small tasks"]
-                )
-            ],
-            freelance_opportunities=[
-                FreelanceOpportunity(
-                    gig_type="Small Projects",
-                    example_task="Help with basic tasks in your skill area",
-                    why_they_can_do_it="Matches your current skill set",
-                    skills_required=profile.skills[:3] if profile.skills else ["Basic programming"],
-                    platform_types=["Freelance marketplaces", "Student job boards"],
-                    earning_potential="$20-100/project",
-                    difficulty=JobDifficulty.EASY
-                )
-            ],
-            income_strategy=IncomeStrategy(
-                start_freelance_now=len(profile.projects_done) > 0,
-                freelance_reasoning="Small projects can help build portfolio while learning",
-                fast_income_path="Start with small, simple tasks in your skill area",
-                long_term_career_path=f"Build expertise in {profile.field_of_interest}",
-                recommended_first_step="Complete one portfolio project this week"
-            ),
-            skill_gaps=[
-                SkillGap(
-                    skill_name="Portfolio Projects",
-                    importance="Employers need proof of skills",
-                    how_to_learn="Build projects, document them, share on GitHub",
-                    time_to_learn="2-4 weeks per project"
-                )
-            ],
-            high_impact_project=HighImpactProject(
-                project_name=f"{profile.field_of_interest} Portfolio Project",
-                description=f"Build a complete project showcasing your {profile.field_of_interest} skills",
-                skills_demonstrated=profile.skills[:4] if profile.skills else ["Core skills"],
-                why_employers_care="Demonstrates ability to complete real projects",
-                estimated_time="2-4 weeks"
-            ),
-            immediate_actions=[
-                "Identify one small project to start today",
-                "Set up GitHub profile if not done",
-                "Research entry-level positions in your field"
-            ]
-        )
+        return WorkRecommendationResponse.model_validate({
+            **template,
+            "work_readiness": {
+                **template["work_readiness"],
+                "readiness_level": WorkReadiness.FREELANCE_READY if profile.projects_done else WorkReadiness.PRACTICE_FIRST,
+                "readiness_summary": f"Based on your {profile.current_level.value} level in {field}, "
+                                     f"with skills in {', '.join(top_skills) if top_skills else 'various areas'}.",
+                "strengths_for_work": top_skills or ["Willingness to learn"]
+            },
+            "job_recommendations": [{
+                **template["job_recommendations"][0],
+                "job_title": f"{field} Intern",
+                "skills_they_have": top_skills
+            }],
+            "freelance_opportunities": [{
+                **template["freelance_opportunities"][0],
+                "skills_required": top_skills or ["Basic programming"]
+            }],
+            "income_strategy": {
+                **template["income_strategy"],
+                "start_freelance_now": len(profile.projects_done) > 0,
+                "long_term_career_path": f"Build expertise in {field}"
+            },
+            "high_impact_project": {
+                **template["high_impact_project"],
+                "project_name": f"{field} Portfolio Project",
+                "description": f"Build a complete project showcasing your {field} skills",
+                "skills_demonstrated": profile.skills[:4] or ["Core skills"]
+            }
+        })
     
     @staticmethod
     def from_quick_request(request: QuickWorkRequest) -> WorkRecommendationInput:
-        """Convert QuickWorkRequest to WorkRecommendationInput."""
-        level_map = {
-            "beginner": SkillLevel.BEGINNER,
-            "intermediate": SkillLevel.INTERMEDIATE,
-            "advanced": SkillLevel.ADVANCED
-        }
+        """
+        Convert QuickWorkRequest to WorkRecommendationInput.
         
-        return WorkRecommendationInput(
-            student_profile=StudentWorkProfile(
+        The request is already validated and its fields carry the same
+        constraints as the target models, so they are built without
+        re-validation.
+        """
+        return WorkRecommendationInput.model_construct(
+            student_profile=StudentWorkProfile.model_construct(
                 career_goal=request.career_goal,
-                current_level=level_map.get(request.current_level.lower(), SkillLevel.BEGINNER),
+                current_level=_SKILL_LEVEL_BY_NAME.get(request.current_level.casefold(), SkillLevel.BEGINNER),
                 field_of_interest=request.field_of_interest,
                 skills=request.skills,
                 tools_known=request.tools_known,
                 projects_done=request.projects_done,
                 available_hours_per_week=request.hours_per_week
             ),
-            learning_state=LearningState(
+            learning_state=LearningState.model_construct(
                 current_topics_learning=request.currently_learning,
                 strong_areas=request.strong_areas,
                 weak_areas=request.weak_areas
@@ -395,19 +591,17 @@ class WorkRecommendationAgent:
         input_data: WorkRecommendationInput
     ) -> WorkRecommendationResponse:
         """Add search URLs to job and freelance recommendations."""
-        profile = input_data.student_profile
+        top_skills = tuple(input_data.student_profile.skills[:2])
         
         # Add URLs to job recommendations
         for job in response.job_recommendations:
-            job.search_urls = JobBoardURLs.get_all_search_urls(
-                [job.job_title] + profile.skills[:2],
-                ""  # location can be added if needed
-            )
+            job.search_urls = [
+                dict(url) for url in _job_board_urls((job.job_title,) + top_skills, "")
+            ]
         
         # Add URLs to freelance opportunities
         for gig in response.freelance_opportunities:
-            gig_keywords = [gig.gig_type] + gig.skills_required[:2]
-            freelance_gigs = FreelancePlatformURLs.get_all_search_urls(gig_keywords)
+            gig_keywords = (gig.gig_type,) + tuple(gig.skills_required[:2])
             gig.platform_urls = [
                 {
                     "platform": g.platform,
@@ -415,7 +609,7 @@ class WorkRecommendationAgent:
                     "logo": g.platform_logo,
                     "tips": g.tips
                 }
-                for g in freelance_gigs
+                for g in get_platform_gigs(gig_keywords)
             ]
         
         return response
@@ -434,91 +628,103 @@ class WorkRecommendationAgent:
         - Freelance platform search URLs
         """
         profile = input_data.student_profile
+        job_keywords, job_type = self._full_search_query(input_data)
         
-        # Get AI recommendations
-        ai_recommendations = await self.get_recommendations(input_data)
-        
-        # Search for live jobs
-        job_keywords = [profile.field_of_interest] + profile.skills[:3]
-        job_type = "internship" if profile.current_level == SkillLevel.BEGINNER else "junior"
-        
-        live_search_results = await self.search_client.search_jobs(
-            keywords=job_keywords,
-            location=location,
-            job_type=job_type,
-            limit=10
-        )
-        
-        # Build live job response
-        live_jobs = LiveJobSearchResponse(
-            query=" ".join(job_keywords),
-            location=location if location else None,
-            live_jobs=[
-                LiveJobListing(
-                    title=job.title,
-                    company=job.company,
-                    location=job.location,
-                    url=job.url,
-                    salary=job.salary,
-                    description=job.description,
-                    source=job.source,
-                    posted_date=job.posted_date,
-                    job_type=job.job_type
-                )
-                for job in live_search_results.get("api_jobs", [])
-            ],
-            search_urls=[
-                JobSearchURL(
-                    name=url["name"],
-                    url=url["url"],
-                    logo=url["logo"]
-                )
-                for url in live_search_results.get("search_urls", [])
-            ],
-            providers_used=live_search_results.get("providers_used", []),
-            total_results=len(live_search_results.get("api_jobs", []))
+        # AI recommendations and live job search are independent, run them together
+        ai_recommendations, live_search_results = await asyncio.gather(
+            self.get_recommendations(input_data, include_live_search=True),
+            self._search_jobs(job_keywords, location, job_type, 10)
         )
         
-        # Get freelance platform URLs
-        freelance_results = self.search_client.get_freelance_opportunities(
+        live_jobs = self._live_jobs_response(job_keywords, location, live_search_results)
+        freelance_platforms = self.get_freelance_urls(
             skills=profile.skills,
             gig_types=[gig.gig_type for gig in ai_recommendations.freelance_opportunities[:3]]
         )
         
-        freelance_platforms = FreelanceSearchResponse(
-            skills=profile.skills,
-            platforms=[
-                FreelancePlatformURL(
-                    platform=p["platform"],
-                    search_url=p["search_url"],
-                    logo=p.get("logo", "🔗"),
-                    tips=p.get("tips")
-                )
-                for p in freelance_results.get("platforms", [])
-            ],
-            by_skill=freelance_results.get("by_skill", {}),
-            tips=freelance_results.get("tips", [])
+        return FullWorkSearchResponse(
+            ai_recommendations=ai_recommendations,
+            live_jobs=live_jobs,
+            freelance_platforms=freelance_platforms,
+            quick_links=self._quick_links(live_jobs, freelance_platforms, profile.skills)
         )
+    
+    async def stream_full_recommendations(
+        self,
+        input_data: WorkRecommendationInput,
+        location: str = ""
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Yield the parts of a full work search as ``(section, payload)`` pairs as they become ready.
         
-        # Build quick links
-        quick_links = {
-            "job_boards": live_search_results.get("search_urls", [])[:5],
+        Skill-based freelance URLs come first (no I/O), then live jobs and AI
+        recommendations in completion order, then the freelance URLs again with
+        the AI-suggested gig types added, and finally the quick links.
+        """
+        profile = input_data.student_profile
+        job_keywords, job_type = self._full_search_query(input_data)
+        
+        ai_task = asyncio.create_task(
+            self.get_recommendations(input_data, include_live_search=True)
+        )
+        jobs_task = asyncio.create_task(
+            self._search_jobs(job_keywords, location, job_type, 10)
+        )
+        try:
+            yield "freelance_platforms", self.get_freelance_urls(skills=profile.skills)
+            
+            pending = {ai_task, jobs_task}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if jobs_task in done:
+                    live_jobs = self._live_jobs_response(job_keywords, location, jobs_task.result())
+                    yield "live_jobs", live_jobs
+                if ai_task in done:
+                    ai_recommendations = ai_task.result()
+                    yield "ai_recommendations", ai_recommendations
+            
+            freelance_platforms = self.get_freelance_urls(
+                skills=profile.skills,
+                gig_types=[gig.gig_type for gig in ai_recommendations.freelance_opportunities[:3]]
+            )
+            yield "freelance_platforms", freelance_platforms
+            yield "quick_links", self._quick_links(live_jobs, freelance_platforms, profile.skills)
+        finally:
+            # Client went away or a part failed: stop waiting on the other part.
+            # The generation and search themselves run in shared single-flight
+            # tasks, so other requests waiting on them are unaffected.
+            for task in (ai_task, jobs_task):
+                task.cancel()
+    
+    @staticmethod
+    def _full_search_query(input_data: WorkRecommendationInput) -> Tuple[List[str], str]:
+        """Job search keywords and job type used by the full work search."""
+        profile = input_data.student_profile
+        job_keywords = [profile.field_of_interest] + profile.skills[:3]
+        job_type = "internship" if profile.current_level == SkillLevel.BEGINNER else "junior"
+        return job_keywords, job_type
+    
+    @staticmethod
+    def _quick_links(
+        live_jobs: LiveJobSearchResponse,
+        freelance_platforms: FreelanceSearchResponse,
+        skills: List[str]
+    ) -> Dict[str, Any]:
+        """Quick links organized by category for the full work search."""
+        return {
+            "job_boards": [
+                {"name": url.name, "url": url.url, "logo": url.logo}
+                for url in live_jobs.search_urls[:5]
+            ],
             "freelance_platforms": [
-                {"platform": p["platform"], "url": p["search_url"]}
-                for p in freelance_results.get("platforms", [])[:5]
+                {"platform": p.platform, "url": p.search_url}
+                for p in freelance_platforms.platforms[:5]
             ],
             "skill_specific": {
-                skill: freelance_results.get("by_skill", {}).get(skill, [])[:3]
-                for skill in profile.skills[:3]
+                skill: freelance_platforms.by_skill.get(skill, [])[:3]
+                for skill in skills[:3]
             }
         }
-        
-        return FullWorkSearchResponse(
-            ai_recommendations=ai_recommendations,
-            live_jobs=live_jobs,
-            freelance_platforms=freelance_platforms,
-            quick_links=quick_links
-        )
     
     async def search_jobs_live(
         self,
@@ -532,13 +738,16 @@ class WorkRecommendationAgent:
         
         Returns actual job listings from Adzuna, Remotive, etc.
         """
-        results = await self.search_client.search_jobs(
-            keywords=keywords,
-            location=location,
-            job_type=job_type,
-            limit=limit
-        )
-        
+        results = await self._search_jobs(keywords, location, job_type, limit)
+        return self._live_jobs_response(keywords, location, results)
+    
+    @staticmethod
+    def _live_jobs_response(
+        keywords: List[str],
+        location: str,
+        results: Dict[str, Any]
+    ) -> LiveJobSearchResponse:
+        """Build a LiveJobSearchResponse from raw search client results."""
         return LiveJobSearchResponse(
             query=" ".join(keywords),
             location=location if location else None,
@@ -597,3 +806,15 @@ class WorkRecommendationAgent:
     def get_api_status(self) -> Dict[str, bool]:
         """Check which job search APIs are configured."""
         return self.search_client.get_available_providers()
+
+
+# Singleton instance for reuse
+_work_agent_instance: Optional[WorkRecommendationAgent] = None
+
+
+def get_work_agent() -> WorkRecommendationAgent:
+    """Get or create the WorkRecommendationAgent singleton."""
+    global _work_agent_instance
+    if _work_agent_instance is None:
+        _work_agent_instance = WorkRecommendationAgent()
+    return _work_agent_instance
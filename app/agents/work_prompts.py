@@ -24,23 +24,10 @@ You focus on realistic, skill-matched opportunities — not dream jobs beyond th
 Return ONLY valid JSON."""
 
 
-WORK_RECOMMENDATION_PROMPT = """Analyze this student and recommend suitable jobs and freelance opportunities.
-
-## STUDENT DATA:
-
-### Profile:
-- Career Goal: {career_goal}
-- Current Level: {current_level}
-- Field of Interest: {field_of_interest}
-- Skills: {skills}
-- Tools Known: {tools_known}
-- Projects Done: {projects_done}
-- Available Hours/Week: {hours_per_week}
-
-### Learning State:
-- Currently Learning: {currently_learning}
-- Strong Areas: {strong_areas}
-- Weak Areas: {weak_areas}
+# Static instructions and output schema. Sent as part of the system message so
+# the long, unchanging prefix is identical across requests and eligible for
+# provider-side prompt caching; only WORK_RECOMMENDATION_PROMPT varies.
+WORK_RECOMMENDATION_INSTRUCTIONS = """Analyze the student described in the user message and recommend suitable jobs and freelance opportunities.
 
 ## YOUR TASK:
 
@@ -92,16 +79,16 @@ For each gig type include:
 
 ## OUTPUT FORMAT:
 Return valid JSON:
-{{
-    "work_readiness": {{
+{
+    "work_readiness": {
         "readiness_level": "freelance_ready | internship_ready | junior_ready | practice_first",
         "readiness_summary": "2-3 sentence assessment of their job market readiness",
         "strengths_for_work": ["Strength 1", "Strength 2", "Strength 3"],
         "gaps_to_address": ["Gap 1", "Gap 2"],
         "recommended_path": "What path they should take next"
-    }},
+    },
     "job_recommendations": [
-        {{
+        {
             "job_title": "Junior Data Analyst",
             "job_type": "junior",
             "why_it_fits": "Why this role matches their profile",
@@ -111,10 +98,10 @@ Return valid JSON:
             "time_to_ready": "1-2 months",
             "typical_tasks": ["Data cleaning", "Report generation"],
             "icon": "📊"
-        }}
+        }
     ],
     "freelance_opportunities": [
-        {{
+        {
             "gig_type": "Data Cleaning",
             "example_task": "Clean and organize a messy Excel dataset with 10,000 rows",
             "why_they_can_do_it": "They know Python/Pandas and have done data projects",
@@ -123,47 +110,65 @@ Return valid JSON:
             "earning_potential": "$50-150/project",
             "difficulty": "easy_entry",
             "icon": "🧹"
-        }}
+        }
     ],
-    "income_strategy": {{
+    "income_strategy": {
         "start_freelance_now": true,
         "freelance_reasoning": "Why they should or shouldn't start freelancing now",
         "fast_income_path": "The quickest way to start earning with current skills",
         "long_term_career_path": "Best career trajectory for their goals",
         "recommended_first_step": "What to do this week"
-    }},
+    },
     "skill_gaps": [
-        {{
+        {
             "skill_name": "SQL Advanced Queries",
             "importance": "Required for most data roles",
             "how_to_learn": "Practice on LeetCode SQL, build database projects",
             "time_to_learn": "2-3 weeks"
-        }}
+        }
     ],
-    "high_impact_project": {{
+    "high_impact_project": {
         "project_name": "End-to-End Data Pipeline",
         "description": "Build a project that collects, cleans, analyzes, and visualizes real data",
         "skills_demonstrated": ["Python", "SQL", "Data Visualization", "ETL"],
         "why_employers_care": "Shows ability to handle real-world data workflows",
         "estimated_time": "2-3 weeks"
-    }},
+    },
     "immediate_actions": [
         "Action 1 - do this today",
         "Action 2 - do this week",
         "Action 3 - do this month"
     ]
-}}
+}
 
 ## IMPORTANT:
-- Be SPECIFIC to their skills: {skills}
-- Consider their level: {current_level}
-- Match to their goal: {career_goal}
-- Be realistic about what {current_level} level can get
+- Be SPECIFIC to the student's listed skills
+- Consider their current level
+- Match to their career goal
+- Be realistic about what their current level can get
 
 Return ONLY valid JSON, no additional text.
 """
 
 
+WORK_RECOMMENDATION_PROMPT = """## STUDENT DATA:
+
+### Profile:
+- Career Goal: {career_goal}
+- Current Level: {current_level}
+- Field of Interest: {field_of_interest}
+- Skills: {skills}
+- Tools Known: {tools_known}
+- Projects Done: {projects_done}
+- Available Hours/Week: {hours_per_week}
+
+### Learning State:
+- Currently Learning: {currently_learning}
+- Strong Areas: {strong_areas}
+- Weak Areas: {weak_areas}
+"""
+
+
 QUICK_JOB_CHECK_PROMPT = """Based on these skills: {skills}
 And this career goal: {career_goal}
 At {current_level} level
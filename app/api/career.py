@@ -1,24 +1,87 @@
 """FastAPI endpoints for the Career Translator Agent."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
+import random
+from typing import Awaitable, Callable, Optional, TypeVar
 
 from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.agents.career_translator import CareerTranslatorAgent, get_career_translator
+from app.config import settings
 from app.models.career_schemas import (
     CareerTranslation,
     LectureInput,
     TranslateLectureRequest,
     TranslateLectureResponse,
 )
+from app.services.response_cache import cached_response, get_cached_response, store_response
+from app.services.sse import format_sse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/career", tags=["career-translator"])
 
+# Upper bound on concurrent batch LLM calls across all requests (provider rate limits)
+_batch_semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+
+# Retry rate-limited / overloaded provider calls with jittered exponential backoff
+RETRYABLE_STATUS_CODES = {429, 503}
+MAX_RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY_SECONDS = 1.0
+
+T = TypeVar("T")
+
+
+def _provider_status_code(exc: BaseException) -> Optional[int]:
+    """
+    HTTP status behind a provider error, if any.
+    
+    OpenAI/Groq APIStatusError (incl. RateLimitError) carries the
+    httpx response; Gemini's google.api_core errors expose `code`.
+    LangChain wrappers are unwrapped via the exception's cause.
+    """
+    while exc is not None:
+        response = getattr(exc, "response", None)
+        for status_code in (
+            getattr(exc, "status_code", None),
+            getattr(response, "status_code", None),
+            getattr(exc, "code", None),
+        ):
+            if isinstance(status_code, int):
+                return status_code
+        exc = exc.__cause__
+    return None
+
+
+async def _with_backoff(call: Callable[[], Awaitable[T]]) -> T:
+    """Await `call()`, retrying when the provider answers 429/503."""
+    for attempt in range(MAX_RETRY_ATTEMPTS):
+        try:
+            return await call()
+        except Exception as e:
+            status_code = _provider_status_code(e)
+            if status_code not in RETRYABLE_STATUS_CODES or attempt == MAX_RETRY_ATTEMPTS - 1:
+                raise
+            delay = RETRY_BASE_DELAY_SECONDS * 2 ** attempt * random.uniform(0.5, 1.5)
+            logger.warning("Provider returned %s, retrying in %.1fs", status_code, delay)
+            await asyncio.sleep(delay)
+
+
+async def _translate_cached(
+    translator: CareerTranslatorAgent, lecture_input: LectureInput
+) -> CareerTranslation:
+    """Cached translation; unparseable LLM output gets the placeholder, uncached."""
+    try:
+        return await cached_response(
+            "career.translate", lecture_input, lambda: translator.translate(lecture_input)
+        )
+    except ValueError as e:
+        logger.warning("Serving placeholder translation for '%s': %s", lecture_input.lecture_topic, e)
+        return translator.default_translation(lecture_input.lecture_topic)
+
 
 @router.post(
     "/translate",
@@ -48,9 +111,9 @@ async def translate_lecture(request: TranslateLectureRequest) -> TranslateLectur
             target_track=request.target_track,
         )
         
-        translation = await translator.translate(lecture_input)
+        translation = await _translate_cached(translator, lecture_input)
         
-        logger.info(f"Translated lecture: {request.lecture_topic}")
+        logger.info("Translated lecture: %s", request.lecture_topic, extra={"lecture_topic": request.lecture_topic})
         
         return TranslateLectureResponse(
             success=True,
@@ -58,7 +121,7 @@ async def translate_lecture(request: TranslateLectureRequest) -> TranslateLectur
         )
     
     except Exception as e:
-        logger.error(f"Error translating lecture: {e}")
+        logger.error("Error translating lecture: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to translate lecture: {str(e)}"
@@ -87,18 +150,58 @@ async def translate_lecture_raw(request: TranslateLectureRequest) -> CareerTrans
             target_track=request.target_track,
         )
         
-        translation = await translator.translate(lecture_input)
+        translation = await _translate_cached(translator, lecture_input)
         
         return translation
     
     except Exception as e:
-        logger.error(f"Error translating lecture: {e}")
+        logger.error("Error translating lecture: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to translate lecture: {str(e)}"
         )
 
 
+@router.post(
+    "/translate/stream",
+    summary="Translate lecture - streamed",
+    description="Streams the translation as Server-Sent Events: `partial` events with the fields generated so far, then one `result` event with the full CareerTranslation."
+)
+async def translate_lecture_stream(request: TranslateLectureRequest) -> StreamingResponse:
+    """Stream a career translation so clients can render it progressively."""
+    translator = get_career_translator()
+    
+    lecture_input = LectureInput(
+        lecture_topic=request.lecture_topic,
+        lecture_text=request.lecture_text,
+        target_track=request.target_track,
+    )
+    
+    async def events():
+        cached = get_cached_response("career.translate", lecture_input)
+        if cached is not None:
+            yield format_sse("result", cached.model_dump(mode="json"))
+            return
+        
+        try:
+            async for item in translator.translate_stream(lecture_input):
+                if isinstance(item, CareerTranslation):
+                    store_response("career.translate", lecture_input, item)
+                    yield format_sse("result", item.model_dump(mode="json"))
+                else:
+                    yield format_sse("partial", item)
+        except ValueError as e:
+            # Unparseable output: send the placeholder but keep it out of the cache
+            logger.warning("Serving placeholder translation for '%s': %s", lecture_input.lecture_topic, e)
+            placeholder = translator.default_translation(lecture_input.lecture_topic)
+            yield format_sse("result", placeholder.model_dump(mode="json"))
+        except Exception as e:
+            logger.error("Error streaming lecture translation: %s", e)
+            yield format_sse("error", {"detail": f"Failed to translate lecture: {str(e)}"})
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.post(
     "/translate/sync",
     response_model=TranslateLectureResponse,
@@ -116,7 +219,10 @@ def translate_lecture_sync(request: TranslateLectureRequest) -> TranslateLecture
             target_track=request.target_track,
         )
         
-        translation = translator.translate_sync(lecture_input)
+        try:
+            translation = translator.translate_sync(lecture_input)
+        except ValueError:
+            translation = translator.default_translation(lecture_input.lecture_topic)
         
         return TranslateLectureResponse(
             success=True,
@@ -124,7 +230,7 @@ def translate_lecture_sync(request: TranslateLectureRequest) -> TranslateLecture
         )
     
     except Exception as e:
-        logger.error(f"Error translating lecture: {e}")
+        logger.error("Error translating lecture: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to translate lecture: {str(e)}"
@@ -159,23 +265,46 @@ async def batch_translate(requests: list[TranslateLectureRequest]) -> list[Caree
     """
     try:
         translator = get_career_translator()
-        translations = []
         
-        for req in requests:
+        async def translate_one(req: TranslateLectureRequest) -> CareerTranslation:
             lecture_input = LectureInput(
                 lecture_topic=req.lecture_topic,
                 lecture_text=req.lecture_text,
                 target_track=req.target_track,
             )
-            translation = await translator.translate(lecture_input)
-            translations.append(translation)
+            async with _batch_semaphore:
+                try:
+                    return await cached_response(
+                        "career.translate",
+                        lecture_input,
+                        lambda: _with_backoff(lambda: translator.translate(lecture_input)),
+                    )
+                except Exception as e:
+                    # One failed lecture shouldn't sink the whole batch
+                    logger.error("Error translating lecture '%s' in batch: %s", req.lecture_topic, e)
+                    return translator.default_translation(req.lecture_topic)
+        
+        # Translate each distinct lecture once and fan the result back out
+        unique: dict[tuple, TranslateLectureRequest] = {}
+        for req in requests:
+            unique.setdefault((req.lecture_topic, req.lecture_text, req.target_track), req)
+        
+        results = await asyncio.gather(*(translate_one(req) for req in unique.values()))
+        by_key = dict(zip(unique, results))
+        translations = [
+            by_key[(req.lecture_topic, req.lecture_text, req.target_track)]
+            for req in requests
+        ]
         
-        logger.info(f"Batch translated {len(translations)} lectures")
+        logger.info(
+            "Batch translated %d lectures (%d unique)", len(translations), len(unique),
+            extra={"count": len(translations), "unique": len(unique)},
+        )
         
         return translations
     
     except Exception as e:
-        logger.error(f"Error in batch translation: {e}")
+        logger.error("Error in batch translation: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to batch translate: {str(e)}"
@@ -1,10 +1,13 @@
 """FastAPI endpoints for the interview system."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Dict
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import JSONResponse
 
 from app.models.interview_schemas import (
     FinalReport,
@@ -16,12 +19,20 @@ from app.models.interview_schemas import (
     SubmitAnswerRequest,
     SubmitAnswerResponse,
 )
+from app.services.orchestrator import InterviewOrchestrator
 from app.services.session_store import session_store
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/interview", tags=["interview"])
 
+# Seconds clients are told to wait before polling a pending report again
+REPORT_POLL_INTERVAL_SECONDS = 2
+
+# In-flight and failed final report generations, keyed by session; a successful
+# run removes its own entry once the report is in the session store
+_report_tasks: Dict[UUID, asyncio.Task] = {}
+
 
 @router.post("/start", response_model=StartInterviewResponse)
 async def start_interview(request: StartInterviewRequest) -> StartInterviewResponse:
@@ -41,7 +52,10 @@ async def start_interview(request: StartInterviewRequest) -> StartInterviewRespo
         # Generate first question
         first_question = await orchestrator.start_interview()
         
-        logger.info(f"Started interview session {orchestrator.session_id} for user {request.user_id}")
+        logger.info(
+            "Started interview session %s for user %s", orchestrator.session_id, request.user_id,
+            extra={"session_id": str(orchestrator.session_id), "user_id": request.user_id},
+        )
         
         return StartInterviewResponse(
             session_id=orchestrator.session_id,
@@ -51,7 +65,7 @@ async def start_interview(request: StartInterviewRequest) -> StartInterviewRespo
         )
     
     except Exception as e:
-        logger.error(f"Error starting interview: {e}")
+        logger.error("Error starting interview: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to start interview: {str(e)}"
@@ -90,7 +104,10 @@ async def submit_answer(request: SubmitAnswerRequest) -> SubmitAnswerResponse:
             answer=request.answer,
         )
         
-        logger.info(f"Processed answer for session {request.session_id}, state: {result['next_state']}")
+        logger.info(
+            "Processed answer for session %s, state: %s", request.session_id, result["next_state"],
+            extra={"session_id": str(request.session_id), "next_state": result["next_state"]},
+        )
         
         return SubmitAnswerResponse(
             evaluation=result["evaluation"],
@@ -102,7 +119,7 @@ async def submit_answer(request: SubmitAnswerRequest) -> SubmitAnswerResponse:
         )
     
     except Exception as e:
-        logger.error(f"Error processing answer: {e}")
+        logger.error("Error processing answer: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process answer: {str(e)}"
@@ -136,8 +153,32 @@ async def get_session_status(session_id: UUID) -> SessionStatusResponse:
     )
 
 
-@router.get("/{session_id}/report", response_model=FinalReport)
-async def get_final_report(session_id: UUID) -> FinalReport:
+async def _generate_and_store_report(
+    session_id: UUID, orchestrator: InterviewOrchestrator
+) -> FinalReport:
+    """Generate a session's final report and cache it in the session store."""
+    report = await orchestrator.generate_final_report()
+    session_store.store_report(session_id, report)
+    _report_tasks.pop(session_id, None)
+    logger.info(
+        "Generated final report for session %s", session_id,
+        extra={"session_id": str(session_id)},
+    )
+    return report
+
+
+def _log_report_failure(task: asyncio.Task) -> None:
+    """Log a failed background report; the error is surfaced on the next poll."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Error generating report: %s", task.exception())
+
+
+@router.get(
+    "/{session_id}/report",
+    response_model=FinalReport,
+    responses={202: {"description": "Report generation in progress; poll again"}},
+)
+async def get_final_report(session_id: UUID) -> FinalReport | JSONResponse:
     """
     Get the final interview report.
     
@@ -146,43 +187,53 @@ async def get_final_report(session_id: UUID) -> FinalReport:
     - Communication profile
     - Hiring recommendations
     - Improvement plan
+    
+    The first request starts generation in the background and returns
+    202 Accepted; poll the same URL until it returns 200 with the report.
     """
     # Check for cached report first
     cached_report = session_store.get_report(session_id)
     if cached_report:
         return cached_report
     
-    # Get session
-    orchestrator = session_store.get_session(session_id)
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Session {session_id} not found"
-        )
-    
-    if not orchestrator.is_complete:
+    task = _report_tasks.get(session_id)
+    if task is not None and task.done():
+        # Only failed runs are left behind; report the error once, then allow a retry
+        del _report_tasks[session_id]
+        error = "cancelled" if task.cancelled() else str(task.exception())
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Interview is not yet complete. Cannot generate report."
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate report: {error}"
         )
     
-    try:
-        # Generate report
-        report = await orchestrator.generate_final_report()
-        
-        # Cache the report
-        session_store.store_report(session_id, report)
+    if task is None:
+        # Get session
+        orchestrator = session_store.get_session(session_id)
+        if not orchestrator:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Session {session_id} not found"
+            )
         
-        logger.info(f"Generated final report for session {session_id}")
+        if not orchestrator.is_complete:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Interview is not yet complete. Cannot generate report."
+            )
         
-        return report
+        task = asyncio.create_task(_generate_and_store_report(session_id, orchestrator))
+        task.add_done_callback(_log_report_failure)
+        _report_tasks[session_id] = task
     
-    except Exception as e:
-        logger.error(f"Error generating report: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate report: {str(e)}"
-        )
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={
+            "status": "pending",
+            "session_id": str(session_id),
+            "poll_url": f"{router.prefix}/{session_id}/report",
+        },
+        headers={"Retry-After": str(REPORT_POLL_INTERVAL_SECONDS)},
+    )
 
 
 @router.delete("/{session_id}")
@@ -193,7 +244,7 @@ async def delete_session(session_id: UUID) -> dict:
     Removes the session and any associated data.
     """
     if session_store.remove_session(session_id):
-        logger.info(f"Deleted session {session_id}")
+        logger.info("Deleted session %s", session_id, extra={"session_id": str(session_id)})
         return {"message": f"Session {session_id} deleted successfully"}
     else:
         raise HTTPException(
@@ -203,16 +254,20 @@ async def delete_session(session_id: UUID) -> dict:
 
 
 @router.get("/")
-async def list_sessions(user_id: str | None = None) -> dict:
+async def list_sessions(
+    user_id: str | None = None,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+) -> dict:
     """
-    List all active interview sessions.
+    List active interview sessions, one page at a time.
     
-    Optionally filter by user_id.
+    Optionally filter by user_id. `total` counts all matching sessions.
     """
-    sessions = session_store.list_sessions(user_id)
+    sessions = session_store.list_sessions(user_id, limit=limit, offset=offset)
     return {
         "sessions": sessions,
-        "total": len(sessions),
+        "total": session_store.count_sessions(user_id),
     }
 
 
@@ -236,7 +291,7 @@ def start_interview_sync(request: StartInterviewRequest) -> StartInterviewRespon
         )
     
     except Exception as e:
-        logger.error(f"Error starting interview: {e}")
+        logger.error("Error starting interview: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to start interview: {str(e)}"
@@ -275,7 +330,7 @@ def submit_answer_sync(request: SubmitAnswerRequest) -> SubmitAnswerResponse:
         )
     
     except Exception as e:
-        logger.error(f"Error processing answer: {e}")
+        logger.error("Error processing answer: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process answer: {str(e)}"
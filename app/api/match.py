@@ -12,5 +12,5 @@ workflow = MatchWorkflow()
 
 @router.post("/match", response_model=MatchResultRun)
 async def match(user_input: UserInput) -> MatchResultRun:
-    result = workflow.run(user_input)
+    result = await workflow.arun(user_input)
     return result
@@ -3,11 +3,21 @@ from __future__ import annotations
 
 import logging
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional
 
-from app.agents.recap_agent import RecapAgent
-from app.models.recap_schemas import RecapResponse, RecapInput
+from app.agents.recap_agent import get_recap_agent
+from app.models.career_schemas import MAX_LECTURE_TEXT_LENGTH, MAX_TOPIC_LENGTH
+from app.models.recap_schemas import (
+    FlashcardsResponse,
+    QuickSummaryResponse,
+    RecapInput,
+    RecapResponse,
+    StudyPlanResponse,
+)
+from app.services.response_cache import cached_response, get_cached_response, store_response
+from app.services.sse import format_sse
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +26,15 @@ router = APIRouter(prefix="/api/recap", tags=["Recap - Summary & Learning Tracks
 
 class RecapRequest(BaseModel):
     """Request model for recap generation."""
-    topic: str = Field(..., description="The lecture topic or subject to recap", example="Binary Search Trees")
+    topic: str = Field(
+        ...,
+        max_length=MAX_TOPIC_LENGTH,
+        description="The lecture topic or subject to recap",
+        example="Binary Search Trees"
+    )
     lecture_content: Optional[str] = Field(
-        None, 
+        None,
+        max_length=MAX_LECTURE_TEXT_LENGTH,
         description="Optional lecture notes or content for more accurate recap",
         example="Today we covered BST operations: insertion, deletion, and traversal..."
     )
@@ -34,6 +50,20 @@ class RecapRequest(BaseModel):
     )
 
 
+async def _get_recap_cached(request: RecapRequest) -> RecapResponse:
+    """Full recap for a request, generated once and shared by every recap endpoint."""
+    agent = get_recap_agent()
+    recap_input = RecapInput(
+        topic=request.topic,
+        lecture_content=request.lecture_content,
+        student_level=request.student_level,
+        focus_area=request.focus_area
+    )
+    return await cached_response(
+        "recap", recap_input, lambda: agent.generate_recap(recap_input)
+    )
+
+
 @router.post(
     "/generate",
     response_model=RecapResponse,
@@ -76,56 +106,75 @@ async def generate_recap(request: RecapRequest) -> RecapResponse:
     - Quick reference materials
     """
     try:
-        agent = RecapAgent()
+        result = await _get_recap_cached(request)
         
-        recap_input = RecapInput(
-            topic=request.topic,
-            lecture_content=request.lecture_content,
-            student_level=request.student_level,
-            focus_area=request.focus_area
-        )
-        
-        result = await agent.generate_recap(recap_input)
-        
-        logger.info(f"Successfully generated recap for: {request.topic}")
+        logger.info("Successfully generated recap for: %s", request.topic, extra={"topic": request.topic})
         return result
         
     except Exception as e:
-        logger.error(f"Error generating recap: {e}")
+        logger.error("Error generating recap: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate recap: {str(e)}"
         )
 
 
+@router.post(
+    "/generate/stream",
+    summary="Generate Lecture Recap (streamed)",
+    description="Streams the recap as Server-Sent Events: `partial` events as the structured output grows, then one `result` event with the full RecapResponse."
+)
+async def generate_recap_stream(request: RecapRequest) -> StreamingResponse:
+    """Stream a recap so clients can render it progressively."""
+    agent = get_recap_agent()
+    
+    recap_input = RecapInput(
+        topic=request.topic,
+        lecture_content=request.lecture_content,
+        student_level=request.student_level,
+        focus_area=request.focus_area
+    )
+    
+    async def events():
+        cached = get_cached_response("recap", recap_input)
+        if cached is not None:
+            yield format_sse("result", cached.model_dump(mode="json"))
+            return
+        
+        try:
+            async for item in agent.generate_recap_stream(recap_input):
+                if isinstance(item, RecapResponse):
+                    store_response("recap", recap_input, item)
+                    yield format_sse("result", item.model_dump(mode="json"))
+                else:
+                    yield format_sse("partial", item)
+        except Exception as e:
+            logger.error("Error streaming recap: %s", e)
+            yield format_sse("error", {"detail": f"Failed to generate recap: {str(e)}"})
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.post(
     "/quick-summary",
+    response_model=QuickSummaryResponse,
     summary="Get Quick Summary Only",
     description="Get just the summary section without learning tracks"
 )
-async def get_quick_summary(request: RecapRequest):
+async def get_quick_summary(request: RecapRequest) -> QuickSummaryResponse:
     """Get a quick summary of the topic without full learning tracks."""
     try:
-        agent = RecapAgent()
+        result = await _get_recap_cached(request)
         
-        recap_input = RecapInput(
+        return QuickSummaryResponse(
             topic=request.topic,
-            lecture_content=request.lecture_content,
-            student_level=request.student_level,
-            focus_area=request.focus_area
+            summary=result.summary,
+            difficulty_level=result.difficulty_level,
+            estimated_study_time=result.estimated_study_time
         )
         
-        result = await agent.generate_recap(recap_input)
-        
-        return {
-            "topic": request.topic,
-            "summary": result.summary,
-            "difficulty_level": result.difficulty_level,
-            "estimated_study_time": result.estimated_study_time
-        }
-        
     except Exception as e:
-        logger.error(f"Error generating quick summary: {e}")
+        logger.error("Error generating quick summary: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate summary: {str(e)}"
@@ -134,34 +183,26 @@ async def get_quick_summary(request: RecapRequest):
 
 @router.post(
     "/study-plan",
+    response_model=StudyPlanResponse,
     summary="Get Study Plan Only",
     description="Get learning tracks and study tips without full summary"
 )
-async def get_study_plan(request: RecapRequest):
+async def get_study_plan(request: RecapRequest) -> StudyPlanResponse:
     """Get a focused study plan with tracks, tips, and exercises."""
     try:
-        agent = RecapAgent()
+        result = await _get_recap_cached(request)
         
-        recap_input = RecapInput(
+        return StudyPlanResponse(
             topic=request.topic,
-            lecture_content=request.lecture_content,
-            student_level=request.student_level,
-            focus_area=request.focus_area
+            study_tips=result.study_tips,
+            learning_tracks=result.learning_tracks,
+            practice_exercises=result.practice_exercises,
+            milestones=result.milestones,
+            resources=result.resources
         )
         
-        result = await agent.generate_recap(recap_input)
-        
-        return {
-            "topic": request.topic,
-            "study_tips": result.study_tips,
-            "learning_tracks": result.learning_tracks,
-            "practice_exercises": result.practice_exercises,
-            "milestones": result.milestones,
-            "resources": result.resources
-        }
-        
     except Exception as e:
-        logger.error(f"Error generating study plan: {e}")
+        logger.error("Error generating study plan: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate study plan: {str(e)}"
@@ -170,32 +211,24 @@ async def get_study_plan(request: RecapRequest):
 
 @router.post(
     "/flashcards",
+    response_model=FlashcardsResponse,
     summary="Get Flashcards",
     description="Get quick reference flashcards for review"
 )
-async def get_flashcards(request: RecapRequest):
+async def get_flashcards(request: RecapRequest) -> FlashcardsResponse:
     """Get flashcards and cheat sheet for quick review."""
     try:
-        agent = RecapAgent()
+        result = await _get_recap_cached(request)
         
-        recap_input = RecapInput(
+        return FlashcardsResponse(
             topic=request.topic,
-            lecture_content=request.lecture_content,
-            student_level=request.student_level,
-            focus_area=request.focus_area
+            quick_reference=result.quick_reference,
+            key_concepts=result.summary.key_concepts,
+            key_takeaways=result.summary.key_takeaways
         )
         
-        result = await agent.generate_recap(recap_input)
-        
-        return {
-            "topic": request.topic,
-            "quick_reference": result.quick_reference,
-            "key_concepts": result.summary.key_concepts,
-            "key_takeaways": result.summary.key_takeaways
-        }
-        
     except Exception as e:
-        logger.error(f"Error generating flashcards: {e}")
+        logger.error("Error generating flashcards: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate flashcards: {str(e)}"
@@ -1,13 +1,18 @@
 """API endpoints for the Work Recommendation Agent."""
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import List, Optional
+import time
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from app.agents.work_agent import WorkRecommendationAgent
+from app.agents.work_agent import WorkRecommendationAgent, get_work_agent
 from app.models.work_schemas import (
     WorkRecommendationInput,
     WorkRecommendationResponse,
@@ -21,17 +26,35 @@ from app.models.work_schemas import (
     FreelanceSearchResponse,
     FullWorkSearchResponse
 )
+from app.services.sse import format_sse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/work", tags=["Work Recommendations - Jobs & Freelance"])
 
 
+def warm_up() -> None:
+    """
+    Build the work agent ahead of the first request.
+    
+    Creating it imports and configures the LangChain LLM client, which is the
+    bulk of the first-request latency on these endpoints. Request models need
+    no warm-up: pydantic compiles their validators at class definition.
+    """
+    try:
+        get_work_agent()
+    except Exception as e:
+        # Leave it to the first request to surface configuration errors
+        logger.warning("Work agent warm-up failed: %s", e)
+
+
 # ============================================
 # Request Models
 # ============================================
 
-class SimpleWorkRequest(BaseModel):
+# SimpleWorkRequest and FullSearchRequest extend QuickWorkRequest (overriding only the
+# docs examples) so the agent can convert them to WorkRecommendationInput directly
+class SimpleWorkRequest(QuickWorkRequest):
     """Simplified request for work recommendations."""
     # Required
     career_goal: str = Field(..., example="Become a Data Scientist")
@@ -80,7 +103,13 @@ class FreelanceURLsRequest(BaseModel):
     gig_types: List[str] = Field(default_factory=list, example=["Data Cleaning", "Automation"])
 
 
-class FullSearchRequest(BaseModel):
+class ReadinessRequest(BaseModel):
+    """Request for a quick work readiness check."""
+    skills: List[str] = Field(..., example=["Python", "SQL", "Pandas"])
+    projects_done: Optional[List[str]] = Field(default=None, example=["Titanic ML Project"])
+
+
+class FullSearchRequest(QuickWorkRequest):
     """Request for full search with AI + live jobs + freelance."""
     # Profile
     career_goal: str = Field(..., example="Become a Data Scientist")
@@ -89,7 +118,7 @@ class FullSearchRequest(BaseModel):
     current_level: str = Field(default="beginner")
     tools_known: List[str] = Field(default_factory=list)
     projects_done: List[str] = Field(default_factory=list)
-    hours_per_week: float = Field(default=20)
+    hours_per_week: float = Field(default=20, ge=5, le=60)
     
     # Learning state
     currently_learning: List[str] = Field(default_factory=list)
@@ -153,33 +182,21 @@ class FullSearchRequest(BaseModel):
 async def get_work_recommendations(request: SimpleWorkRequest) -> WorkRecommendationResponse:
     """Get comprehensive job and freelance recommendations."""
     try:
-        agent = WorkRecommendationAgent()
-        
-        # Convert to QuickWorkRequest
-        quick_request = QuickWorkRequest(
-            career_goal=request.career_goal,
-            field_of_interest=request.field_of_interest,
-            skills=request.skills,
-            current_level=request.current_level,
-            tools_known=request.tools_known,
-            projects_done=request.projects_done,
-            hours_per_week=request.hours_per_week,
-            currently_learning=request.currently_learning,
-            strong_areas=request.strong_areas,
-            weak_areas=request.weak_areas
-        )
+        agent = get_work_agent()
         
-        # Convert to full input
-        input_data = WorkRecommendationAgent.from_quick_request(quick_request)
+        input_data = WorkRecommendationAgent.from_quick_request(request)
         
-        result = await agent.get_recommendations(input_data)
+        result = await agent.get_recommendations(input_data, include_live_search=True)
         
-        logger.info(f"Generated {len(result.job_recommendations)} job and "
-                   f"{len(result.freelance_opportunities)} freelance recommendations")
+        jobs, gigs = len(result.job_recommendations), len(result.freelance_opportunities)
+        logger.info(
+            "Generated %d job and %d freelance recommendations", jobs, gigs,
+            extra={"job_count": jobs, "freelance_count": gigs},
+        )
         return result
         
     except Exception as e:
-        logger.error(f"Error getting work recommendations: {e}")
+        logger.error("Error getting work recommendations: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate recommendations: {str(e)}"
@@ -197,12 +214,12 @@ async def get_detailed_work_recommendations(
 ) -> WorkRecommendationResponse:
     """Get work recommendations with full detailed input."""
     try:
-        agent = WorkRecommendationAgent()
-        result = await agent.get_recommendations(request)
+        agent = get_work_agent()
+        result = await agent.get_recommendations(request, include_live_search=True)
         return result
         
     except Exception as e:
-        logger.error(f"Error getting detailed work recommendations: {e}")
+        logger.error("Error getting detailed work recommendations: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate recommendations: {str(e)}"
@@ -226,7 +243,7 @@ Fast and focused on what you can apply for within 1-2 months.
 async def get_jobs_only(request: QuickJobsRequest) -> dict:
     """Get quick job recommendations."""
     try:
-        agent = WorkRecommendationAgent()
+        agent = get_work_agent()
         
         result = await agent.get_quick_jobs(
             skills=request.skills,
@@ -242,7 +259,7 @@ async def get_jobs_only(request: QuickJobsRequest) -> dict:
         }
         
     except Exception as e:
-        logger.error(f"Error getting job recommendations: {e}")
+        logger.error("Error getting job recommendations: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -259,7 +276,7 @@ Get specific gig types, earning potential, and where to find clients.
 async def get_freelance_only(request: FreelanceRequest) -> dict:
     """Get freelance-focused recommendations."""
     try:
-        agent = WorkRecommendationAgent()
+        agent = get_work_agent()
         
         result = await agent.get_freelance_focus(
             skills=request.skills,
@@ -276,7 +293,7 @@ async def get_freelance_only(request: FreelanceRequest) -> dict:
         }
         
     except Exception as e:
-        logger.error(f"Error getting freelance recommendations: {e}")
+        logger.error("Error getting freelance recommendations: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -286,15 +303,14 @@ async def get_freelance_only(request: FreelanceRequest) -> dict:
     description="Quick check of your readiness for jobs vs freelance vs practice"
 )
 async def check_readiness(
-    skills: List[str],
-    projects_done: List[str] = None,
+    request: ReadinessRequest,
     current_level: str = "beginner"
 ) -> dict:
     """Quick readiness check."""
     try:
         # Simple heuristic-based readiness check
-        skill_count = len(skills)
-        project_count = len(projects_done) if projects_done else 0
+        skill_count = len(request.skills)
+        project_count = len(request.projects_done) if request.projects_done else 0
         
         if current_level == "advanced" and project_count >= 3:
             readiness = "junior_ready"
@@ -318,7 +334,7 @@ async def check_readiness(
         }
         
     except Exception as e:
-        logger.error(f"Error checking readiness: {e}")
+        logger.error("Error checking readiness: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -326,52 +342,169 @@ async def check_readiness(
 # Utility Endpoints
 # ============================================
 
+# Static reference data, serialized once at import
+_PLATFORM_TYPES = {
+    "platform_types": [
+        {
+            "type": "General Freelance Marketplaces",
+            "description": "Broad range of projects across all fields",
+            "examples_type": "Upwork-style, Fiverr-style platforms",
+            "best_for": ["Beginners", "Diverse skills", "Building reviews"],
+            "typical_competition": "High"
+        },
+        {
+            "type": "Tech-Specific Platforms",
+            "description": "Focused on development and tech work",
+            "examples_type": "Toptal-style, developer-focused platforms",
+            "best_for": ["Experienced developers", "Higher rates"],
+            "typical_competition": "Medium"
+        },
+        {
+            "type": "Project-Based Platforms",
+            "description": "One-time projects and contests",
+            "examples_type": "99designs-style, contest platforms",
+            "best_for": ["Creative work", "Quick projects"],
+            "typical_competition": "High"
+        },
+        {
+            "type": "Direct Client Outreach",
+            "description": "Finding clients through networking",
+            "examples_type": "LinkedIn, personal network, cold outreach",
+            "best_for": ["Higher rates", "Long-term relationships"],
+            "typical_competition": "Low"
+        },
+        {
+            "type": "Local/Student Job Boards",
+            "description": "University and local opportunities",
+            "examples_type": "University job boards, local business networks",
+            "best_for": ["Students", "First experiences"],
+            "typical_competition": "Low"
+        }
+    ]
+}
+
+_JOB_TYPES = {
+    "software": [
+        "Junior Software Developer",
+        "Software Engineering Intern",
+        "Junior Backend Developer",
+        "Junior Frontend Developer",
+        "QA Tester / QA Intern"
+    ],
+    "data": [
+        "Junior Data Analyst",
+        "Data Science Intern",
+        "Business Intelligence Intern",
+        "Data Entry Specialist",
+        "Junior Data Engineer"
+    ],
+    "web": [
+        "Junior Web Developer",
+        "Frontend Developer Intern",
+        "WordPress Developer",
+        "Junior Full Stack Developer",
+        "Web Development Intern"
+    ],
+    "mobile": [
+        "Junior Mobile Developer",
+        "iOS/Android Intern",
+        "Junior React Native Developer",
+        "Mobile App Tester"
+    ],
+    "devops": [
+        "Junior DevOps Engineer",
+        "IT Support Intern",
+        "Junior System Administrator",
+        "Cloud Support Associate"
+    ],
+    "ai": [
+        "AI/ML Intern",
+        "Junior Machine Learning Engineer",
+        "Data Annotation Specialist",
+        "AI Research Assistant"
+    ]
+}
+
+_FREELANCE_GIGS = {
+    "python": [
+        {"gig": "Web Scraping", "earning": "$50-300/project"},
+        {"gig": "Data Cleaning", "earning": "$30-200/project"},
+        {"gig": "Automation Scripts", "earning": "$50-500/project"},
+        {"gig": "API Integration", "earning": "$100-500/project"},
+        {"gig": "Django/Flask Apps", "earning": "$200-1000/project"}
+    ],
+    "javascript": [
+        {"gig": "React Components", "earning": "$50-300/project"},
+        {"gig": "Landing Pages", "earning": "$100-500/project"},
+        {"gig": "Bug Fixing", "earning": "$20-100/bug"},
+        {"gig": "Website Updates", "earning": "$50-200/project"},
+        {"gig": "Node.js API", "earning": "$150-600/project"}
+    ],
+    "data": [
+        {"gig": "Excel/Sheets Work", "earning": "$20-100/project"},
+        {"gig": "Data Visualization", "earning": "$50-300/project"},
+        {"gig": "Dashboard Creation", "earning": "$100-500/project"},
+        {"gig": "Data Entry", "earning": "$10-50/hour"},
+        {"gig": "Survey Analysis", "earning": "$50-200/project"}
+    ],
+    "design": [
+        {"gig": "Logo Design", "earning": "$50-200/project"},
+        {"gig": "Social Media Graphics", "earning": "$20-100/set"},
+        {"gig": "UI Mockups", "earning": "$100-400/project"},
+        {"gig": "Presentation Design", "earning": "$50-200/project"}
+    ]
+}
+
+_PLATFORM_TYPES_BYTES = orjson.dumps(_PLATFORM_TYPES)
+_JOB_TYPES_BYTES = {
+    field: orjson.dumps({
+        "field": field,
+        "job_types": job_types,
+        "all_fields": list(_JOB_TYPES)
+    })
+    for field, job_types in _JOB_TYPES.items()
+}
+_FREELANCE_GIGS_BYTES = {
+    skill_area: orjson.dumps({
+        "skill_area": skill_area,
+        "gig_types": gig_types,
+        "all_skill_areas": list(_FREELANCE_GIGS)
+    })
+    for skill_area, gig_types in _FREELANCE_GIGS.items()
+}
+
+
+# The static payloads only change on deploy, so clients may revalidate them by ETag
+STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+
+@lru_cache(maxsize=256)
+def _etag(content: bytes) -> str:
+    """Strong ETag for a response body (bytes cache their hash, so precomputed bodies hit fast)."""
+    return '"' + hashlib.blake2b(content, digest_size=8).hexdigest() + '"'
+
+
+def _static_json_response(request: Request, content: bytes) -> Response:
+    """Serve a static JSON body, or 304 if the client already has this version."""
+    etag = _etag(content)
+    headers = {"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 @router.get(
     "/platforms",
     summary="Get Freelance Platform Types",
     description="Get information about different types of freelance platforms"
 )
-async def get_platform_types() -> dict:
+async def get_platform_types(request: Request) -> Response:
     """Get freelance platform type information."""
-    return {
-        "platform_types": [
-            {
-                "type": "General Freelance Marketplaces",
-                "description": "Broad range of projects across all fields",
-                "examples_type": "Upwork-style, Fiverr-style platforms",
-                "best_for": ["Beginners", "Diverse skills", "Building reviews"],
-                "typical_competition": "High"
-            },
-            {
-                "type": "Tech-Specific Platforms",
-                "description": "Focused on development and tech work",
-                "examples_type": "Toptal-style, developer-focused platforms",
-                "best_for": ["Experienced developers", "Higher rates"],
-                "typical_competition": "Medium"
-            },
-            {
-                "type": "Project-Based Platforms",
-                "description": "One-time projects and contests",
-                "examples_type": "99designs-style, contest platforms",
-                "best_for": ["Creative work", "Quick projects"],
-                "typical_competition": "High"
-            },
-            {
-                "type": "Direct Client Outreach",
-                "description": "Finding clients through networking",
-                "examples_type": "LinkedIn, personal network, cold outreach",
-                "best_for": ["Higher rates", "Long-term relationships"],
-                "typical_competition": "Low"
-            },
-            {
-                "type": "Local/Student Job Boards",
-                "description": "University and local opportunities",
-                "examples_type": "University job boards, local business networks",
-                "best_for": ["Students", "First experiences"],
-                "typical_competition": "Low"
-            }
-        ]
-    }
+    return _static_json_response(request, _PLATFORM_TYPES_BYTES)
 
 
 @router.get(
@@ -379,55 +512,17 @@ async def get_platform_types() -> dict:
     summary="Get Entry-Level Job Types",
     description="Get common entry-level job types by field"
 )
-async def get_job_types(field: str = "software") -> dict:
+async def get_job_types(request: Request, field: str = "software") -> Response:
     """Get common job types by field."""
-    job_types = {
-        "software": [
-            "Junior Software Developer",
-            "Software Engineering Intern",
-            "Junior Backend Developer",
-            "Junior Frontend Developer",
-            "QA Tester / QA Intern"
-        ],
-        "data": [
-            "Junior Data Analyst",
-            "Data Science Intern",
-            "Business Intelligence Intern",
-            "Data Entry Specialist",
-            "Junior Data Engineer"
-        ],
-        "web": [
-            "Junior Web Developer",
-            "Frontend Developer Intern",
-            "WordPress Developer",
-            "Junior Full Stack Developer",
-            "Web Development Intern"
-        ],
-        "mobile": [
-            "Junior Mobile Developer",
-            "iOS/Android Intern",
-            "Junior React Native Developer",
-            "Mobile App Tester"
-        ],
-        "devops": [
-            "Junior DevOps Engineer",
-            "IT Support Intern",
-            "Junior System Administrator",
-            "Cloud Support Associate"
-        ],
-        "ai": [
-            "AI/ML Intern",
-            "Junior Machine Learning Engineer",
-            "Data Annotation Specialist",
-            "AI Research Assistant"
-        ]
-    }
-    
-    return {
-        "field": field,
-        "job_types": job_types.get(field.lower(), job_types["software"]),
-        "all_fields": list(job_types.keys())
-    }
+    content = _JOB_TYPES_BYTES.get(field)
+    if content is None:
+        # The response echoes `field` as given, so only exact keys are precomputed
+        content = orjson.dumps({
+            "field": field,
+            "job_types": _JOB_TYPES.get(field.lower(), _JOB_TYPES["software"]),
+            "all_fields": list(_JOB_TYPES)
+        })
+    return _static_json_response(request, content)
 
 
 @router.get(
@@ -435,43 +530,16 @@ async def get_job_types(field: str = "software") -> dict:
     summary="Get Common Freelance Gig Types",
     description="Get common freelance gig types by skill area"
 )
-async def get_freelance_gigs(skill_area: str = "python") -> dict:
+async def get_freelance_gigs(request: Request, skill_area: str = "python") -> Response:
     """Get common freelance gig types by skill."""
-    gigs = {
-        "python": [
-            {"gig": "Web Scraping", "earning": "$50-300/project"},
-            {"gig": "Data Cleaning", "earning": "$30-200/project"},
-            {"gig": "Automation Scripts", "earning": "$50-500/project"},
-            {"gig": "API Integration", "earning": "$100-500/project"},
-            {"gig": "Django/Flask Apps", "earning": "$200-1000/project"}
-        ],
-        "javascript": [
-            {"gig": "React Components", "earning": "$50-300/project"},
-            {"gig": "Landing Pages", "earning": "$100-500/project"},
-            {"gig": "Bug Fixing", "earning": "$20-100/bug"},
-            {"gig": "Website Updates", "earning": "$50-200/project"},
-            {"gig": "Node.js API", "earning": "$150-600/project"}
-        ],
-        "data": [
-            {"gig": "Excel/Sheets Work", "earning": "$20-100/project"},
-            {"gig": "Data Visualization", "earning": "$50-300/project"},
-            {"gig": "Dashboard Creation", "earning": "$100-500/project"},
-            {"gig": "Data Entry", "earning": "$10-50/hour"},
-            {"gig": "Survey Analysis", "earning": "$50-200/project"}
-        ],
-        "design": [
-            {"gig": "Logo Design", "earning": "$50-200/project"},
-            {"gig": "Social Media Graphics", "earning": "$20-100/set"},
-            {"gig": "UI Mockups", "earning": "$100-400/project"},
-            {"gig": "Presentation Design", "earning": "$50-200/project"}
-        ]
-    }
-    
-    return {
-        "skill_area": skill_area,
-        "gig_types": gigs.get(skill_area.lower(), gigs["python"]),
-        "all_skill_areas": list(gigs.keys())
-    }
+    content = _FREELANCE_GIGS_BYTES.get(skill_area)
+    if content is None:
+        content = orjson.dumps({
+            "skill_area": skill_area,
+            "gig_types": _FREELANCE_GIGS.get(skill_area.lower(), _FREELANCE_GIGS["python"]),
+            "all_skill_areas": list(_FREELANCE_GIGS)
+        })
+    return _static_json_response(request, content)
 
 
 # ============================================
@@ -503,7 +571,7 @@ Set in your .env file:
 async def search_jobs_live(request: LiveJobSearchRequest) -> LiveJobSearchResponse:
     """Search for jobs using live APIs."""
     try:
-        agent = WorkRecommendationAgent()
+        agent = get_work_agent()
         
         result = await agent.search_jobs_live(
             keywords=request.keywords,
@@ -512,14 +580,26 @@ async def search_jobs_live(request: LiveJobSearchRequest) -> LiveJobSearchRespon
             limit=request.limit
         )
         
-        logger.info(f"Found {result.total_results} jobs from {len(result.providers_used)} providers")
+        logger.info(
+            "Found %d jobs from %d providers", result.total_results, len(result.providers_used),
+            extra={"total_results": result.total_results, "providers": result.providers_used},
+        )
         return result
         
     except Exception as e:
-        logger.error(f"Error in live job search: {e}")
+        logger.error("Error in live job search: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@lru_cache(maxsize=1024)
+def _query_keywords(q: str) -> Tuple[str, ...]:
+    """Split a search query into keywords, dropping case-insensitive repeats."""
+    keywords = {}
+    for word in q.split():
+        keywords.setdefault(word.casefold(), word)
+    return tuple(keywords.values())
+
+
 @router.get(
     "/search/jobs/quick",
     response_model=LiveJobSearchResponse,
@@ -534,18 +614,17 @@ async def quick_job_search(
 ) -> LiveJobSearchResponse:
     """Quick job search with GET request."""
     try:
-        agent = WorkRecommendationAgent()
-        keywords = q.split()
+        agent = get_work_agent()
         
         return await agent.search_jobs_live(
-            keywords=keywords,
+            keywords=list(_query_keywords(q)),
             location=location,
             job_type=job_type,
             limit=limit
         )
         
     except Exception as e:
-        logger.error(f"Error in quick job search: {e}")
+        logger.error("Error in quick job search: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -572,18 +651,21 @@ Each URL is pre-filled with your skills as search terms!
 async def get_freelance_search_urls(request: FreelanceURLsRequest) -> FreelanceSearchResponse:
     """Get freelance platform search URLs."""
     try:
-        agent = WorkRecommendationAgent()
+        agent = get_work_agent()
         
         result = agent.get_freelance_urls(
             skills=request.skills,
             gig_types=request.gig_types if request.gig_types else None
         )
         
-        logger.info(f"Generated URLs for {len(result.platforms)} platforms")
+        logger.info(
+            "Generated URLs for %d platforms", len(result.platforms),
+            extra={"platform_count": len(result.platforms)},
+        )
         return result
         
     except Exception as e:
-        logger.error(f"Error getting freelance URLs: {e}")
+        logger.error("Error getting freelance URLs: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -598,13 +680,13 @@ async def quick_freelance_urls(
 ) -> FreelanceSearchResponse:
     """Quick freelance URLs with GET request."""
     try:
-        agent = WorkRecommendationAgent()
+        agent = get_work_agent()
         skill_list = [s.strip() for s in skills.split(",")]
         
         return agent.get_freelance_urls(skills=skill_list)
         
     except Exception as e:
-        logger.error(f"Error getting quick freelance URLs: {e}")
+        logger.error("Error getting quick freelance URLs: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -627,24 +709,9 @@ This is the most comprehensive endpoint - use it to get everything at once!
 async def full_work_search(request: FullSearchRequest) -> FullWorkSearchResponse:
     """Get complete work search with AI + live APIs + URLs."""
     try:
-        agent = WorkRecommendationAgent()
-        
-        # Convert to QuickWorkRequest first
-        quick_request = QuickWorkRequest(
-            career_goal=request.career_goal,
-            field_of_interest=request.field_of_interest,
-            skills=request.skills,
-            current_level=request.current_level,
-            tools_known=request.tools_known,
-            projects_done=request.projects_done,
-            hours_per_week=request.hours_per_week,
-            currently_learning=request.currently_learning,
-            strong_areas=request.strong_areas,
-            weak_areas=request.weak_areas
-        )
+        agent = get_work_agent()
         
-        # Convert to full input
-        input_data = WorkRecommendationAgent.from_quick_request(quick_request)
+        input_data = WorkRecommendationAgent.from_quick_request(request)
         
         result = await agent.get_full_recommendations(
             input_data=input_data,
@@ -655,25 +722,75 @@ async def full_work_search(request: FullSearchRequest) -> FullWorkSearchResponse
         return result
         
     except Exception as e:
-        logger.error(f"Error in full work search: {e}")
+        logger.error("Error in full work search: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post(
+    "/search/full/stream",
+    summary="🚀 Full Work Search, streamed (Server-Sent Events)",
+    description="""
+## Full work search, streamed section by section
+
+Same content as `/search/full`, sent as Server-Sent Events so the cheap parts
+arrive before the AI finishes. Events, in order:
+
+1. `freelance_platforms` - skill-based freelance URLs (immediately)
+2. `live_jobs` and `ai_recommendations` - whichever finishes first
+3. `freelance_platforms` - again, now including AI-suggested gig types
+4. `quick_links`
+
+On failure an `error` event with a `detail` message ends the stream.
+"""
+)
+async def full_work_search_stream(request: FullSearchRequest) -> StreamingResponse:
+    """Stream the full work search as each section becomes ready."""
+    agent = get_work_agent()
+    input_data = WorkRecommendationAgent.from_quick_request(request)
+    
+    async def events() -> AsyncIterator[bytes]:
+        try:
+            async for section, payload in agent.stream_full_recommendations(
+                input_data=input_data,
+                location=request.location
+            ):
+                if isinstance(payload, BaseModel):
+                    payload = payload.model_dump(mode="json")
+                yield format_sse(section, payload)
+            logger.info("Streamed full work search response")
+        except Exception as e:
+            logger.error("Error in streamed full work search: %s", e)
+            yield format_sse("error", {"detail": str(e)})
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 # ============================================
 # API Status Endpoint
 # ============================================
 
+# Provider configuration only changes on restart, so the status body is reused briefly
+API_STATUS_TTL_SECONDS = 60
+_api_status_cache: Tuple[float, bytes] = (0.0, b"")
+
+
 @router.get(
     "/api-status",
     summary="Check API Configuration Status",
     description="Check which job search APIs are configured and available"
 )
-async def check_api_status() -> dict:
+async def check_api_status() -> Response:
     """Check which APIs are configured."""
-    agent = WorkRecommendationAgent()
+    global _api_status_cache
+    now = time.monotonic()
+    cached_at, content = _api_status_cache
+    if content and now - cached_at < API_STATUS_TTL_SECONDS:
+        return Response(content=content, media_type="application/json")
+    
+    agent = get_work_agent()
     providers = agent.get_api_status()
     
-    return {
+    content = orjson.dumps({
         "status": "ok",
         "providers": providers,
         "free_apis": ["remotive", "arbeitnow"],
@@ -686,4 +803,6 @@ async def check_api_status() -> dict:
             "adzuna": ["ADZUNA_APP_ID", "ADZUNA_APP_KEY"],
             "jsearch": ["RAPIDAPI_KEY"]
         }
-    }
\ No newline at end of file
+    })
+    _api_status_cache = (now, content)
+    return Response(content=content, media_type="application/json")
@@ -25,6 +25,23 @@ class Settings:
     search_provider: str
     max_results: int
     top_k: int
+    
+    # Distinct match queries searched per run; each search spends paid SerpAPI credits
+    max_search_queries: int
+    
+    # Work agent caches (LLM completions and parsed recommendations)
+    work_agent_cache_size: int
+    work_agent_cache_ttl_seconds: float
+    
+    # Response cache for idempotent LLM-backed endpoints
+    response_cache_size: int
+    response_cache_ttl_seconds: float
+    
+    # Upper bound on concurrent batch LLM calls across all requests
+    llm_max_concurrency: int
+    
+    # Seconds before a slow job search provider is dropped
+    job_provider_timeout_seconds: float
 
 
 def _load_settings() -> Settings:
@@ -44,6 +61,13 @@ def _load_settings() -> Settings:
         search_provider=os.getenv("SEARCH_PROVIDER", "mock"),
         max_results=int(os.getenv("MAX_RESULTS", "20")),
         top_k=int(os.getenv("TOP_K", "5")),
+        max_search_queries=int(os.getenv("MAX_SEARCH_QUERIES", "1")),
+        work_agent_cache_size=int(os.getenv("WORK_AGENT_CACHE_SIZE", "512")),
+        work_agent_cache_ttl_seconds=float(os.getenv("WORK_AGENT_CACHE_TTL", "3600")),
+        response_cache_size=int(os.getenv("RESPONSE_CACHE_SIZE", "1024")),
+        response_cache_ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL", str(24 * 3600))),
+        llm_max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "32")),
+        job_provider_timeout_seconds=float(os.getenv("JOB_PROVIDER_TIMEOUT", "3.0")),
     )
 
 
@@ -1,7 +1,9 @@
 """LangGraph state definition for the interview workflow."""
 from __future__ import annotations
 
-from typing import TypedDict, Optional, List, Dict, Any
+import operator
+from types import MappingProxyType
+from typing import Annotated, TypedDict, Optional, List, Dict, Any
 
 from app.models.interview_schemas import (
     InterviewConfig,
@@ -35,9 +37,9 @@ class InterviewGraphState(TypedDict, total=False):
     current_question: str
     current_answer: str
     
-    # History
-    answers: List[QuestionAnswer]
-    evaluations: List[AnswerEvaluation]
+    # History; nodes return only new entries, which are appended
+    answers: Annotated[List[QuestionAnswer], operator.add]
+    evaluations: Annotated[List[AnswerEvaluation], operator.add]
     
     # Memory tracking
     memory: InterviewMemory
@@ -59,7 +61,7 @@ class InterviewGraphState(TypedDict, total=False):
 
 
 # State constants for interview flow
-STATE_QUESTION_LIMITS = {
+STATE_QUESTION_LIMITS = MappingProxyType({
     InterviewState.INTRO: 1,
     InterviewState.WARMUP: 1,
     InterviewState.CORE_QUESTIONS: 3,
@@ -67,7 +69,7 @@ STATE_QUESTION_LIMITS = {
     InterviewState.COMMUNICATION_TEST: 1,
     InterviewState.CLOSING: 1,
     InterviewState.FEEDBACK: 0,
-}
+})
 
 STATE_ORDER = [
     InterviewState.INTRO,
@@ -79,6 +81,9 @@ STATE_ORDER = [
     InterviewState.FEEDBACK,
 ]
 
+# Successor of each state; the last state (and anything unknown) leads to FEEDBACK
+_NEXT_STATE = MappingProxyType(dict(zip(STATE_ORDER, STATE_ORDER[1:])))
+
 
 def get_next_state(current_state: InterviewState | str) -> InterviewState:
     """Get the next state in the interview flow."""
@@ -89,13 +94,7 @@ def get_next_state(current_state: InterviewState | str) -> InterviewState:
         except ValueError:
             return InterviewState.FEEDBACK
     
-    try:
-        current_index = STATE_ORDER.index(current_state)
-        if current_index < len(STATE_ORDER) - 1:
-            return STATE_ORDER[current_index + 1]
-    except ValueError:
-        pass
-    return InterviewState.FEEDBACK
+    return _NEXT_STATE.get(current_state, InterviewState.FEEDBACK)
 
 
 def get_questions_for_state(state: InterviewState | str) -> int:
@@ -42,6 +42,8 @@ report_agent = ReportGeneratorAgent()
 session_agent = SessionManagerAgent()
 
 
+# Nodes return only the keys they change; LangGraph merges them into the state.
+
 def analyze_answer(state: InterviewGraphState) -> InterviewGraphState:
     """Node: Analyze the candidate's answer."""
     logger.info("Analyzing answer...")
@@ -65,26 +67,24 @@ def analyze_answer(state: InterviewGraphState) -> InterviewGraphState:
         evaluation=evaluation,
     )
     
-    # Update lists
-    answers = state.get("answers", [])
-    evaluations = state.get("evaluations", [])
-    answers.append(qa_pair)
-    evaluations.append(evaluation)
-    
+    # The list reducers append the new entries to the history
     return {
-        **state,
         "evaluation_result": evaluation,
-        "answers": answers,
-        "evaluations": evaluations,
+        "answers": [qa_pair],
+        "evaluations": [evaluation],
         "questions_asked": state.get("questions_asked", 0) + 1,
     }
 
 
+# The nodes below run in the same step
+PARALLEL_ANALYSIS_NODES = ("update_memory", "analyze_communication", "adjust_difficulty")
+
+
 def update_memory(state: InterviewGraphState) -> InterviewGraphState:
     """Node: Update the interview memory."""
     logger.info("Updating memory...")
     
-    current_memory = state.get("memory", InterviewMemory())
+    current_memory = state.get("memory") or InterviewMemory()
     evaluations = state.get("evaluations", [])
     
     updated_memory = memory_agent.update_simple(
@@ -100,7 +100,6 @@ def update_memory(state: InterviewGraphState) -> InterviewGraphState:
         overall_score = sum(e.average_score for e in evaluations) / len(evaluations)
     
     return {
-        **state,
         "memory": updated_memory,
         "overall_score": overall_score,
     }
@@ -112,7 +111,7 @@ def analyze_communication(state: InterviewGraphState) -> InterviewGraphState:
     
     # Only analyze if we have enough answers
     if len(answers) < 2:
-        return state
+        return {}
     
     logger.info("Analyzing communication patterns...")
     
@@ -124,7 +123,6 @@ def analyze_communication(state: InterviewGraphState) -> InterviewGraphState:
     )
     
     return {
-        **state,
         "communication_analysis": comm_analysis,
     }
 
@@ -142,7 +140,6 @@ def adjust_difficulty(state: InterviewGraphState) -> InterviewGraphState:
     )
     
     return {
-        **state,
         "difficulty_adjustment": adjustment,
         "current_difficulty": adjustment.new_difficulty,
     }
@@ -172,7 +169,6 @@ def check_state_transition(state: InterviewGraphState) -> InterviewGraphState:
     is_complete = new_state == InterviewState.FEEDBACK
     
     return {
-        **state,
         "state_transition": transition,
         "current_state": new_state,
         "is_complete": is_complete,
@@ -184,7 +180,7 @@ def generate_next_question(state: InterviewGraphState) -> InterviewGraphState:
     logger.info("Generating next question...")
     
     config = state["config"]
-    memory = state.get("memory", InterviewMemory())
+    memory = state.get("memory") or InterviewMemory()
     
     question = interviewer_agent.generate_question_sync(
         config=config,
@@ -194,10 +190,7 @@ def generate_next_question(state: InterviewGraphState) -> InterviewGraphState:
         memory=memory,
     )
     
-    return {
-        **state,
-        "next_question": question,
-    }
+    return {"next_question": question}
 
 
 def generate_report(state: InterviewGraphState) -> InterviewGraphState:
@@ -208,7 +201,7 @@ def generate_report(state: InterviewGraphState) -> InterviewGraphState:
     
     config = state["config"]
     answers = state.get("answers", [])
-    memory = state.get("memory", InterviewMemory())
+    memory = state.get("memory") or InterviewMemory()
     
     report = report_agent.generate_sync(
         session_id=UUID(state["session_id"]) if isinstance(state["session_id"], str) else state["session_id"],
@@ -218,7 +211,6 @@ def generate_report(state: InterviewGraphState) -> InterviewGraphState:
     )
     
     return {
-        **state,
         "final_report": report,
         "is_complete": True,
     }
@@ -247,10 +239,12 @@ def create_interview_graph() -> StateGraph:
     
     # Define edges
     builder.add_edge(START, "analyze_answer")
-    builder.add_edge("analyze_answer", "update_memory")
-    builder.add_edge("update_memory", "analyze_communication")
-    builder.add_edge("analyze_communication", "adjust_difficulty")
-    builder.add_edge("adjust_difficulty", "check_state_transition")
+    
+    # Memory, communication and difficulty only depend on the evaluation and write
+    # disjoint keys, so they run in parallel and join before the state transition
+    for node in PARALLEL_ANALYSIS_NODES:
+        builder.add_edge("analyze_answer", node)
+    builder.add_edge(list(PARALLEL_ANALYSIS_NODES), "check_state_transition")
     
     # Conditional edge based on state
     builder.add_conditional_edges(
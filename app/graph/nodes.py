@@ -1,6 +1,8 @@
 """LangGraph node functions for the matching workflow."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 from datetime import datetime
 from uuid import uuid4
@@ -12,11 +14,14 @@ from app.graph.state import MatchState
 from app.models.schemas import (
     MatchResultRun,
     OpportunityClean,
+    OpportunityRaw,
     OpportunityScore,
     QuerySpec,
     SkillBuckets,
     UserProfile,
 )
+from app.services.cache import TTLCache
+from app.services.openai_client import get_shared_llm_client
 from app.services.search_client import get_search_client
 
 logger = logging.getLogger("matcher")
@@ -36,6 +41,7 @@ TRACK_TITLES = {
     "cybersecurity": ["Cybersecurity Intern", "Security Analyst Intern"],
     "business": ["Business Analyst Intern", "Product Intern"],
 }
+DEFAULT_TITLES = ("Intern", "Internship")
 
 RUBRIC = {
     "track_alignment": 30,
@@ -45,6 +51,26 @@ RUBRIC = {
     "readiness": 10,
 }
 
+# Search results are shared across requests; empty results are cached
+# briefly so repeated misses do not hit the backend again.
+SEARCH_CACHE_TTL_SECONDS = 3600
+EMPTY_SEARCH_CACHE_TTL_SECONDS = 300
+_search_cache = TTLCache(maxsize=256, ttl_seconds=SEARCH_CACHE_TTL_SECONDS)
+
+# Search results repeat for an hour, so the same (profile, opportunity) pairs
+# come back across runs; successful AI scores are reused for as long.
+SCORE_CACHE_TTL_SECONDS = 3600
+_score_cache = TTLCache(maxsize=4096, ttl_seconds=SCORE_CACHE_TTL_SECONDS)
+
+# Neutral score given to an opportunity the AI could not score
+FALLBACK_SCORE = 50
+FALLBACK_REASONS = ("General internship opportunity.",)
+
+
+def _fallback_score() -> tuple[int, list[str]]:
+    """Score and reasons for an opportunity without an AI score."""
+    return FALLBACK_SCORE, list(FALLBACK_REASONS)
+
 
 # ============ Node Functions ============
 
@@ -86,7 +112,7 @@ def build_queries(state: MatchState, config: RunnableConfig) -> dict:
     """Build search queries based on user profile with location-specific targeting."""
     profile = state["profile"]
     
-    titles = TRACK_TITLES.get(profile.track, ["Intern", "Internship"])
+    titles = TRACK_TITLES.get(profile.track, DEFAULT_TITLES)
     skills = profile.skills.hard + profile.skills.tools
     skill_clause = " ".join(sorted(set(skills))[:3]) if skills else ""
     
@@ -94,9 +120,6 @@ def build_queries(state: MatchState, config: RunnableConfig) -> dict:
     
     if profile.location_preference == "egypt":
         # Egypt-specific queries - target Egyptian companies and locations
-        egypt_locations = ["Cairo", "Alexandria", "Giza", "Egypt"]
-        egypt_companies = ["Vodafone Egypt", "Orange Egypt", "Valeo", "Dell Egypt", "IBM Egypt", "Microsoft Egypt"]
-        
         for title in titles[:2]:
             # Query 1: Direct Egypt search
             queries.append(QuerySpec(
@@ -166,30 +189,100 @@ def build_queries(state: MatchState, config: RunnableConfig) -> dict:
     return {"queries": queries}
 
 
+def _add_unseen(
+    results: list[OpportunityRaw],
+    merged: list[OpportunityRaw],
+    seen_urls: set[str],
+    seen_title_company: set[tuple[str, str]],
+) -> None:
+    """Append results whose URL and title/company pair are both new to `merged`."""
+    for r in results:
+        title_company = (r.title.casefold(), r.company.casefold())
+        if r.url in seen_urls or title_company in seen_title_company:
+            continue
+        if r.url:
+            seen_urls.add(r.url)
+        seen_title_company.add(title_company)
+        merged.append(r)
+
+
+def _cached_search(query: str, limit: int) -> list[OpportunityRaw]:
+    """Run a search through the shared cache, keyed on query and limit."""
+    cache_key = (query, limit)
+    results = _search_cache.get(cache_key)
+    if results is None:
+        results = get_search_client().search(query, limit)
+        ttl = SEARCH_CACHE_TTL_SECONDS if results else EMPTY_SEARCH_CACHE_TTL_SECONDS
+        _search_cache.set(cache_key, results, ttl_seconds=ttl)
+    return results
+
+
 def retrieve_opportunities(state: MatchState, config: RunnableConfig) -> dict:
     """Retrieve exactly MAX_RESULTS opportunities from search provider.
     
-    Uses a single search call to limit API usage to max 10 calls.
+    Each search can spend several paid API credits, so only the first
+    MAX_SEARCH_QUERIES distinct queries (one by default) are searched, and
+    later ones only while results are still short of MAX_RESULTS. Results
+    are deduplicated by URL and by title/company as they arrive.
     """
-    queries = state["queries"]
-    profile = state["profile"]
-    client = get_search_client()
+    all_results: list[OpportunityRaw] = []
+    seen_urls: set[str] = set()
+    seen_title_company: set[tuple[str, str]] = set()
+    required_count = settings.max_results
+    
+    for query in _search_queries(state["queries"]):
+        results = _cached_search(query.query, required_count)
+        _add_unseen(results, all_results, seen_urls, seen_title_company)
+        
+        # The search client already runs several variations per query
+        if len(all_results) >= required_count:
+            break
+    
+    return _retrieved_update(all_results, required_count)
+
+
+async def aretrieve_opportunities(state: MatchState, config: RunnableConfig) -> dict:
+    """Async version of retrieve_opportunities.
     
-    all_results = []
-    seen_urls = set()
+    The first query usually fills MAX_RESULTS on its own, so it is issued
+    alone; only when it comes back short are the remaining queries within
+    MAX_SEARCH_QUERIES searched concurrently. Results are merged in query order, so the outcome matches
+    the sequential node.
+    """
+    search_queries = _search_queries(state["queries"])
     required_count = settings.max_results
+    if not search_queries:
+        return _retrieved_update([], required_count)
     
-    # Use only the first query to trigger a single search session (max 10 API calls)
-    # The search client internally handles multiple search variations
-    if queries:
-        main_query = queries[0]
-        results = client.search(main_query.query, required_count)
-        for r in results:
-            if r.url not in seen_urls:
-                seen_urls.add(r.url)
-                all_results.append(r)
+    first, *rest = search_queries
+    result_lists = [await asyncio.to_thread(_cached_search, first.query, required_count)]
+    if rest and len(_merge_results(result_lists)) < required_count:
+        result_lists += await asyncio.gather(*(
+            asyncio.to_thread(_cached_search, query.query, required_count)
+            for query in rest
+        ))
     
-    # Ensure we return exactly the required count (or all if less available)
+    return _retrieved_update(_merge_results(result_lists), required_count)
+
+
+def _search_queries(queries: list[QuerySpec]) -> list[QuerySpec]:
+    """Distinct query texts within the per-run search budget (MAX_SEARCH_QUERIES)."""
+    unique = list({q.query: q for q in queries}.values())
+    return unique[:settings.max_search_queries]
+
+
+def _merge_results(result_lists: list[list[OpportunityRaw]]) -> list[OpportunityRaw]:
+    """Concatenate per-query results in order, skipping opportunities already seen."""
+    merged: list[OpportunityRaw] = []
+    seen_urls: set[str] = set()
+    seen_title_company: set[tuple[str, str]] = set()
+    for results in result_lists:
+        _add_unseen(results, merged, seen_urls, seen_title_company)
+    return merged
+
+
+def _retrieved_update(all_results: list[OpportunityRaw], required_count: int) -> dict:
+    """Trim merged results to the required count (or all if less available)."""
     final_results = all_results[:required_count]
     
     logger.info("Retrieved opportunities", extra={"count": len(final_results), "required": required_count})
@@ -197,18 +290,12 @@ def retrieve_opportunities(state: MatchState, config: RunnableConfig) -> dict:
 
 
 def clean_opportunities(state: MatchState, config: RunnableConfig) -> dict:
-    """Clean and deduplicate opportunities."""
+    """Clean opportunities; retrieval has already deduplicated them."""
     raw_opportunities = state["raw_opportunities"]
     
-    seen = set()
     cleaned = []
     
     for item in raw_opportunities:
-        key = (item.title.lower(), item.company.lower())
-        if key in seen:
-            continue
-        seen.add(key)
-        
         # Infer work type from location
         location_lower = item.location.lower()
         if "remote" in location_lower:
@@ -240,41 +327,89 @@ def score_opportunities(state: MatchState, config: RunnableConfig) -> dict:
     profile = state["profile"]
     opportunities = state["clean_opportunities"]
     
-    from app.services.openai_client import OpenAIClient
-    from app.config import settings
-    ai_client = OpenAIClient(api_key=settings.openai_api_key)
+    ai_client = get_shared_llm_client()
+    
+    if ai_client is None:
+        # No provider configured: skip the per-item AI calls
+        results = [_fallback_score() for _ in opportunities]
+    else:
+        profile_json = profile.model_dump_json()
+        results = []
+        for opp in opportunities:
+            key = _score_key(profile_json, opp)
+            ai_result = _score_cache.get(key)
+            if ai_result is None:
+                # Use AI to generate score and reasons
+                ai_result = ai_client.score_opportunity_ai(
+                    profile=profile,
+                    opportunity=opp
+                )
+                if ai_result:
+                    _score_cache.set(key, ai_result)
+            if ai_result:
+                results.append((ai_result["score"], ai_result["reasons"]))
+            else:
+                # Fallback to basic scoring if AI fails
+                results.append(_fallback_score())
+    
+    return _scored_update(opportunities, results)
+
+
+async def ascore_opportunities(state: MatchState, config: RunnableConfig) -> dict:
+    """Async version of score_opportunities that scores all opportunities concurrently."""
+    profile = state["profile"]
+    opportunities = state["clean_opportunities"]
+    
+    ai_client = get_shared_llm_client()
+    
+    if ai_client is None:
+        results = [_fallback_score() for _ in opportunities]
+    else:
+        profile_json = profile.model_dump_json()
+        keys = [_score_key(profile_json, opp) for opp in opportunities]
+        ai_results = [_score_cache.get(key) for key in keys]
+        misses = [i for i, ai_result in enumerate(ai_results) if ai_result is None]
+        fetched = await asyncio.gather(*(
+            ai_client.ascore_opportunity_ai(profile=profile, opportunity=opportunities[i])
+            for i in misses
+        ))
+        for i, ai_result in zip(misses, fetched):
+            ai_results[i] = ai_result
+            if ai_result:
+                _score_cache.set(keys[i], ai_result)
+        results = [
+            (ai_result["score"], ai_result["reasons"]) if ai_result
+            else _fallback_score()
+            for ai_result in ai_results
+        ]
     
-    scored = []
-    for opp in opportunities:
-        # Use AI to generate score and reasons
-        ai_result = ai_client.score_opportunity_ai(
-            profile=profile,
-            opportunity=opp
+    return _scored_update(opportunities, results)
+
+
+def _score_key(profile_json: str, opportunity: OpportunityClean) -> str:
+    """Cache key for an AI score: the full profile and opportunity content."""
+    payload = f"{profile_json}\x1f{opportunity.model_dump_json()}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _scored_update(
+    opportunities: list[OpportunityClean],
+    results: list[tuple[int, list[str]]],
+) -> dict:
+    """Pair opportunities with their (score, reasons) into the state update."""
+    scored = [
+        OpportunityScore(
+            title=opp.title,
+            company=opp.company,
+            location=opp.location,
+            url=opp.url,
+            source=opp.source,
+            work_type=opp.work_type,
+            score=score,
+            reasons=reasons,
         )
-        
-        if ai_result:
-            scored.append(OpportunityScore(
-                title=opp.title,
-                company=opp.company,
-                location=opp.location,
-                url=opp.url,
-                source=opp.source,
-                work_type=opp.work_type,
-                score=ai_result["score"],
-                reasons=ai_result["reasons"],
-            ))
-        else:
-            # Fallback to basic scoring if AI fails
-            scored.append(OpportunityScore(
-                title=opp.title,
-                company=opp.company,
-                location=opp.location,
-                url=opp.url,
-                source=opp.source,
-                work_type=opp.work_type,
-                score=50,
-                reasons=["General internship opportunity."],
-            ))
+        for opp, (score, reasons) in zip(opportunities, results)
+    ]
     
     logger.info("Scored opportunities", extra={"count": len(scored)})
     return {"scored_opportunities": scored}
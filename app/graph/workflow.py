@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, START, END
 
 from app.graph.state import MatchState
@@ -10,8 +11,10 @@ from app.graph.nodes import (
     normalize_profile,
     build_queries,
     retrieve_opportunities,
+    aretrieve_opportunities,
     clean_opportunities,
     score_opportunities,
+    ascore_opportunities,
     rank_opportunities,
     build_result,
 )
@@ -29,9 +32,16 @@ def create_match_graph() -> StateGraph:
     # Add nodes
     builder.add_node("normalize_profile", normalize_profile)
     builder.add_node("build_queries", build_queries)
-    builder.add_node("retrieve_opportunities", retrieve_opportunities)
+    # ainvoke searches and scores concurrently; invoke keeps the sequential path
+    builder.add_node(
+        "retrieve_opportunities",
+        RunnableLambda(retrieve_opportunities, afunc=aretrieve_opportunities),
+    )
     builder.add_node("clean_opportunities", clean_opportunities)
-    builder.add_node("score_opportunities", score_opportunities)
+    builder.add_node(
+        "score_opportunities",
+        RunnableLambda(score_opportunities, afunc=ascore_opportunities),
+    )
     builder.add_node("rank_opportunities", rank_opportunities)
     builder.add_node("build_result", build_result)
     
@@ -66,3 +76,11 @@ class MatchWorkflow:
         final_state = self.graph.invoke(initial_state)
         
         return final_state["result"]
+    
+    async def arun(self, user_input: UserInput) -> MatchResultRun:
+        """Execute the matching workflow without blocking the event loop."""
+        initial_state: MatchState = {"user_input": user_input}
+        
+        final_state = await self.graph.ainvoke(initial_state)
+        
+        return final_state["result"]
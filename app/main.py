@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.match import router as match_router
 from app.api.interview import router as interview_router
@@ -13,12 +15,24 @@ from app.api.recap import router as recap_router
 from app.api.recommender import router as recommender_router
 from app.api.cv import router as cv_router
 from app.api.advisor import router as advisor_router
-from app.api.work import router as work_router
+from app.api.work import router as work_router, warm_up as warm_up_work
 from app.api.profiling import router as profiling_router
 from app.api.project import router as project_router
+from app.services.http import close_llm_http_client
+from app.services.work_search_client import close_search_http_client
 
 logging.basicConfig(level=logging.INFO)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up lazily built agents on startup; release shared upstream connections on shutdown."""
+    warm_up_work()
+    yield
+    await close_llm_http_client()
+    await close_search_http_client()
+
+
 app = FastAPI(
     title="Education Platform - Multi-Agent System",
     description="""
@@ -82,6 +96,7 @@ AI diagnostic system that builds structured student profiles through conversatio
 - 🧮 AI-Computed: Estimated Level & Readiness Risk Areas
     """,
     version="1.5.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -93,6 +108,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the large recap/work/match JSON bodies; SSE streams are left uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(match_router)
 app.include_router(interview_router)
@@ -4,6 +4,10 @@ from __future__ import annotations
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
+# Request size caps, enforced before any LLM call is made
+MAX_TOPIC_LENGTH = 500
+MAX_LECTURE_TEXT_LENGTH = 32_000
+
 
 # Input Models
 class LectureInput(BaseModel):
@@ -206,8 +210,10 @@ class CareerTranslation(BaseModel):
 # API Request/Response Models
 class TranslateLectureRequest(BaseModel):
     """API request to translate a lecture."""
-    lecture_topic: str = Field(description="The topic of the lecture")
-    lecture_text: Optional[str] = Field(default=None, description="Optional detailed lecture content")
+    lecture_topic: str = Field(max_length=MAX_TOPIC_LENGTH, description="The topic of the lecture")
+    lecture_text: Optional[str] = Field(
+        default=None, max_length=MAX_LECTURE_TEXT_LENGTH, description="Optional detailed lecture content"
+    )
     target_track: Optional[str] = Field(default=None, description="Target career track (e.g., 'Data Scientist', 'Backend Developer', 'DevOps Engineer')")
 
 
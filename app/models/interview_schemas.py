@@ -8,6 +8,10 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
+# Request size caps, enforced before any LLM call is made
+MAX_QUESTION_LENGTH = 4_000
+MAX_ANSWER_LENGTH = 16_000
+
 
 class InterviewState(str, Enum):
     """Interview state machine states."""
@@ -211,8 +215,8 @@ class StartInterviewResponse(BaseModel):
 class SubmitAnswerRequest(BaseModel):
     """Request to submit an answer."""
     session_id: UUID
-    question: str
-    answer: str
+    question: str = Field(max_length=MAX_QUESTION_LENGTH)
+    answer: str = Field(max_length=MAX_ANSWER_LENGTH)
 
 
 class SubmitAnswerResponse(BaseModel):
@@ -126,6 +126,36 @@ class RecapResponse(BaseModel):
     next_topics: List[str] = Field(default_factory=list, description="What to learn next")
 
 
+# ============================================
+# Partial Recap Response Models
+# ============================================
+
+class QuickSummaryResponse(BaseModel):
+    """Summary section of a recap."""
+    topic: str = Field(..., description="The lecture topic")
+    summary: LectureSummary = Field(..., description="Comprehensive lecture summary")
+    difficulty_level: str = Field(..., description="Overall topic difficulty")
+    estimated_study_time: str = Field(..., description="Time to master this topic")
+
+
+class StudyPlanResponse(BaseModel):
+    """Learning tracks, tips, and exercises of a recap."""
+    topic: str = Field(..., description="The lecture topic")
+    study_tips: List[StudyTip] = Field(default_factory=list, description="Tips for studying this topic")
+    learning_tracks: List[LearningTrack] = Field(default_factory=list, description="Different learning paths")
+    practice_exercises: List[PracticeExercise] = Field(default_factory=list, description="Exercises to practice")
+    milestones: List[LearningMilestone] = Field(default_factory=list, description="Learning milestones to achieve")
+    resources: List[LearningResource] = Field(default_factory=list, description="Recommended resources")
+
+
+class FlashcardsResponse(BaseModel):
+    """Quick reference material of a recap."""
+    topic: str = Field(..., description="The lecture topic")
+    quick_reference: QuickReference = Field(..., description="Quick reference materials")
+    key_concepts: List[KeyConcept] = Field(default_factory=list, description="Main concepts covered")
+    key_takeaways: List[str] = Field(default_factory=list, description="Main points to remember")
+
+
 # ============================================
 # Input Model
 # ============================================
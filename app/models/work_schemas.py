@@ -4,8 +4,8 @@ Work Recommendation Agent Schemas
 Data models for job and freelance opportunity recommendations.
 """
 
-from typing import List, Optional, Dict
-from pydantic import BaseModel, Field
+from typing import Any, List, Optional, Dict
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 from datetime import datetime
 
@@ -36,6 +36,23 @@ class JobDifficulty(str, Enum):
     HARD = "hard"
 
 
+# Lenient lookups for enum values coming back from the LLM
+_READINESS_BY_NAME = {level.value: level for level in WorkReadiness}
+_DIFFICULTY_BY_NAME = {
+    "easy_entry": JobDifficulty.EASY,
+    "easy": JobDifficulty.EASY,
+    "medium": JobDifficulty.MEDIUM,
+    "hard": JobDifficulty.HARD
+}
+
+
+def _coerce_difficulty(value):
+    """Map an LLM difficulty string onto JobDifficulty, defaulting to MEDIUM."""
+    if isinstance(value, str):
+        return _DIFFICULTY_BY_NAME.get(value.casefold(), JobDifficulty.MEDIUM)
+    return value
+
+
 # ============================================
 # Input Models
 # ============================================
@@ -96,6 +113,8 @@ class JobRecommendation(BaseModel):
         default_factory=list,
         description="Direct links to search for this job"
     )
+    
+    _normalize_difficulty = field_validator("difficulty", mode="before")(_coerce_difficulty)
 
 
 class FreelanceOpportunity(BaseModel):
@@ -117,6 +136,8 @@ class FreelanceOpportunity(BaseModel):
         default_factory=list,
         description="Direct links to find these gigs on platforms"
     )
+    
+    _normalize_difficulty = field_validator("difficulty", mode="before")(_coerce_difficulty)
 
 
 class IncomeStrategy(BaseModel):
@@ -152,6 +173,14 @@ class WorkReadinessAnalysis(BaseModel):
     strengths_for_work: List[str] = Field(..., description="Strengths they can leverage")
     gaps_to_address: List[str] = Field(..., description="Gaps to work on")
     recommended_path: str = Field(..., description="Recommended next steps")
+    
+    @field_validator("readiness_level", mode="before")
+    @classmethod
+    def _normalize_readiness(cls, value):
+        """Map an LLM readiness string onto WorkReadiness, defaulting to PRACTICE_FIRST."""
+        if isinstance(value, str):
+            return _READINESS_BY_NAME.get(value.casefold(), WorkReadiness.PRACTICE_FIRST)
+        return value
 
 
 # ============================================
@@ -317,7 +346,7 @@ class FullWorkSearchResponse(BaseModel):
     freelance_platforms: FreelanceSearchResponse
     
     # Combined quick links
-    quick_links: Dict[str, List[Dict]] = Field(
+    quick_links: Dict[str, Any] = Field(
         default_factory=dict,
         description="Quick access links organized by category"
     )
@@ -8,6 +8,7 @@ import logging
 from typing import Optional, Union
 
 from app.config import settings
+from app.services.http import get_llm_http_client
 
 from .base import LLMProvider, ProviderType
 from .openai_provider import OpenAIProvider
@@ -164,6 +165,7 @@ def get_langchain_llm(
             model=model or "gpt-4o-mini",
             temperature=temperature,
             api_key=settings.openai_api_key,
+            http_async_client=get_llm_http_client(),
         )
     
     elif provider_type == ProviderType.GEMINI:
@@ -187,6 +189,7 @@ def get_langchain_llm(
                 model=model or "llama-3.3-70b-versatile",
                 temperature=temperature,
                 groq_api_key=settings.groq_api_key,
+                http_async_client=get_llm_http_client(),
             )
         except ImportError:
             raise ImportError(
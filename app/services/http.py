@@ -0,0 +1,36 @@
+"""Process-wide HTTP client for upstream LLM API calls."""
+from __future__ import annotations
+
+import importlib.util
+from typing import Optional
+
+import httpx
+
+# HTTP/2 multiplexes concurrent LLM calls over one connection; it needs the
+# optional `h2` package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+LLM_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+LLM_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+_llm_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_llm_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client for LLM providers, creating it on first use."""
+    global _llm_http_client
+    if _llm_http_client is None or _llm_http_client.is_closed:
+        _llm_http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=LLM_HTTP_LIMITS,
+            timeout=LLM_HTTP_TIMEOUT,
+        )
+    return _llm_http_client
+
+
+async def close_llm_http_client() -> None:
+    """Close the shared LLM HTTP client (called on application shutdown)."""
+    global _llm_http_client
+    if _llm_http_client is not None:
+        await _llm_http_client.aclose()
+        _llm_http_client = None
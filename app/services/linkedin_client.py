@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 import time
 
 import requests
@@ -57,8 +58,11 @@ class LinkedInSerpAPIClient:
     
     def __init__(self, api_key: str) -> None:
         self.api_key = api_key
+        self.session = requests.Session()  # Keep-alive across searches
         self.request_count = 0
         self.last_request_time = 0
+        # The shared client is searched from worker threads; one request at a time
+        self._request_lock = threading.Lock()
     
     def _rate_limit(self) -> None:
         current_time = time.time()
@@ -215,7 +219,6 @@ class LinkedInSerpAPIClient:
             if credits_used >= max_searches:
                 break
             
-            self._rate_limit()
             credits_used += 1
             
             params = {
@@ -228,7 +231,9 @@ class LinkedInSerpAPIClient:
             
             try:
                 logger.info(f"LinkedIn search: {search_query}")
-                response = requests.get(self.SERPAPI_URL, params=params, timeout=30)
+                with self._request_lock:
+                    self._rate_limit()
+                    response = self.session.get(self.SERPAPI_URL, params=params, timeout=30)
                 response.raise_for_status()
                 data = response.json()
                 
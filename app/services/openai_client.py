@@ -149,6 +149,41 @@ Return ONLY a JSON array of strings, like:
         
         Returns a dict with 'score' (int 0-100) and 'reasons' (list of strings).
         """
+        try:
+            response = self._provider.complete(
+                prompt=self._build_score_prompt(profile, opportunity),
+                system_prompt="You are a helpful career advisor. Return only valid JSON.",
+                temperature=0.5,
+                max_tokens=400,
+            )
+            return self._parse_score(response.content)
+            
+        except Exception as e:
+            logger.error(f"LLM scoring error ({self._provider.provider_type.value}): {e}")
+            return None
+
+    async def ascore_opportunity_ai(
+        self,
+        profile: Any,
+        opportunity: Any,
+    ) -> dict[str, Any] | None:
+        """Async version of score_opportunity_ai."""
+        try:
+            response = await self._provider.acomplete(
+                prompt=self._build_score_prompt(profile, opportunity),
+                system_prompt="You are a helpful career advisor. Return only valid JSON.",
+                temperature=0.5,
+                max_tokens=400,
+            )
+            return self._parse_score(response.content)
+            
+        except Exception as e:
+            logger.error(f"LLM scoring error ({self._provider.provider_type.value}): {e}")
+            return None
+
+    @staticmethod
+    def _build_score_prompt(profile: Any, opportunity: Any) -> str:
+        """Build the scoring prompt for a profile/opportunity pair."""
         # Extract profile info
         user_track = getattr(profile, 'track', 'Not specified')
         user_year = getattr(profile, 'year_level', 'Not specified')
@@ -170,7 +205,7 @@ Return ONLY a JSON array of strings, like:
         job_location = getattr(opportunity, 'location', 'Unknown')
         description = getattr(opportunity, 'description', '')
         
-        prompt = f"""You are a career advisor scoring a job opportunity for a student.
+        return f"""You are a career advisor scoring a job opportunity for a student.
 
 **Student Profile:**
 - Track/Major: {user_track}
@@ -196,37 +231,28 @@ Return ONLY valid JSON in this exact format:
 {{"score": 75, "reasons": ["Reason 1", "Reason 2", "Reason 3"]}}
 """
 
-        try:
-            response = self._provider.complete(
-                prompt=prompt,
-                system_prompt="You are a helpful career advisor. Return only valid JSON.",
-                temperature=0.5,
-                max_tokens=400,
-            )
-            
-            content = response.content.strip()
-            
-            # Handle potential markdown code blocks
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-                content = content.strip()
-            
-            result = json.loads(content)
-            
-            if isinstance(result, dict) and "score" in result and "reasons" in result:
-                # Ensure score is within bounds
-                score = max(0, min(100, int(result["score"])))
-                reasons = result["reasons"] if isinstance(result["reasons"], list) else []
-                return {"score": score, "reasons": reasons[:5]}
-            
-            logger.warning("Invalid AI response format for scoring")
-            return None
-            
-        except Exception as e:
-            logger.error(f"LLM scoring error ({self._provider.provider_type.value}): {e}")
-            return None
+    @staticmethod
+    def _parse_score(content: str) -> dict[str, Any] | None:
+        """Parse a scoring response into {'score', 'reasons'}, or None if malformed."""
+        content = content.strip()
+        
+        # Handle potential markdown code blocks
+        if content.startswith("```"):
+            content = content.split("```")[1]
+            if content.startswith("json"):
+                content = content[4:]
+            content = content.strip()
+        
+        result = json.loads(content)
+        
+        if isinstance(result, dict) and "score" in result and "reasons" in result:
+            # Ensure score is within bounds
+            score = max(0, min(100, int(result["score"])))
+            reasons = result["reasons"] if isinstance(result["reasons"], list) else []
+            return {"score": score, "reasons": reasons[:5]}
+        
+        logger.warning("Invalid AI response format for scoring")
+        return None
 
 
 # Backward compatibility alias
@@ -254,6 +280,17 @@ def get_llm_client(
         return None
 
 
+_shared_llm_client: LLMClient | None = None
+
+
+def get_shared_llm_client() -> LLMClient | None:
+    """Get or create the LLMClient singleton for the configured provider."""
+    global _shared_llm_client
+    if _shared_llm_client is None:
+        _shared_llm_client = get_llm_client()
+    return _shared_llm_client
+
+
 def get_openai_client() -> LLMClient | None:
     """
     Get OpenAI client if API key is configured.
@@ -1,6 +1,7 @@
 """Interview Orchestrator - Coordinates all agents for interview flow."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, Optional
@@ -158,20 +159,24 @@ class InterviewOrchestrator:
             all_evaluations=self.session.evaluations,
         )
         
-        # 4. Analyze communication patterns (if enough answers)
-        comm_feedback = None
-        if len(self.session.answers) >= 2:
-            comm_feedback = await self.coach.analyze(
-                answers=self.session.answers,
-                communication_strictness=self.config.communication_strictness,
-            )
-        
-        # 5. Adjust difficulty
-        difficulty_adjustment = await self.difficulty_engine.adjust(
+        # 4-5. Analyze communication patterns (if enough answers) and adjust
+        # difficulty; the two LLM calls are independent, so run them concurrently
+        adjust_difficulty = self.difficulty_engine.adjust(
             evaluations=self.session.evaluations,
             current_difficulty=self.session.current_difficulty,
             current_state=self.session.current_state,
         )
+        if len(self.session.answers) >= 2:
+            comm_feedback, difficulty_adjustment = await asyncio.gather(
+                self.coach.analyze(
+                    answers=self.session.answers,
+                    communication_strictness=self.config.communication_strictness,
+                ),
+                adjust_difficulty,
+            )
+        else:
+            comm_feedback = None
+            difficulty_adjustment = await adjust_difficulty
         self.session.current_difficulty = difficulty_adjustment.new_difficulty
         
         # 6. Check state transition
@@ -0,0 +1,62 @@
+"""Response cache for idempotent LLM-backed endpoints."""
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Awaitable, Callable
+
+from pydantic import BaseModel
+
+from app.config import settings
+from app.services.cache import SingleFlight, TTLCache
+
+_response_cache = TTLCache(
+    maxsize=settings.response_cache_size,
+    ttl_seconds=settings.response_cache_ttl_seconds,
+)
+_response_flight = SingleFlight()
+
+
+def response_cache_key(namespace: str, payload: BaseModel) -> str:
+    """Hash a namespace and request model into a cache key."""
+    canonical = payload.model_dump_json(exclude_none=True)
+    return hashlib.sha256(f"{namespace}\x1f{canonical}".encode()).hexdigest()
+
+
+async def cached_response(
+    namespace: str,
+    payload: BaseModel,
+    factory: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Return the cached result for `payload`, or await `factory()` and cache it.
+
+    Concurrent misses for the same key share one call. Results are shared
+    between requests, so callers must treat them as read-only. Failures are
+    not cached.
+    """
+    key = response_cache_key(namespace, payload)
+    result = _response_cache.get(key)
+    if result is not None:
+        return result
+
+    async def produce() -> Any:
+        value = await factory()
+        _response_cache.set(key, value)
+        return value
+
+    return await _response_flight.run(key, produce)
+
+
+def get_cached_response(namespace: str, payload: BaseModel) -> Any:
+    """Return the cached result for `payload`, or None."""
+    return _response_cache.get(response_cache_key(namespace, payload))
+
+
+def store_response(namespace: str, payload: BaseModel, value: Any) -> None:
+    """Cache a result produced outside cached_response (e.g. by a stream)."""
+    _response_cache.set(response_cache_key(namespace, payload), value)
+
+
+def clear_response_cache() -> None:
+    """Drop all cached responses (useful for testing)."""
+    _response_cache.clear()
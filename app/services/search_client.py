@@ -51,14 +51,20 @@ class SearchClient(Protocol):
         ...
 
 
+_search_client_instance: LinkedInSerpAPIClient | LinkedInMockClient | None = None
+
+
 def get_search_client() -> LinkedInSerpAPIClient | LinkedInMockClient:
     """
-    Get the LinkedIn search client.
+    Get the shared LinkedIn search client.
     
     Returns LinkedInSerpAPIClient if SEARCH_API_KEY is set,
     otherwise returns LinkedInMockClient for testing.
     """
-    return get_linkedin_client()
+    global _search_client_instance
+    if _search_client_instance is None:
+        _search_client_instance = get_linkedin_client()
+    return _search_client_instance
 
 
 def get_egyptian_companies() -> list[str]:
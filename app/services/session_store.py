@@ -1,12 +1,22 @@
 """Session store for managing interview sessions."""
 from __future__ import annotations
 
-from typing import Dict, Optional
+import time
+from itertools import islice
+from typing import Optional
 from uuid import UUID
 
 from app.models.interview_schemas import InterviewConfig, FinalReport
+from app.services.cache import TTLCache
 from app.services.orchestrator import InterviewOrchestrator
 
+# Sessions untouched for this long are dropped so abandoned interviews don't leak
+SESSION_TTL_SECONDS = 2 * 3600
+# Expired sessions are swept at most this often
+SESSION_SWEEP_INTERVAL_SECONDS = 60
+REPORT_TTL_SECONDS = 24 * 3600
+MAX_STORED_REPORTS = 10_000
+
 
 class InterviewSessionStore:
     """In-memory store for active interview sessions."""
@@ -18,7 +28,11 @@ class InterviewSessionStore:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._sessions = {}
-            cls._instance._reports = {}
+            cls._instance._last_seen = {}
+            # user_id -> {session_id: None}; a dict keeps creation order so paging is stable
+            cls._instance._user_sessions = {}
+            cls._instance._reports = TTLCache(maxsize=MAX_STORED_REPORTS, ttl_seconds=REPORT_TTL_SECONDS)
+            cls._instance._last_sweep = time.monotonic()
         return cls._instance
     
     def create_session(
@@ -27,46 +41,97 @@ class InterviewSessionStore:
         config: InterviewConfig,
     ) -> InterviewOrchestrator:
         """Create a new interview session."""
+        self._sweep_expired()
         orchestrator = InterviewOrchestrator(config=config, user_id=user_id)
-        self._sessions[orchestrator.session_id] = orchestrator
+        session_id = orchestrator.session_id
+        self._sessions[session_id] = orchestrator
+        self._last_seen[session_id] = time.monotonic()
+        self._user_sessions.setdefault(user_id, {})[session_id] = None
         return orchestrator
     
     def get_session(self, session_id: UUID) -> Optional[InterviewOrchestrator]:
-        """Get an existing session by ID."""
-        return self._sessions.get(session_id)
+        """Get an existing session by ID, refreshing its expiry."""
+        orchestrator = self._sessions.get(session_id)
+        if orchestrator is None:
+            return None
+        now = time.monotonic()
+        if now - self._last_seen[session_id] > SESSION_TTL_SECONDS:
+            self._drop(session_id)
+            return None
+        self._last_seen[session_id] = now
+        return orchestrator
     
     def remove_session(self, session_id: UUID) -> bool:
         """Remove a session."""
         if session_id in self._sessions:
-            del self._sessions[session_id]
+            self._drop(session_id)
             return True
         return False
     
     def store_report(self, session_id: UUID, report: FinalReport) -> None:
         """Store a final report."""
-        self._reports[session_id] = report
+        self._reports.set(session_id, report)
     
     def get_report(self, session_id: UUID) -> Optional[FinalReport]:
         """Get a stored report."""
         return self._reports.get(session_id)
     
-    def list_sessions(self, user_id: Optional[str] = None) -> list:
-        """List all sessions, optionally filtered by user."""
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> list:
+        """List sessions, optionally filtered by user and paged by limit/offset."""
+        stop = None if limit is None else offset + limit
         sessions = []
-        for session_id, orchestrator in self._sessions.items():
-            if user_id is None or orchestrator.user_id == user_id:
-                sessions.append({
-                    "session_id": session_id,
-                    "user_id": orchestrator.user_id,
-                    "current_state": orchestrator.current_state,
-                    "is_complete": orchestrator.is_complete,
-                })
+        for session_id in islice(self._session_ids(user_id), offset, stop):
+            orchestrator = self._sessions[session_id]
+            sessions.append({
+                "session_id": session_id,
+                "user_id": orchestrator.user_id,
+                "current_state": orchestrator.current_state,
+                "is_complete": orchestrator.is_complete,
+            })
         return sessions
     
+    def count_sessions(self, user_id: Optional[str] = None) -> int:
+        """Count sessions, optionally filtered by user."""
+        return len(self._session_ids(user_id))
+    
     def clear_all(self) -> None:
         """Clear all sessions (useful for testing)."""
         self._sessions.clear()
+        self._last_seen.clear()
+        self._user_sessions.clear()
         self._reports.clear()
+    
+    def _session_ids(self, user_id: Optional[str]):
+        """Live session ids, from the per-user index when filtering by user."""
+        self._sweep_expired()
+        if user_id is None:
+            return self._sessions.keys()
+        return self._user_sessions.get(user_id, ())
+    
+    def _drop(self, session_id: UUID) -> None:
+        """Remove a session from every index."""
+        orchestrator = self._sessions.pop(session_id)
+        self._last_seen.pop(session_id, None)
+        user_sessions = self._user_sessions.get(orchestrator.user_id)
+        if user_sessions is not None:
+            user_sessions.pop(session_id, None)
+            if not user_sessions:
+                del self._user_sessions[orchestrator.user_id]
+    
+    def _sweep_expired(self) -> None:
+        """Drop sessions idle past SESSION_TTL_SECONDS, at most once per sweep interval."""
+        now = time.monotonic()
+        if now - self._last_sweep < SESSION_SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_sweep = now
+        cutoff = now - SESSION_TTL_SECONDS
+        for session_id in [sid for sid, seen in self._last_seen.items() if seen < cutoff]:
+            self._drop(session_id)
 
 
 # Global session store instance
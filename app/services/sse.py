@@ -0,0 +1,11 @@
+"""Server-Sent Events helpers for streaming endpoints."""
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+
+def format_sse(event: str, data: Any) -> bytes:
+    """Encode one SSE message with a JSON payload."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
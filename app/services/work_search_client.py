@@ -10,16 +10,47 @@ from __future__ import annotations
 import logging
 import os
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
 import urllib.parse
 
 import httpx
 
+from app.config import settings
+from app.services.http import HTTP2_AVAILABLE
+
 logger = logging.getLogger(__name__)
 
 
+SEARCH_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32)
+SEARCH_HTTP_TIMEOUT = httpx.Timeout(15.0, connect=2.0)
+
+# Connection pool shared by every job search provider
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=SEARCH_HTTP_LIMITS,
+            timeout=SEARCH_HTTP_TIMEOUT,
+        )
+    return _http_client
+
+
+async def close_search_http_client() -> None:
+    """Close the shared search HTTP client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 # ============================================
 # Configuration
 # ============================================
@@ -121,10 +152,10 @@ class AdzunaClient:
             
             url = f"{self.BASE_URL}/{self.country}/search/1"
             
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            client = _get_http_client()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
             
             jobs = []
             for result in data.get("results", []):
@@ -143,7 +174,7 @@ class AdzunaClient:
             return jobs
             
         except Exception as e:
-            logger.error(f"Adzuna search error: {e}")
+            logger.error("Adzuna search error: %s", e)
             return []
     
     def _format_salary(self, result: dict) -> str:
@@ -209,14 +240,14 @@ class JSearchClient:
                 "X-RapidAPI-Host": self.host
             }
             
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/search",
-                    headers=headers,
-                    params=params
-                )
-                response.raise_for_status()
-                data = response.json()
+            client = _get_http_client()
+            response = await client.get(
+                f"{self.BASE_URL}/search",
+                headers=headers,
+                params=params
+            )
+            response.raise_for_status()
+            data = response.json()
             
             jobs = []
             for result in data.get("data", [])[:10]:
@@ -235,7 +266,7 @@ class JSearchClient:
             return jobs
             
         except Exception as e:
-            logger.error(f"JSearch error: {e}")
+            logger.error("JSearch error: %s", e)
             return []
     
     def _format_salary(self, result: dict) -> str:
@@ -276,10 +307,10 @@ class RemotiveClient:
             if search:
                 params["search"] = search
             
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(self.BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
+            client = _get_http_client()
+            response = await client.get(self.BASE_URL, params=params)
+            response.raise_for_status()
+            data = response.json()
             
             jobs = []
             for result in data.get("jobs", [])[:limit]:
@@ -298,7 +329,7 @@ class RemotiveClient:
             return jobs
             
         except Exception as e:
-            logger.error(f"Remotive search error: {e}")
+            logger.error("Remotive search error: %s", e)
             return []
     
     def _clean_html(self, text: str) -> str:
@@ -319,10 +350,10 @@ class ArbeitnowClient:
     async def search_jobs(self, limit: int = 5) -> List[JobListing]:
         """Get jobs from Arbeitnow."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(self.BASE_URL)
-                response.raise_for_status()
-                data = response.json()
+            client = _get_http_client()
+            response = await client.get(self.BASE_URL)
+            response.raise_for_status()
+            data = response.json()
             
             jobs = []
             for result in data.get("data", [])[:limit]:
@@ -340,7 +371,7 @@ class ArbeitnowClient:
             return jobs
             
         except Exception as e:
-            logger.error(f"Arbeitnow search error: {e}")
+            logger.error("Arbeitnow search error: %s", e)
             return []
 
 
@@ -418,7 +449,7 @@ class FreelancePlatformURLs:
             return None
         
         config = cls.PLATFORMS[platform_key]
-        query = "+".join([urllib.parse.quote(k) for k in keywords])
+        query = "+".join([_quote_keyword(k) for k in keywords])
         
         if config["search_param"]:
             url = f"{config['base_url']}?{config['search_param']}={query}"
@@ -444,6 +475,18 @@ class FreelancePlatformURLs:
         return gigs
 
 
+@lru_cache(maxsize=4096)
+def _quote_keyword(keyword: str) -> str:
+    """URL-encode a search keyword (skills repeat heavily across requests)."""
+    return urllib.parse.quote(keyword)
+
+
+@lru_cache(maxsize=2048)
+def get_platform_gigs(keywords: Tuple[str, ...]) -> Tuple[FreelanceGig, ...]:
+    """Search URLs on every freelance platform for a keyword tuple (shared; read-only)."""
+    return tuple(FreelancePlatformURLs.get_all_search_urls(list(keywords)))
+
+
 # ============================================
 # Direct Job Board URLs
 # ============================================
@@ -621,14 +664,19 @@ class WorkSearchClient:
             ))
             results["providers_used"].append("JSearch")
         
-        # Execute all searches
-        api_results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute all searches; a slow provider is dropped so it can't hold up the whole search
+        api_results = await asyncio.gather(
+            *(asyncio.wait_for(task, settings.job_provider_timeout_seconds) for task in tasks),
+            return_exceptions=True
+        )
         
-        for result in api_results:
+        for provider, result in zip(results["providers_used"], api_results):
             if isinstance(result, list):
                 results["api_jobs"].extend(result)
+            elif isinstance(result, asyncio.TimeoutError):
+                logger.warning("%s search timed out after %ss", provider, settings.job_provider_timeout_seconds)
             elif isinstance(result, Exception):
-                logger.warning(f"Search failed: {result}")
+                logger.warning("%s search failed: %s", provider, result)
         
         # Add direct search URLs for major job boards
         results["search_urls"] = JobBoardURLs.get_all_search_urls(keywords, location)
@@ -661,7 +709,7 @@ class WorkSearchClient:
         
         # Main skill-based search URLs
         for skill in skills[:5]:
-            skill_urls = FreelancePlatformURLs.get_all_search_urls([skill])
+            skill_urls = get_platform_gigs((skill,))
             results["by_skill"][skill] = [
                 {
                     "platform": gig.platform,
@@ -672,7 +720,7 @@ class WorkSearchClient:
             ]
         
         # Combined search URLs
-        combined_gigs = FreelancePlatformURLs.get_all_search_urls(skills[:3])
+        combined_gigs = get_platform_gigs(tuple(skills[:3]))
         results["platforms"] = [
             {
                 "platform": gig.platform,
@@ -686,7 +734,7 @@ class WorkSearchClient:
         # Add gig type specific URLs if provided
         if gig_types:
             for gig_type in gig_types:
-                gig_urls = FreelancePlatformURLs.get_all_search_urls([gig_type])
+                gig_urls = get_platform_gigs((gig_type,))
                 results["by_skill"][gig_type] = [
                     {
                         "platform": gig.platform,
@@ -747,9 +795,15 @@ class WorkSearchClient:
 # Utility Functions
 # ============================================
 
+_work_search_client: Optional[WorkSearchClient] = None
+
+
 def get_work_search_client() -> WorkSearchClient:
-    """Get a configured work search client instance."""
-    return WorkSearchClient()
+    """Get the shared work search client instance."""
+    global _work_search_client
+    if _work_search_client is None:
+        _work_search_client = WorkSearchClient()
+    return _work_search_client
 
 
 async def quick_job_search(
@@ -758,7 +812,7 @@ async def quick_job_search(
     limit: int = 5
 ) -> List[Dict[str, Any]]:
     """Quick job search helper function."""
-    client = WorkSearchClient()
+    client = get_work_search_client()
     results = await client.search_jobs(keywords, location, limit=limit)
     
     return [
@@ -776,5 +830,5 @@ async def quick_job_search(
 
 def get_freelance_urls(skills: List[str]) -> Dict[str, List[Dict]]:
     """Quick helper to get freelance platform URLs."""
-    client = WorkSearchClient()
+    client = get_work_search_client()
     return client.get_freelance_opportunities(skills)
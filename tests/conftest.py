@@ -0,0 +1,6 @@
+"""Shared test setup."""
+import os
+
+# Agents build their LLM clients at import; no request is ever sent in tests
+os.environ.setdefault("LLM_PROVIDER", "openai")
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
@@ -0,0 +1,158 @@
+"""Tests for the in-process cache helpers."""
+import asyncio
+
+import pytest
+
+from app.services import cache
+from app.services.cache import SingleFlight, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache, "time", fake)
+    return fake
+
+
+def test_ttl_cache_returns_values_until_they_expire(clock):
+    ttl_cache = TTLCache(maxsize=4, ttl_seconds=10)
+    ttl_cache.set("key", "value")
+
+    clock.now += 9
+    assert ttl_cache.get("key") == "value"
+
+    clock.now += 2
+    assert ttl_cache.get("key") is None
+    assert ttl_cache.get("key", "default") == "default"
+    assert len(ttl_cache) == 0
+
+
+def test_ttl_cache_per_entry_ttl_overrides_default(clock):
+    ttl_cache = TTLCache(maxsize=4, ttl_seconds=10)
+    ttl_cache.set("short", 1, ttl_seconds=1)
+    ttl_cache.set("long", 2)
+
+    clock.now += 5
+    assert ttl_cache.get("short") is None
+    assert ttl_cache.get("long") == 2
+
+
+def test_ttl_cache_evicts_least_recently_used(clock):
+    ttl_cache = TTLCache(maxsize=2, ttl_seconds=10)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("c") == 3
+    assert len(ttl_cache) == 2
+
+
+def test_ttl_cache_clear(clock):
+    ttl_cache = TTLCache()
+    ttl_cache.set("a", 1)
+    ttl_cache.clear()
+
+    assert ttl_cache.get("a") is None
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def main():
+        flight = SingleFlight()
+        return await asyncio.gather(*(flight.run("key", factory) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["value"] * 5
+    assert calls == 1
+
+
+def test_single_flight_runs_again_once_finished():
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    async def main():
+        flight = SingleFlight()
+        return [await flight.run("key", factory), await flight.run("key", factory)]
+
+    assert asyncio.run(main()) == [1, 2]
+
+
+def test_single_flight_propagates_exceptions_to_every_caller():
+    async def factory():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        flight = SingleFlight()
+        results = await asyncio.gather(
+            flight.run("key", factory),
+            flight.run("key", factory),
+            return_exceptions=True,
+        )
+        return flight, results
+
+    flight, results = asyncio.run(main())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert not flight._inflight
+
+
+def test_single_flight_leader_cancellation_does_not_cancel_followers():
+    async def main():
+        flight = SingleFlight()
+        done = asyncio.Event()
+
+        async def factory():
+            await asyncio.sleep(0.05)
+            done.set()
+            return "value"
+
+        leader = asyncio.create_task(flight.run("key", factory))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.run("key", factory))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower, done.is_set()
+
+    assert asyncio.run(main()) == ("value", True)
+
+
+def test_single_flight_finishes_work_when_every_caller_is_cancelled():
+    async def main():
+        flight = SingleFlight()
+        finished = asyncio.Event()
+
+        async def factory():
+            await asyncio.sleep(0.01)
+            finished.set()
+
+        caller = asyncio.create_task(flight.run("key", factory))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.wait_for(finished.wait(), timeout=1)
+        await asyncio.sleep(0)
+        return flight
+
+    assert not asyncio.run(main())._inflight
@@ -0,0 +1,130 @@
+"""Tests for translation caching and provider retries in the career API."""
+import asyncio
+import json
+
+import httpx
+import openai
+import pytest
+
+from app.agents.career_translator import CareerTranslatorAgent
+from app.api import career
+from app.models.career_schemas import LectureInput, TranslateLectureRequest
+from app.services.response_cache import clear_response_cache, get_cached_response
+
+REQUEST = TranslateLectureRequest(lecture_topic="Graph algorithms")
+LECTURE_INPUT = LectureInput(lecture_topic="Graph algorithms")
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_response_cache()
+    yield
+    clear_response_cache()
+
+
+def _translator(monkeypatch, response: str) -> CareerTranslatorAgent:
+    translator = CareerTranslatorAgent()
+
+    async def invoke(**kwargs):
+        return response
+
+    async def stream(**kwargs):
+        yield response
+
+    monkeypatch.setattr(translator, "invoke", invoke)
+    monkeypatch.setattr(translator, "stream", stream)
+    monkeypatch.setattr(translator, "invoke_sync", lambda **kwargs: response)
+    monkeypatch.setattr(career, "get_career_translator", lambda: translator)
+    return translator
+
+
+def _valid_response(translator: CareerTranslatorAgent) -> str:
+    payload = translator.get_default_response()
+    payload["lecture_topic"] = "Graph algorithms"
+    return json.dumps(payload)
+
+
+async def _drain(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+def test_unparseable_translation_is_not_cached(monkeypatch):
+    translator = _translator(monkeypatch, "not json")
+
+    result = asyncio.run(career.translate_lecture(REQUEST))
+
+    assert result.data == translator.default_translation("Graph algorithms")
+    assert get_cached_response("career.translate", LECTURE_INPUT) is None
+
+
+def test_parsed_translation_is_cached(monkeypatch):
+    _translator(monkeypatch, _valid_response(CareerTranslatorAgent()))
+
+    result = asyncio.run(career.translate_lecture_raw(REQUEST))
+
+    assert get_cached_response("career.translate", LECTURE_INPUT) == result
+
+
+def test_unparseable_stream_sends_placeholder_without_caching(monkeypatch):
+    _translator(monkeypatch, "not json")
+
+    body = asyncio.run(_drain(asyncio.run(career.translate_lecture_stream(REQUEST))))
+
+    assert b"event: result" in body
+    assert get_cached_response("career.translate", LECTURE_INPUT) is None
+
+
+def test_sync_translation_falls_back_to_placeholder(monkeypatch):
+    translator = _translator(monkeypatch, "not json")
+
+    result = career.translate_lecture_sync(REQUEST)
+
+    assert result.data == translator.default_translation("Graph algorithms")
+
+
+def _rate_limit_error() -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, request=request)
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+
+def test_backoff_retries_provider_rate_limit(monkeypatch):
+    monkeypatch.setattr(career, "RETRY_BASE_DELAY_SECONDS", 0)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if len(calls) == 1:
+            raise _rate_limit_error()
+        return "ok"
+
+    assert asyncio.run(career._with_backoff(call)) == "ok"
+    assert len(calls) == 2
+
+
+def test_backoff_detects_wrapped_rate_limit(monkeypatch):
+    monkeypatch.setattr(career, "RETRY_BASE_DELAY_SECONDS", 0)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        try:
+            raise _rate_limit_error()
+        except openai.RateLimitError as e:
+            raise RuntimeError("LLM call failed") from e
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(career._with_backoff(call))
+    assert len(calls) == career.MAX_RETRY_ATTEMPTS
+
+
+def test_backoff_does_not_retry_other_errors():
+    calls = []
+
+    async def call():
+        calls.append(1)
+        raise ValueError("bad output")
+
+    with pytest.raises(ValueError):
+        asyncio.run(career._with_backoff(call))
+    assert len(calls) == 1
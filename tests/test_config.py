@@ -0,0 +1,39 @@
+"""Tests for environment-driven settings."""
+from app.config import _load_settings
+
+
+def test_tuning_knobs_have_defaults(monkeypatch):
+    for name in (
+        "WORK_AGENT_CACHE_SIZE",
+        "WORK_AGENT_CACHE_TTL",
+        "RESPONSE_CACHE_SIZE",
+        "RESPONSE_CACHE_TTL",
+        "LLM_MAX_CONCURRENCY",
+        "JOB_PROVIDER_TIMEOUT",
+        "MAX_SEARCH_QUERIES",
+    ):
+        monkeypatch.delenv(name, raising=False)
+
+    settings = _load_settings()
+
+    assert settings.work_agent_cache_size == 512
+    assert settings.work_agent_cache_ttl_seconds == 3600
+    assert settings.response_cache_size == 1024
+    assert settings.response_cache_ttl_seconds == 24 * 3600
+    assert settings.llm_max_concurrency == 32
+    assert settings.job_provider_timeout_seconds == 3.0
+    assert settings.max_search_queries == 1
+
+
+def test_tuning_knobs_read_from_environment(monkeypatch):
+    monkeypatch.setenv("WORK_AGENT_CACHE_TTL", "60")
+    monkeypatch.setenv("RESPONSE_CACHE_SIZE", "8")
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "4")
+    monkeypatch.setenv("JOB_PROVIDER_TIMEOUT", "1.5")
+
+    settings = _load_settings()
+
+    assert settings.work_agent_cache_ttl_seconds == 60
+    assert settings.response_cache_size == 8
+    assert settings.llm_max_concurrency == 4
+    assert settings.job_provider_timeout_seconds == 1.5
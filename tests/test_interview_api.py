@@ -0,0 +1,74 @@
+"""Tests for the interview API's background report generation."""
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import interview
+from app.services.session_store import session_store
+
+REPORT = object()
+
+
+class FakeOrchestrator:
+    is_complete = True
+    user_id = "user"
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+
+    async def generate_final_report(self):
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return REPORT
+
+
+@pytest.fixture(autouse=True)
+def clean_store():
+    yield
+    session_store.clear_all()
+    interview._report_tasks.clear()
+
+
+def _add_session(orchestrator: FakeOrchestrator):
+    session_id = uuid4()
+    session_store._sessions[session_id] = orchestrator
+    session_store._last_seen[session_id] = time.monotonic()
+    return session_id
+
+
+def test_finished_report_task_is_released():
+    session_id = _add_session(FakeOrchestrator())
+
+    async def main():
+        pending = await interview.get_final_report(session_id)
+        await asyncio.sleep(0.01)
+        return pending, await interview.get_final_report(session_id)
+
+    pending, report = asyncio.run(main())
+
+    assert pending.status_code == 202
+    assert report is REPORT
+    assert session_id not in interview._report_tasks
+
+
+def test_failed_report_is_surfaced_once_then_retried():
+    session_id = _add_session(FakeOrchestrator(error=RuntimeError("boom")))
+
+    async def main():
+        await interview.get_final_report(session_id)
+        await asyncio.sleep(0.01)
+        with pytest.raises(HTTPException) as failure:
+            await interview.get_final_report(session_id)
+        retry = await interview.get_final_report(session_id)
+        await asyncio.sleep(0.01)
+        return failure.value, retry
+
+    failure, retry = asyncio.run(main())
+
+    assert failure.status_code == 500
+    assert "boom" in failure.detail
+    assert retry.status_code == 202
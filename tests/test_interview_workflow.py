@@ -0,0 +1,108 @@
+"""Tests for the LangGraph interview workflow."""
+from uuid import uuid4
+
+import pytest
+
+from app.graph import interview_workflow
+from app.graph.interview_workflow import InterviewWorkflow
+from app.models.interview_schemas import (
+    AnswerEvaluation,
+    CommunicationAnalysis,
+    DifficultyAdjustment,
+    InterviewConfig,
+    InterviewMemory,
+    InterviewState,
+    QuestionAnswer,
+)
+
+EVALUATION = AnswerEvaluation(
+    technical_score=4,
+    reasoning_depth=4,
+    communication_clarity=4,
+    structure_score=4,
+    confidence_signals=4,
+)
+CONFIG = InterviewConfig(target_role="Backend Engineer")
+
+
+@pytest.fixture(autouse=True)
+def stub_agents(monkeypatch):
+    monkeypatch.setattr(interview_workflow.analyzer_agent, "evaluate_sync", lambda **kwargs: EVALUATION)
+    monkeypatch.setattr(
+        interview_workflow.coach_agent,
+        "analyze_sync",
+        lambda **kwargs: CommunicationAnalysis(overall_communication_score=3),
+    )
+    monkeypatch.setattr(
+        interview_workflow.difficulty_agent,
+        "adjust_sync",
+        lambda **kwargs: DifficultyAdjustment(new_difficulty=4),
+    )
+    monkeypatch.setattr(
+        interview_workflow.interviewer_agent,
+        "generate_question_sync",
+        lambda **kwargs: "Next question?",
+    )
+
+
+def _previous_answer() -> QuestionAnswer:
+    return QuestionAnswer(
+        question="q0",
+        answer="a0",
+        state=InterviewState.WARMUP,
+        difficulty=3,
+        evaluation=EVALUATION,
+    )
+
+
+def _process(answers, evaluations):
+    return InterviewWorkflow().process_answer(
+        str(uuid4()),
+        "user",
+        CONFIG,
+        InterviewState.WARMUP,
+        3,
+        "q1",
+        "a1",
+        answers,
+        evaluations,
+        InterviewMemory(),
+        len(answers),
+    )
+
+
+def test_answer_and_evaluation_are_appended_to_history():
+    answers = [_previous_answer()]
+    evaluations = [EVALUATION]
+
+    result = _process(answers, evaluations)
+
+    assert [qa.question for qa in result["answers"]] == ["q0", "q1"]
+    assert result["evaluations"] == [EVALUATION, EVALUATION]
+    assert result["questions_asked"] == 2
+
+
+def test_caller_history_is_not_mutated():
+    answers = [_previous_answer()]
+    evaluations = [EVALUATION]
+
+    _process(answers, evaluations)
+
+    assert len(answers) == 1
+    assert len(evaluations) == 1
+
+
+def test_parallel_analysis_updates_are_merged():
+    result = _process([_previous_answer()], [EVALUATION])
+
+    assert result["memory"].asked_questions == ["q1"]
+    assert result["communication_analysis"].overall_communication_score == 3
+    assert result["current_difficulty"] == 4
+    assert result["next_question"] == "Next question?"
+
+
+def test_first_answer_starts_the_history():
+    result = _process([], [])
+
+    assert [qa.question for qa in result["answers"]] == ["q1"]
+    assert "communication_analysis" not in result
@@ -0,0 +1,51 @@
+"""Tests for the SerpAPI-backed LinkedIn search client."""
+import threading
+
+from app.services import linkedin_client
+from app.services.linkedin_client import LinkedInSerpAPIClient
+
+
+class FakeResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"organic_results": []}
+
+
+class FakeSession:
+    """Records how many requests are in flight at once."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, params, timeout):
+        with self._lock:
+            self.active += 1
+            self.calls += 1
+            self.max_active = max(self.max_active, self.active)
+        threading.Event().wait(0.01)
+        with self._lock:
+            self.active -= 1
+        return FakeResponse()
+
+
+def test_concurrent_searches_share_the_rate_limiter(monkeypatch):
+    monkeypatch.setattr(linkedin_client.time, "sleep", lambda seconds: None)
+    client = LinkedInSerpAPIClient("key")
+    client.session = FakeSession()
+
+    threads = [
+        threading.Thread(target=client.search, args=(f"python intern {i}", 5))
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert client.session.max_active == 1
+    assert client.request_count == client.session.calls == 20
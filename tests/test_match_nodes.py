@@ -0,0 +1,125 @@
+"""Tests for the matching workflow's retrieval and scoring nodes."""
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from app.graph import nodes
+from app.models.schemas import OpportunityClean, OpportunityRaw, QuerySpec, SkillBuckets, UserProfile
+
+PROFILE = UserProfile(
+    year_level="junior",
+    track="computer science",
+    location_preference="egypt",
+    skills=SkillBuckets(hard=["python"], tools=["git"], soft=[]),
+    seniority_target="intern",
+)
+
+
+def _opportunity(title: str) -> OpportunityClean:
+    return OpportunityClean(
+        title=title,
+        company="Acme",
+        location="Cairo, Egypt",
+        url=f"https://example.com/{title}",
+        source="test",
+        description="Python internship",
+    )
+
+
+class FakeScoringClient:
+    """Scores "good" opportunities and fails on the rest, like a flaky provider."""
+
+    def score_opportunity_ai(self, profile, opportunity):
+        if opportunity.title == "good":
+            return {"score": 90, "reasons": ["Great fit."]}
+        return None
+
+    async def ascore_opportunity_ai(self, profile, opportunity):
+        return self.score_opportunity_ai(profile, opportunity)
+
+
+class FakeSearchClient:
+    """Returns one distinct posting per query and records what was searched."""
+
+    def __init__(self):
+        self.queries = []
+
+    def search(self, query, limit):
+        self.queries.append(query)
+        return [OpportunityRaw(
+            title=query,
+            company="Acme",
+            location="Cairo, Egypt",
+            url=f"https://example.com/{query}",
+            source="test",
+        )]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    nodes._score_cache.clear()
+    nodes._search_cache.clear()
+
+
+@pytest.fixture
+def search_client(monkeypatch):
+    client = FakeSearchClient()
+    monkeypatch.setattr(nodes, "get_search_client", lambda: client)
+    return client
+
+
+def _query_state(*texts):
+    return {"queries": [QuerySpec(query=text, provider="search", rationale="") for text in texts]}
+
+
+def test_retrieval_searches_only_the_first_query_by_default(monkeypatch, search_client):
+    monkeypatch.setattr(nodes, "settings", replace(nodes.settings, max_search_queries=1))
+    state = _query_state("a", "b", "c")
+
+    assert len(nodes.retrieve_opportunities(state, {})["raw_opportunities"]) == 1
+    nodes._search_cache.clear()
+    asyncio.run(nodes.aretrieve_opportunities(state, {}))
+
+    assert search_client.queries == ["a", "a"]
+
+
+def test_retrieval_budget_counts_distinct_queries(monkeypatch, search_client):
+    monkeypatch.setattr(nodes, "settings", replace(nodes.settings, max_search_queries=2))
+
+    update = nodes.retrieve_opportunities(_query_state("a", "a", "b", "c"), {})
+
+    assert search_client.queries == ["a", "b"]
+    assert [item.title for item in update["raw_opportunities"]] == ["a", "b"]
+
+
+def _scores(update):
+    return [(item.score, item.reasons) for item in update["scored_opportunities"]]
+
+
+def test_unscored_opportunities_get_the_flat_fallback(monkeypatch):
+    monkeypatch.setattr(nodes, "get_shared_llm_client", lambda: FakeScoringClient())
+    state = {"profile": PROFILE, "clean_opportunities": [_opportunity("good"), _opportunity("bad")]}
+    expected = [(90, ["Great fit."]), (50, ["General internship opportunity."])]
+
+    assert _scores(nodes.score_opportunities(state, {})) == expected
+    nodes._score_cache.clear()
+    assert _scores(asyncio.run(nodes.ascore_opportunities(state, {}))) == expected
+
+
+def test_without_a_provider_every_opportunity_gets_the_fallback(monkeypatch):
+    monkeypatch.setattr(nodes, "get_shared_llm_client", lambda: None)
+    state = {"profile": PROFILE, "clean_opportunities": [_opportunity("a"), _opportunity("b")]}
+    expected = [(50, ["General internship opportunity."])] * 2
+
+    assert _scores(nodes.score_opportunities(state, {})) == expected
+    assert _scores(asyncio.run(nodes.ascore_opportunities(state, {}))) == expected
+
+
+def test_failed_ai_scores_are_not_cached(monkeypatch):
+    monkeypatch.setattr(nodes, "get_shared_llm_client", lambda: FakeScoringClient())
+    state = {"profile": PROFILE, "clean_opportunities": [_opportunity("good"), _opportunity("bad")]}
+
+    nodes.score_opportunities(state, {})
+
+    assert len(nodes._score_cache) == 1
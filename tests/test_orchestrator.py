@@ -0,0 +1,73 @@
+"""Tests for the async interview orchestrator pipeline."""
+import asyncio
+
+from app.models.interview_schemas import (
+    AnswerEvaluation,
+    CommunicationAnalysis,
+    DifficultyAdjustment,
+    InterviewConfig,
+)
+from app.services.orchestrator import InterviewOrchestrator
+
+EVALUATION = AnswerEvaluation(
+    technical_score=4,
+    reasoning_depth=4,
+    communication_clarity=4,
+    structure_score=4,
+    confidence_signals=4,
+)
+
+
+def _orchestrator(monkeypatch, in_flight: list[int], peak: list[int]) -> InterviewOrchestrator:
+    orchestrator = InterviewOrchestrator(InterviewConfig(target_role="Backend Engineer"), "user")
+
+    async def tracked(result):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return result
+
+    async def evaluate(**kwargs):
+        return EVALUATION
+
+    async def analyze(**kwargs):
+        return await tracked(CommunicationAnalysis(overall_communication_score=3))
+
+    async def adjust(**kwargs):
+        return await tracked(DifficultyAdjustment(new_difficulty=4))
+
+    async def generate_question(**kwargs):
+        return "Next question?"
+
+    monkeypatch.setattr(orchestrator.analyzer, "evaluate", evaluate)
+    monkeypatch.setattr(orchestrator.coach, "analyze", analyze)
+    monkeypatch.setattr(orchestrator.difficulty_engine, "adjust", adjust)
+    monkeypatch.setattr(orchestrator.interviewer, "generate_question", generate_question)
+    return orchestrator
+
+
+def test_coach_and_difficulty_run_concurrently(monkeypatch):
+    in_flight, peak = [0], [0]
+    orchestrator = _orchestrator(monkeypatch, in_flight, peak)
+
+    async def main():
+        await orchestrator.process_answer("Q1?", "A1")
+        return await orchestrator.process_answer("Q2?", "A2")
+
+    result = asyncio.run(main())
+
+    assert peak[0] == 2
+    assert result["difficulty_adjustment"].new_difficulty == 4
+    assert orchestrator.session.current_difficulty == 4
+
+
+def test_first_answer_skips_communication_analysis(monkeypatch):
+    in_flight, peak = [0], [0]
+    orchestrator = _orchestrator(monkeypatch, in_flight, peak)
+
+    result = asyncio.run(orchestrator.process_answer("Q1?", "A1"))
+
+    assert peak[0] == 1
+    assert result["feedback"] == EVALUATION.feedback
+    assert result["difficulty_adjustment"].new_difficulty == 4
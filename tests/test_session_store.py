@@ -0,0 +1,33 @@
+"""Tests for the in-memory interview session store."""
+import pytest
+
+from app.models.interview_schemas import InterviewConfig
+from app.services.session_store import session_store
+
+CONFIG = InterviewConfig(target_role="Backend Engineer")
+
+
+@pytest.fixture(autouse=True)
+def clean_store():
+    yield
+    session_store.clear_all()
+
+
+def test_user_sessions_page_in_creation_order():
+    created = [session_store.create_session("user", CONFIG).session_id for _ in range(6)]
+    session_store.create_session("other", CONFIG)
+
+    pages = [session_store.list_sessions("user", limit=2, offset=offset) for offset in (0, 2, 4)]
+
+    assert [s["session_id"] for page in pages for s in page] == created
+    assert session_store.count_sessions("user") == 6
+
+
+def test_removed_session_leaves_user_index():
+    first, second = (session_store.create_session("user", CONFIG).session_id for _ in range(2))
+
+    assert session_store.remove_session(first)
+
+    assert [s["session_id"] for s in session_store.list_sessions("user")] == [second]
+    assert session_store.remove_session(second)
+    assert "user" not in session_store._user_sessions
@@ -0,0 +1,148 @@
+"""Tests for the work recommendation agent's caching and streaming."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.agents import work_agent
+from app.agents.work_agent import WorkRecommendationAgent
+from app.models.work_schemas import QuickWorkRequest
+
+
+class FakeLLM:
+    """Streams a fixed completion, one chunk after a short delay."""
+
+    def __init__(self, content: str, delay: float = 0.05) -> None:
+        self.content = content
+        self.delay = delay
+        self.calls = 0
+
+    async def astream(self, messages):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        yield SimpleNamespace(content=self.content)
+
+
+class FakeSearchClient:
+    async def search_jobs(self, keywords, location, job_type, limit):
+        await asyncio.sleep(0.05)
+        return {"api_jobs": [], "search_urls": [], "providers_used": []}
+
+    def get_freelance_opportunities(self, skills, gig_types=None):
+        return {"platforms": [], "by_skill": {}, "tips": []}
+
+
+def _input_data():
+    return WorkRecommendationAgent.from_quick_request(QuickWorkRequest(
+        career_goal="Become a Backend Developer",
+        field_of_interest="Web Development",
+        skills=["Python", "SQL"],
+    ))
+
+
+def _agent(content: str) -> WorkRecommendationAgent:
+    agent = WorkRecommendationAgent.__new__(WorkRecommendationAgent)
+    agent.llm = FakeLLM(content)
+    agent.search_client = FakeSearchClient()
+    return agent
+
+
+def _valid_completion() -> str:
+    agent = _agent("")
+    return agent._fallback_response(_input_data(), "").model_dump_json()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cache in (
+        work_agent._completion_cache,
+        work_agent._recommendation_cache,
+        work_agent._job_search_cache,
+    ):
+        cache.clear()
+
+
+def test_closing_stream_does_not_fail_concurrent_recommendations():
+    async def main():
+        agent = _agent(_valid_completion())
+        stream = agent.stream_full_recommendations(_input_data())
+        section, _ = await stream.__anext__()
+        other = asyncio.create_task(agent.get_recommendations(_input_data()))
+        await asyncio.sleep(0.01)
+        await stream.aclose()
+        return section, await other, agent.llm.calls
+
+    section, result, calls = asyncio.run(main())
+    assert section == "freelance_platforms"
+    assert result.job_recommendations
+    assert calls == 1
+
+
+def test_cancelling_first_caller_does_not_cancel_shared_generation():
+    async def main():
+        agent = _agent(_valid_completion())
+        first = asyncio.create_task(agent.get_recommendations(_input_data()))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(agent.get_recommendations(_input_data()))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second, agent.llm.calls
+
+    result, calls = asyncio.run(main())
+    assert result.job_recommendations
+    assert calls == 1
+    assert len(work_agent._recommendation_cache) == 1
+
+
+@pytest.mark.parametrize("content", ["not json at all", "[1, 2]", '{"job_recommendations": [1]}'])
+def test_parse_response_rejects_unusable_output(content):
+    with pytest.raises(ValueError):
+        _agent(content)._parse_response(content)
+
+
+def test_fallback_response_is_not_cached():
+    agent = _agent("Sorry, I can't help with that.")
+    result = asyncio.run(agent.get_recommendations(_input_data()))
+
+    fallback = agent._fallback_response(_input_data(), "")
+    assert result.model_dump(exclude={"generated_at"}) == fallback.model_dump(exclude={"generated_at"})
+    assert len(work_agent._recommendation_cache) == 0
+
+
+def test_rejected_completion_is_not_cached():
+    agent = _agent("Sorry, I can't help with that.")
+    asyncio.run(agent.get_recommendations(_input_data()))
+    asyncio.run(agent.get_recommendations(_input_data()))
+
+    assert agent.llm.calls == 2
+    assert len(work_agent._completion_cache) == 0
+
+
+def test_valid_completion_is_cached():
+    agent = _agent(_valid_completion())
+    asyncio.run(agent.get_recommendations(_input_data()))
+    work_agent._recommendation_cache.clear()
+    asyncio.run(agent.get_recommendations(_input_data()))
+
+    assert agent.llm.calls == 1
+    assert len(work_agent._completion_cache) == 1
+
+
+def test_sync_recommendations_are_deprecated_but_still_work():
+    agent = _agent(_valid_completion())
+
+    with pytest.deprecated_call():
+        result = agent.get_recommendations_sync(_input_data())
+
+    assert result.job_recommendations
+    assert agent.llm.calls == 1
+
+
+def test_sync_recommendations_refuse_a_running_loop():
+    async def main():
+        with pytest.deprecated_call(), pytest.raises(RuntimeError):
+            _agent(_valid_completion()).get_recommendations_sync(_input_data())
+
+    asyncio.run(main())